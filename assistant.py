@@ -0,0 +1,123 @@
+"""AI Philosophy Assistant: prompt configuration and Anthropic calls.
+
+The ``anthropic`` package is optional for the rest of the app, so this
+module never imports it; callers pass in a ready client.
+"""
+
+from typing import Iterator, List, Optional
+
+MODEL = "claude-3-haiku-20240307"
+MAX_TOKENS = 1000
+TEMPERATURE = 0.7
+
+# Connection-pool defaults for the shared client
+MAX_CONNECTIONS = 50
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+REQUEST_TIMEOUT = 60.0
+
+# Create context-aware prompt
+SYSTEM_PROMPT = """You are a philosophical assistant specializing in metaphysics and logic. You're helping students in a course that explores how logic symbols encode geometric intuitions about reality's structure. The course framework includes:
+
+1. Logic symbols as geometric forms (∧ = convergence, ∨ = divergence, ¬ = boundary creation)
+2. The epsilon (ε) principle: linearity is infinitely small and dissolves into wave patterns
+3. String theory connections to sinusoidal foundations of reality
+4. Dimensional transcendence from linear to spherical totality
+5. The convertibility of being and truth
+
+Provide thoughtful, academically rigorous responses that connect to these themes while acknowledging when ideas are interpretive frameworks versus established scholarship. Be clear about distinguishing between metaphorical/pedagogical frameworks and empirical claims."""
+
+
+# Canned prompts behind the suggested-question buttons, grouped by column
+SUGGESTED_QUESTION_GROUPS = {
+    "Logic & Symbols": {
+        "Why do logic symbols have geometric shapes?": "Why do logic symbols have geometric shapes? How does their visual form relate to their meaning?",
+        "What is the epsilon (ε) principle?": "Explain the epsilon principle and how it reveals that linearity is infinitely small.",
+        "How does ∧ embody convergence?": "How does the conjunction symbol ∧ geometrically represent convergence and unity in metaphysics?",
+    },
+    "Metaphysical Foundations": {
+        "What is the relationship between being and truth?": "What does it mean that being and truth are convertible? How do thinking and reality share the same structure?",
+        "Why is reality wave-like rather than linear?": "How does string theory confirm that reality is fundamentally wave-like and relational rather than linear and mechanical?",
+        "What is spherical totality?": "Explain the concept of spherical totality where each point contains the pattern of the whole.",
+    },
+}
+SUGGESTED_QUESTIONS = {label: prompt for group in SUGGESTED_QUESTION_GROUPS.values()
+                       for label, prompt in group.items()}
+_SUGGESTED_NORMALIZED = {" ".join(q.lower().split()) for q in SUGGESTED_QUESTIONS.values()}
+
+
+def system_blocks(summary: str = ""):
+    """The static system prompt, marked so the API can reuse its cached prefix.
+
+    Prompts shorter than the model's minimum cacheable length are simply
+    processed normally, so the marker is always safe to send. A conversation
+    summary goes in a separate block after the marker so it never
+    invalidates the cached prefix.
+    """
+    blocks = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+    if summary:
+        blocks.append({"type": "text", "text": f"Summary of the earlier conversation with this student:\n{summary}"})
+    return blocks
+
+
+def create_client(api_key: str, base_url: Optional[str] = None,
+                  max_connections: int = MAX_CONNECTIONS,
+                  max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+                  keepalive_expiry: float = KEEPALIVE_EXPIRY,
+                  timeout: float = REQUEST_TIMEOUT, max_retries: int = 0):
+    """Build a client with a bounded keep-alive connection pool.
+
+    Meant to be created once per API key and shared; ``base_url`` points it
+    at a local stub server (see stub_anthropic.py) in tests. SDK retries are
+    off by default because the scheduler retries with jittered backoff.
+    """
+    import anthropic
+
+    # Use the SDK's own Limits type so this works with whichever httpx it ships
+    limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return anthropic.Anthropic(
+        api_key=api_key,
+        base_url=base_url or None,
+        timeout=timeout,
+        max_retries=max_retries,
+        http_client=anthropic.DefaultHttpxClient(limits=limits, timeout=timeout),
+    )
+
+
+def is_suggested(question: str) -> bool:
+    """Whether a question is one of the canned prompts eligible for the response cache"""
+    return " ".join(question.lower().split()) in _SUGGESTED_NORMALIZED
+
+
+def _request(question: str, messages: Optional[List[dict]], summary: str) -> dict:
+    return dict(
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        temperature=TEMPERATURE,
+        system=system_blocks(summary),
+        messages=messages or [{
+            "role": "user",
+            "content": question
+        }]
+    )
+
+
+def ask(client, question: str, messages: Optional[List[dict]] = None, summary: str = "") -> str:
+    """Get the complete answer in a single blocking request.
+
+    ``messages`` (ending with ``question``) and ``summary`` carry earlier
+    turns; see conversation.ConversationContext.
+    """
+    message = client.messages.create(**_request(question, messages, summary))
+    return message.content[0].text
+
+
+def stream_answer(client, question: str, messages: Optional[List[dict]] = None,
+                  summary: str = "") -> Iterator[str]:
+    """Yield the answer text chunk by chunk as the model produces it"""
+    with client.messages.stream(**_request(question, messages, summary)) as stream:
+        yield from stream.text_stream
@@ -0,0 +1,443 @@
+"""Reduced ordered binary decision diagrams for equivalence and minimization.
+
+A BDD is a canonical form for a Boolean function under a fixed variable
+order: two formulas are equivalent exactly when they build the same node.
+Nodes are hash-consed through a unique table, and the results of every
+apply operation are memoized, so building a formula costs time roughly
+proportional to the size of its diagram rather than to 2^n truth-table
+rows. Variables are ordered by first appearance, which keeps related
+variables next to each other and the diagrams small for typical formulas.
+
+Minimal forms: functions of up to QM_VARIABLES variables get a minimum
+DNF/CNF by Quine–McCluskey with a branch-and-bound prime-implicant cover,
+reported as exact only when the search finished within its budget.
+Larger ones get an irredundant sum of products computed directly on the
+BDD (Minato–Morreale), a heuristic that avoids enumerating minterms. CNF
+forms come from minimizing the negation and applying De Morgan.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import logic
+
+FALSE, TRUE = 0, 1
+QM_VARIABLES = 8
+# Branch-and-bound nodes the exact cover search may visit before settling for its best so far
+COVER_SEARCH_STEPS = 1_000
+MAX_NODES = 1_000_000
+# Forms with more terms than this aren't worth displaying (x1∧y1 ∨ ... ∨ x40∧y40 has 2^40 clauses)
+MAX_TERMS = 256
+
+Cube = Tuple[Tuple[int, bool], ...]  # (variable index, value) pairs, in variable order
+
+
+class DiagramTooLarge(ValueError):
+    pass
+
+
+class _TooManyTerms(Exception):
+    pass
+
+
+class BDD:
+    """A manager owning the unique table, apply cache and variable order"""
+
+    def __init__(self, variables: Sequence[str] = ()):
+        self.variables: List[str] = []
+        self._index: Dict[str, int] = {}
+        # Terminals sit below every variable
+        self._level = [1 << 30, 1 << 30]
+        self._low = [FALSE, TRUE]
+        self._high = [FALSE, TRUE]
+        self._unique: Dict[Tuple[int, int, int], int] = {}
+        self._apply_cache: Dict[Tuple[str, int, int], int] = {}
+        self._not_cache: Dict[int, int] = {}
+        for name in variables:
+            self.var(name)
+
+    def __len__(self) -> int:
+        return len(self._level)
+
+    def _mk(self, level: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            if len(self._level) >= MAX_NODES:
+                raise DiagramTooLarge(f"The decision diagram grew past {MAX_NODES:,} nodes")
+            node = self._unique[key] = len(self._level)
+            self._level.append(level)
+            self._low.append(low)
+            self._high.append(high)
+        return node
+
+    def var(self, name: str) -> int:
+        if name not in self._index:
+            self._index[name] = len(self.variables)
+            self.variables.append(name)
+        return self._mk(self._index[name], FALSE, TRUE)
+
+    def negate(self, u: int) -> int:
+        if u <= TRUE:
+            return 1 - u
+        result = self._not_cache.get(u)
+        if result is None:
+            result = self._mk(self._level[u], self.negate(self._low[u]), self.negate(self._high[u]))
+            self._not_cache[u] = result
+            self._not_cache[result] = u
+        return result
+
+    def apply(self, op: str, a: int, b: int) -> int:
+        """``op`` is "and", "or" or "xor"; the other connectives reduce to these"""
+        if op == "and":
+            if a == FALSE or b == FALSE:
+                return FALSE
+            if a == TRUE or a == b:
+                return b
+            if b == TRUE:
+                return a
+        elif op == "or":
+            if a == TRUE or b == TRUE:
+                return TRUE
+            if a == FALSE or a == b:
+                return b
+            if b == FALSE:
+                return a
+        else:
+            if a == b:
+                return FALSE
+            if a == FALSE:
+                return b
+            if b == FALSE:
+                return a
+            if a == TRUE:
+                return self.negate(b)
+            if b == TRUE:
+                return self.negate(a)
+        if a > b:  # every op here is commutative
+            a, b = b, a
+        key = (op, a, b)
+        result = self._apply_cache.get(key)
+        if result is None:
+            level = min(self._level[a], self._level[b])
+            a0, a1 = (self._low[a], self._high[a]) if self._level[a] == level else (a, a)
+            b0, b1 = (self._low[b], self._high[b]) if self._level[b] == level else (b, b)
+            result = self._mk(level, self.apply(op, a0, b0), self.apply(op, a1, b1))
+            self._apply_cache[key] = result
+        return result
+
+    def build(self, node: logic.Node) -> int:
+        """The diagram of a parsed formula"""
+        built: Dict[int, int] = {}  # id(node) -> diagram; equal subformulas meet in the unique table
+        for current in logic.postorder(node):
+            op = current.op
+            if op == "var":
+                u = self.var(current.name)
+            elif op in ("true", "false"):
+                u = TRUE if op == "true" else FALSE
+            elif op == "not":
+                u = self.negate(built[id(current.args[0])])
+            else:
+                a, b = (built[id(child)] for child in current.args)
+                if op == "implies":
+                    u = self.apply("or", self.negate(a), b)
+                elif op == "iff":
+                    u = self.negate(self.apply("xor", a, b))
+                else:
+                    u = self.apply(op, a, b)
+            built[id(current)] = u
+        return built[id(node)]
+
+    def size(self, u: int) -> int:
+        """Nodes reachable from ``u``, terminals included"""
+        seen = set()
+        stack = [u]
+        while stack:
+            v = stack.pop()
+            if v not in seen:
+                seen.add(v)
+                if v > TRUE:
+                    stack.extend((self._low[v], self._high[v]))
+        return len(seen)
+
+    def support(self, u: int) -> List[int]:
+        """Indices of the variables ``u`` actually depends on, in order"""
+        seen, levels = set(), set()
+        stack = [u]
+        while stack:
+            v = stack.pop()
+            if v > TRUE and v not in seen:
+                seen.add(v)
+                levels.add(self._level[v])
+                stack.extend((self._low[v], self._high[v]))
+        return sorted(levels)
+
+    def any_sat(self, u: int) -> Optional[Dict[str, bool]]:
+        """One satisfying assignment of the variables on its path, or None"""
+        if u == FALSE:
+            return None
+        assignment = {}
+        while u > TRUE:
+            name = self.variables[self._level[u]]
+            if self._high[u] != FALSE:
+                assignment[name], u = True, self._high[u]
+            else:
+                assignment[name], u = False, self._low[u]
+        return assignment
+
+    def minterms(self, u: int, levels: Sequence[int]) -> List[int]:
+        """Satisfying assignments over ``levels`` as integers (first level is the high bit)"""
+        position = {level: i for i, level in enumerate(levels)}
+        width = len(levels)
+        found = []
+
+        def walk(v: int, i: int, prefix: int) -> None:
+            if v == FALSE:
+                return
+            # Skipped variables are free: take both values
+            depth = position[self._level[v]] if v > TRUE else width
+            for free in range(1 << (depth - i)):
+                value = (prefix << (depth - i)) | free
+                if v == TRUE:
+                    found.append(value)
+                else:
+                    walk(self._low[v], depth + 1, value << 1)
+                    walk(self._high[v], depth + 1, (value << 1) | 1)
+
+        walk(u, 0, 0)
+        return sorted(found)
+
+    def isop(self, lower: int, upper: int) -> Tuple[List[Cube], int]:
+        """Irredundant sum of products between ``lower`` and ``upper`` (Minato–Morreale)"""
+        cache: Dict[Tuple[int, int], Tuple[List[Cube], int]] = {}
+
+        def go(lo: int, up: int) -> Tuple[List[Cube], int]:
+            if lo == FALSE:
+                return [], FALSE
+            if up == TRUE:
+                return [()], TRUE
+            key = (lo, up)
+            if key in cache:
+                return cache[key]
+            level = min(self._level[lo], self._level[up])
+            l0, l1 = (self._low[lo], self._high[lo]) if self._level[lo] == level else (lo, lo)
+            u0, u1 = (self._low[up], self._high[up]) if self._level[up] == level else (up, up)
+            cubes0, f0 = go(self.apply("and", l0, self.negate(u1)), u0)
+            cubes1, f1 = go(self.apply("and", l1, self.negate(u0)), u1)
+            rest = self.apply("or", self.apply("and", l0, self.negate(f0)), self.apply("and", l1, self.negate(f1)))
+            cubes_shared, shared = go(rest, self.apply("and", u0, u1))
+            cover = self._mk(level, self.apply("or", f0, shared), self.apply("or", f1, shared))
+            cubes = ([((level, False),) + c for c in cubes0] + [((level, True),) + c for c in cubes1]
+                     + cubes_shared)
+            if len(cubes) > MAX_TERMS:
+                raise _TooManyTerms
+            cache[key] = cubes, cover
+            return cache[key]
+
+        return go(lower, upper)
+
+
+def _primes(minterms: List[int], width: int) -> List[Tuple[int, int]]:
+    """Prime implicants as (value, don't-care mask) pairs, by Quine–McCluskey merging"""
+    current = {(m, 0) for m in minterms}
+    primes = set()
+    while current:
+        merged = set()
+        used = set()
+        groups: Dict[int, List[Tuple[int, int]]] = {}
+        for cube in current:
+            groups.setdefault(cube[1], []).append(cube)
+        for mask, cubes in groups.items():
+            present = set(cubes)
+            for value, _ in cubes:
+                for bit in range(width):
+                    flag = 1 << bit
+                    if mask & flag or value & flag:
+                        continue
+                    partner = (value | flag, mask)
+                    if partner in present:
+                        merged.add((value, mask | flag))
+                        used.add((value, mask))
+                        used.add(partner)
+        primes |= current - used
+        current = merged
+    return sorted(primes)
+
+
+def _cover(primes: List[Tuple[int, int]], minterms: List[int],
+           width: int) -> Tuple[List[Tuple[int, int]], bool]:
+    """Fewest primes (then fewest literals) covering every minterm, and whether that is proven.
+
+    Essential primes are taken first; the rest is branch and bound, seeded
+    with a greedy cover, that branches on the minterm with the fewest
+    covering primes. Past COVER_SEARCH_STEPS nodes it stops and returns the
+    best cover found so far, unproven.
+    """
+    covers = {p: {m for m in minterms if m & ~p[1] == p[0]} for p in primes}
+    literals = {p: width - bin(p[1]).count("1") for p in primes}
+    chosen = []
+    left = set(minterms)
+    for m in minterms:
+        owners = [p for p in primes if m in covers[p]]
+        if len(owners) == 1 and owners[0] not in chosen:
+            chosen.append(owners[0])
+    for p in chosen:
+        left -= covers[p]
+    if not left:
+        return chosen, True
+    candidates = [p for p in primes if p not in chosen and covers[p] & left]
+    # What's left to cover as a bitmask, one bit per minterm
+    bit = {m: 1 << i for i, m in enumerate(sorted(left))}
+    masks = {p: sum(bit[m] for m in covers[p] if m in bit) for p in candidates}
+    owners = {bit[m]: [p for p in candidates if masks[p] & bit[m]] for m in left}
+    # Which candidates cover each minterm, as a bitmask over candidates, hardest minterms first
+    index = {p: 1 << i for i, p in enumerate(candidates)}
+    owner_masks = sorted(((b, sum(index[p] for p in ps)) for b, ps in owners.items()),
+                         key=lambda item: item[1].bit_count())
+
+    greedy, remaining = [], sum(bit.values())
+    while remaining:
+        best = max(candidates, key=lambda p: ((masks[p] & remaining).bit_count(), -literals[p]))
+        greedy.append(best)
+        remaining &= ~masks[best]
+    best_cost = (len(greedy), sum(literals[p] for p in greedy))
+    best_picks = greedy
+    steps = 0
+
+    def search(uncovered: int, picks: List[Tuple[int, int]], cost: int) -> bool:
+        """False once the step budget runs out"""
+        nonlocal best_cost, best_picks, steps
+        steps += 1
+        if steps > COVER_SEARCH_STEPS:
+            return False
+        if not uncovered:
+            if (len(picks), cost) < best_cost:
+                best_cost, best_picks = (len(picks), cost), list(picks)
+            return True
+        # Minterms with no covering prime in common each need a prime of their own
+        needed, blocked = 0, 0
+        for b, owner_mask in owner_masks:
+            if b & uncovered and not owner_mask & blocked:
+                needed += 1
+                blocked |= owner_mask
+        if len(picks) + needed > best_cost[0]:
+            return True
+        pivot = min((b for b in owners if b & uncovered), key=lambda b: len(owners[b]))
+        for p in sorted(owners[pivot], key=lambda p: (-(masks[p] & uncovered).bit_count(), literals[p])):
+            picks.append(p)
+            finished = search(uncovered & ~masks[p], picks, cost + literals[p])
+            picks.pop()
+            if not finished:
+                return False
+        return True
+
+    exact = search(sum(bit.values()), [], 0)
+    return chosen + best_picks, exact
+
+
+def _dnf(manager: BDD, u: int) -> Tuple[Optional[List[Cube]], bool]:
+    """Cubes of a small DNF for ``u`` (None past MAX_TERMS), and whether it is provably minimum"""
+    levels = manager.support(u)
+    if len(levels) <= QM_VARIABLES:
+        width = len(levels)
+        minterms = manager.minterms(u, levels)
+        cubes = []
+        cover, exact = _cover(_primes(minterms, width), minterms, width)
+        for value, mask in cover:
+            cubes.append(tuple((levels[i], bool(value >> (width - 1 - i) & 1))
+                               for i in range(width) if not mask >> (width - 1 - i) & 1))
+        return sorted(cubes), exact
+    try:
+        cubes, _ = manager.isop(u, u)
+    except _TooManyTerms:
+        return None, False
+    return sorted(cubes), False
+
+
+def _format(manager: BDD, cubes: Optional[List[Cube]], conjunctive: bool) -> Optional[str]:
+    """DNF text, or the CNF whose clauses negate ``cubes`` when ``conjunctive``"""
+    if cubes is None:
+        return None
+    if not cubes:
+        return "⊤" if conjunctive else "⊥"
+    if cubes == [()]:
+        return "⊥" if conjunctive else "⊤"
+    inner, outer = (" ∨ ", " ∧ ") if conjunctive else (" ∧ ", " ∨ ")
+    parts = []
+    for cube in cubes:
+        literals = [("¬" if value == conjunctive else "") + manager.variables[level] for level, value in cube]
+        text = inner.join(literals)
+        parts.append(f"({text})" if len(literals) > 1 and len(cubes) > 1 else text)
+    return outer.join(parts)
+
+
+class Equivalence(NamedTuple):
+    equivalent: bool
+    # Enough of an assignment to make the formulas differ whatever the other variables
+    # are, and the left formula's value there
+    witness: Optional[Dict[str, bool]]
+    left_value: Optional[bool]
+    nodes: int
+
+
+class MinimalForms(NamedTuple):
+    # None when the form would have more than MAX_TERMS terms
+    dnf: Optional[str]
+    cnf: Optional[str]
+    exact: bool  # proven minimum by Quine–McCluskey, rather than irredundant or best found
+    nodes: int
+
+
+def _order(*trees: logic.Node) -> List[str]:
+    """Variables by first appearance, left to right"""
+    order: Dict[str, None] = {}
+    for tree in trees:
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            if node.op == "var":
+                order.setdefault(node.name)
+            stack.extend(reversed(node.args))
+    return list(order)
+
+
+@lru_cache(maxsize=256)
+def _equivalence(left: str, right: str) -> Equivalence:
+    a, b = logic.parse_tree(left), logic.parse_tree(right)
+    manager = BDD(_order(a, b))
+    f, g = manager.build(a), manager.build(b)
+    if f == g:
+        return Equivalence(True, None, None, manager.size(f))
+    # A path to true in f ∧ ¬g (or ¬f ∧ g) fixes both formulas whatever the other variables are
+    left_only = manager.apply("and", f, manager.negate(g))
+    left_value = left_only != FALSE
+    path = manager.any_sat(left_only if left_value else manager.apply("and", manager.negate(f), g))
+    witness = {name: path[name] for name in sorted(path, key=logic.natural_key)}
+    return Equivalence(False, witness, left_value, manager.size(f) + manager.size(g))
+
+
+def equivalence(left: str, right: str) -> Equivalence:
+    """Decide whether two formulas agree on every assignment.
+
+    Raises logic.LogicSyntaxError for a formula that cannot be parsed and
+    DiagramTooLarge for the rare formula whose diagram explodes.
+    """
+    return _equivalence(logic.to_text(logic.parse_tree(left)), logic.to_text(logic.parse_tree(right)))
+
+
+@lru_cache(maxsize=256)
+def _minimal_forms(text: str) -> MinimalForms:
+    tree = logic.parse_tree(text)
+    manager = BDD(_order(tree))
+    u = manager.build(tree)
+    dnf, exact = _dnf(manager, u)
+    cnf_cubes, cnf_exact = _dnf(manager, manager.negate(u))
+    return MinimalForms(_format(manager, dnf, False), _format(manager, cnf_cubes, True), exact and cnf_exact,
+                        manager.size(u))
+
+
+def minimal_forms(text: str) -> MinimalForms:
+    """Minimal DNF and CNF of a formula (see the module docstring for which method applies)"""
+    return _minimal_forms(logic.to_text(logic.parse_tree(text)))
@@ -0,0 +1,293 @@
+"""Headless benchmarks for page rerun cost and payload size.
+
+Drives app.py with Streamlit's AppTest, with the assistant pointed at the
+local Anthropic stub, and records for every step of each scenario the
+wall-clock rerun time, the peak Python memory allocated by the rerun, the
+number of elements rendered, and the serialized size of those elements and
+of each Plotly figure. Results are written as JSON and checked against
+per-step budgets, so a regression fails the run before it reaches a deploy:
+
+    python benchmark.py                      # run, write results, check budgets
+    python benchmark.py --scenario quiz      # one scenario only
+    python benchmark.py --write-thresholds   # accept the current numbers as the budgets
+
+Timings are the median over ``--repeat`` passes; memory comes from one
+extra pass under tracemalloc so tracing overhead never skews the timings.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(HERE, "app.py")
+THRESHOLDS_PATH = os.path.join(HERE, "benchmark_thresholds.json")
+RESULTS_PATH = "benchmark_results.json"
+
+# Metrics checked against budgets, and the headroom --write-thresholds adds.
+# Wall-clock time varies most between machines, element counts not at all.
+HEADROOM = {"wall_ms": 2.0, "peak_kib": 1.5, "elements": 1.0, "payload_bytes": 1.1, "figure_bytes": 1.1}
+# Small numbers also get a fixed allowance so scheduler and GC jitter is not a regression
+SLACK = {"wall_ms": 50.0, "peak_kib": 512.0}
+
+PERTURBATION_FREQUENCIES = (1, 5, 10)
+PERTURBATION_STRENGTHS = (0.0, 0.25, 0.5)
+EPSILON_SCALES = (0.01, 0.1, 1.0)
+ASSISTANT_QUESTIONS = ("What is being?", "How does ε relate to the sphere?")
+
+
+class BenchmarkError(RuntimeError):
+    pass
+
+
+def _leaves(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        yield node
+        return
+    for child in children.values():
+        yield from _leaves(child)
+
+
+class Session:
+    """One simulated browser session; each ``step`` is one timed rerun"""
+
+    def __init__(self, scenario: str, samples: Dict, traced: bool):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(APP_PATH, default_timeout=120)
+        self.at.secrets["ANTHROPIC_API_KEY"] = "stub"
+        self.scenario = scenario
+        self.samples = samples
+        self.traced = traced
+
+    def step(self, name: str, action: Optional[Callable] = None) -> None:
+        if action is not None:
+            action(self.at)
+        if self.traced:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        self.at.run()
+        wall_ms = (time.perf_counter() - start) * 1000
+        if self.at.exception:
+            raise BenchmarkError(f"{self.scenario}/{name}: {self.at.exception[0].message}")
+        sample = self.samples[f"{self.scenario}/{name}"]
+        if self.traced:
+            # Memory allocated by this rerun on top of what the session already held
+            sample["peak_kib"].append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+            return
+        leaves = list(_leaves(self.at._tree))
+        figures = [len(el.proto.spec.encode("utf-8")) for el in leaves
+                   if getattr(el, "type", None) == "plotly_chart"]
+        sample["wall_ms"].append(wall_ms)
+        sample["elements"].append(len(leaves))
+        sample["payload_bytes"].append(sum(el.proto.ByteSize() for el in leaves if hasattr(el, "proto")))
+        sample["figure_bytes"].append(sum(figures))
+        sample["figures"] = figures
+
+    def open(self, page: str) -> None:
+        self.step(f"open {page}", lambda at: at.sidebar.radio[0].set_value(page))
+
+
+def _set(kind: str, label: str, value):
+    def action(at):
+        widget = next(w for w in getattr(at, kind) if w.label == label)
+        widget.set_value(value)
+    return action
+
+
+def _click(label: str):
+    return lambda at: next(b for b in at.button if b.label == label).click()
+
+
+def pages(s: Session) -> None:
+    """First visit to every page"""
+    s.step("load")
+    for page in s.at.sidebar.radio[0].options:
+        s.open(page)
+
+
+def visualizations(s: Session) -> None:
+    """Each visualization tab at several slider settings"""
+    s.step("load")
+    s.open("Visualizations")
+    for frequency in PERTURBATION_FREQUENCIES:
+        s.step(f"wave frequency {frequency}", _set("slider", "Wave Frequency", frequency))
+    for strength in PERTURBATION_STRENGTHS:
+        s.step(f"perturbation strength {strength}", _set("slider", "Perturbation Strength", strength))
+    for epsilon in EPSILON_SCALES:
+        s.step(f"epsilon scale {epsilon}", _set("slider", "Zoom to Epsilon Scale", epsilon))
+    s.step("explorer perturbed forms", _set("selectbox", "Choose metaphysical perspective:",
+                                            "Wave-Perturbed Forms (Epsilon Reality)"))
+    s.step("scrub perturbation in browser", lambda at: at.toggle(key="animate_perturbation").set_value(True))
+    s.step("scrub epsilon in browser", lambda at: at.toggle(key="animate_epsilon").set_value(True))
+    s.step("low-power mode", lambda at: at.toggle(key="low_power").set_value(True))
+
+
+def quiz(s: Session) -> None:
+    """A full run through the question bank, then a restart"""
+    s.step("load")
+    s.open("Interactive Quiz")
+    question = 0
+    while any(b.label == "Submit Answer" for b in s.at.button):
+        def answer(at, key=f"q{question}", choice=question % 2):
+            at.radio(key=key).set_value(choice)
+            _click("Submit Answer")(at)
+        s.step("submit answer", answer)
+        s.step("next question", _click("Next Question"))
+        question += 1
+    if not question:
+        raise BenchmarkError("quiz: no questions were shown")
+    s.step("restart", _click("🔄 Restart Quiz"))
+
+
+def assistant(s: Session) -> None:
+    """Streaming and blocking round trips through the stub API"""
+    s.step("load")
+    s.open("🤖 AI Philosophy Assistant")
+    for mode, question in zip(("streaming", "blocking"), ASSISTANT_QUESTIONS):
+        if mode == "blocking":
+            s.step("streaming off", _set("toggle", "⚡ Stream", False))
+
+        def ask(at, question=question):
+            at.text_area[0].set_value(question)
+            _click("🔮 Ask Assistant")(at)
+        s.step(f"ask ({mode})", ask)
+    if len(s.at.session_state.chat_history) != len(ASSISTANT_QUESTIONS):
+        raise BenchmarkError("assistant: answers were not added to the chat history")
+
+
+SCENARIOS = {"pages": pages, "visualizations": visualizations, "quiz": quiz, "assistant": assistant}
+
+
+def _fresh_caches() -> None:
+    import streamlit as st
+
+    # Every pass starts from cold figure/response caches and a new progress store
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+
+def run(names: List[str], repeat: int = 3) -> Dict[str, dict]:
+    samples: Dict[str, Dict[str, list]] = defaultdict(lambda: defaultdict(list))
+    for name in names:
+        for _ in range(repeat):
+            _fresh_caches()
+            SCENARIOS[name](Session(name, samples, traced=False))
+        _fresh_caches()
+        tracemalloc.start()
+        try:
+            SCENARIOS[name](Session(name, samples, traced=True))
+        finally:
+            tracemalloc.stop()
+
+    results = {}
+    for step, sample in samples.items():
+        results[step] = {
+            "runs": len(sample["wall_ms"]),
+            "wall_ms": round(statistics.median(sample["wall_ms"]), 2),
+            "wall_ms_max": round(max(sample["wall_ms"]), 2),
+            "peak_kib": round(max(sample["peak_kib"]), 1),
+            "elements": max(sample["elements"]),
+            "payload_bytes": max(sample["payload_bytes"]),
+            "figure_bytes": max(sample["figure_bytes"]),
+            "figures": sample["figures"],
+        }
+    return results
+
+
+def check(results: Dict[str, dict], thresholds: Dict[str, dict]) -> List[str]:
+    """Human-readable regressions: every metric that exceeds its budget"""
+    regressions = []
+    for step, result in results.items():
+        for metric, budget in thresholds.get(step, {}).items():
+            if result[metric] > budget:
+                regressions.append(f"{step}: {metric} {result[metric]} > budget {budget}")
+    return regressions
+
+
+def make_thresholds(results: Dict[str, dict]) -> Dict[str, dict]:
+    thresholds = {}
+    for step, result in sorted(results.items()):
+        # Integer metrics keep integer budgets
+        budget = {metric: round(result[metric] * factor, 1 if isinstance(result[metric], float) else None)
+                  for metric, factor in HEADROOM.items()}
+        for metric, slack in SLACK.items():
+            budget[metric] = max(budget[metric], round(result[metric] + slack, 1))
+        thresholds[step] = budget
+    return thresholds
+
+
+def _load_json(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless rerun-cost benchmarks for app.py")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable; default all)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per scenario")
+    parser.add_argument("--out", default=RESULTS_PATH, help="results file (JSON)")
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH, help="budget file (JSON)")
+    parser.add_argument("--write-thresholds", action="store_true",
+                        help="store the current results, plus headroom, as the new budgets")
+    parser.add_argument("--first-token-latency", type=float, default=0.05,
+                        help="stub API delay before the first token, in seconds")
+    args = parser.parse_args(argv)
+
+    # Keep benchmark state away from the real caches and progress database;
+    # the app reads these settings when its modules are first imported
+    workdir = tempfile.mkdtemp(prefix="phl201-bench-")
+    os.environ["PHL201_DATA_DIR"] = os.path.join(workdir, "data")
+    os.environ["PHL201_CACHE_DIR"] = os.path.join(workdir, "cache")
+    sys.path.insert(0, HERE)
+    import stub_anthropic
+    from streamlit import config
+    from streamlit.logger import set_log_level
+
+    config.set_option("logger.level", "error")
+    set_log_level("error")
+    server = stub_anthropic.serve(config=stub_anthropic.StubConfig(
+        first_token_latency=args.first_token_latency, token_latency=0.0))
+    os.environ["ANTHROPIC_BASE_URL"] = stub_anthropic.base_url(server)
+
+    try:
+        results = run(args.scenario or list(SCENARIOS), repeat=args.repeat)
+    finally:
+        server.shutdown()
+
+    thresholds = _load_json(args.thresholds)
+    if args.write_thresholds:
+        thresholds.update(make_thresholds(results))
+        with open(args.thresholds, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    regressions = check(results, thresholds)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump({"created": time.time(), "python": sys.version.split()[0], "repeat": args.repeat,
+                   "results": results, "regressions": regressions}, f, indent=2, ensure_ascii=False)
+
+    width = max(map(len, results))
+    print(f"{'step':<{width}}  {'wall ms':>8}  {'peak KiB':>9}  {'elements':>8}  {'figure bytes':>12}")
+    for step, r in results.items():
+        print(f"{step:<{width}}  {r['wall_ms']:>8.1f}  {r['peak_kib']:>9.0f}  {r['elements']:>8}  {r['figure_bytes']:>12}")
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"Wrote {args.out}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Per-session assistant chat history with a bounded in-memory window.
+
+The most recent turns stay in session state for rendering. Older turns are
+compressed and spilled to a SQLite archive shared by every session, and
+read back a page at a time only when a student scrolls back. Memory and
+render cost per session therefore stay flat however long a conversation
+runs. Rows are keyed by the per-browser session ID, so nothing can read
+them once the session is gone: a session's turns are deleted when it is
+cleared or its history is garbage-collected with the session, and a
+periodic purge removes anything a crash left behind.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+import zlib
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Tuple
+
+Turn = Tuple[str, str]
+
+DEFAULT_PATH = os.path.join(os.environ.get("PHL201_DATA_DIR", ".data"), "chat_archive.sqlite3")
+WINDOW_TURNS = 10
+PAGE_TURNS = 10
+# Backstop for rows whose session ended without cleanup (a crash, say); live
+# sessions are never purged, however long they run
+RETENTION_SECONDS = 24 * 3600
+PURGE_INTERVAL_SECONDS = 3600
+
+
+def _pack(question: str, answer: str) -> bytes:
+    return zlib.compress(json.dumps([question, answer], ensure_ascii=False).encode("utf-8"), 6)
+
+
+def _unpack(blob: bytes) -> Turn:
+    question, answer = json.loads(zlib.decompress(blob).decode("utf-8"))
+    return question, answer
+
+
+class ChatArchive:
+    """Compressed on-disk store of the turns that fell out of each session's window"""
+
+    def __init__(self, path: str = DEFAULT_PATH, retention_seconds: float = RETENTION_SECONDS):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS chat_turns ("
+            " session_id TEXT NOT NULL, seq INTEGER NOT NULL, turn BLOB NOT NULL, created REAL NOT NULL,"
+            " PRIMARY KEY (session_id, seq))"
+        )
+        self._conn.commit()
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        # Live histories, for memory accounting and purging; entries vanish with their session
+        self._histories: "weakref.WeakSet[ChatHistory]" = weakref.WeakSet()
+        self._next_purge = 0.0
+        self.purge()
+
+    def append(self, session_id: str, seq: int, question: str, answer: str) -> int:
+        """Archive one turn; returns its compressed size in bytes"""
+        blob = _pack(question, answer)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO chat_turns (session_id, seq, turn, created)"
+                               " VALUES (?, ?, ?, ?)", (session_id, seq, blob, now))
+        if now >= self._next_purge:
+            self.purge()
+        return len(blob)
+
+    def purge(self) -> int:
+        """Delete expired turns of sessions that are no longer live; returns how many"""
+        with self._lock:
+            self._next_purge = time.time() + PURGE_INTERVAL_SECONDS
+            live = {h.session_id for h in self._histories}
+            expired = [session_id for session_id, in self._conn.execute(
+                "SELECT DISTINCT session_id FROM chat_turns WHERE created < ?",
+                (time.time() - self.retention_seconds,))]
+            deleted = 0
+            with self._conn:
+                for session_id in expired:
+                    if session_id not in live:
+                        deleted += self._conn.execute(
+                            "DELETE FROM chat_turns WHERE session_id = ?", (session_id,)).rowcount
+        return deleted
+
+    def turns(self, session_id: str, start: int, stop: int) -> List[Turn]:
+        """Archived turns with ``start <= seq < stop``, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT turn FROM chat_turns WHERE session_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (session_id, start, stop)).fetchall()
+        return [_unpack(blob) for blob, in rows]
+
+    def delete(self, session_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM chat_turns WHERE session_id = ?", (session_id,))
+
+    def track(self, history: "ChatHistory") -> None:
+        with self._lock:
+            self._histories.add(history)
+
+    def stats(self) -> Dict[str, int]:
+        """Disk use of the archive and memory held by every live session's window"""
+        with self._lock:
+            turns, disk = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(turn)), 0) FROM chat_turns").fetchone()
+            histories = list(self._histories)
+        memory = [h.memory_bytes() for h in histories]
+        return {"sessions": len(histories), "memory_bytes": sum(memory),
+                "max_session_bytes": max(memory, default=0),
+                "archived_turns": turns, "archived_bytes": disk}
+
+
+class ChatHistory:
+    """A session's recent turns in memory, with older ones in a ChatArchive"""
+
+    def __init__(self, session_id: str, archive: ChatArchive, window: int = WINDOW_TURNS):
+        self.session_id = session_id
+        self.archive = archive
+        self.window = window
+        self.recent: Deque[Turn] = deque()
+        self.archived = 0
+        self.archived_bytes = 0
+        archive.track(self)
+        # The session ID dies with the session, so its archived turns go with it
+        weakref.finalize(self, archive.delete, session_id)
+
+    def __len__(self) -> int:
+        return self.archived + len(self.recent)
+
+    def __iter__(self) -> Iterator[Turn]:
+        """The turns still in memory, oldest first"""
+        return iter(self.recent)
+
+    def append(self, question: str, answer: str) -> None:
+        self.recent.append((question, answer))
+        while len(self.recent) > self.window:
+            question, answer = self.recent[0]
+            try:
+                self.archived_bytes += self.archive.append(self.session_id, self.archived, question, answer)
+            except sqlite3.Error:
+                # Keep the turn in memory and try again with the next one
+                return
+            self.recent.popleft()
+            self.archived += 1
+
+    def page_count(self, page_turns: int = PAGE_TURNS) -> int:
+        return -(-self.archived // page_turns)
+
+    def older(self, page: int, page_turns: int = PAGE_TURNS) -> List[Turn]:
+        """Page ``page`` of archived turns, oldest first; page 0 is just before the window"""
+        stop = self.archived - page * page_turns
+        return self.archive.turns(self.session_id, max(stop - page_turns, 0), stop) if stop > 0 else []
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held in memory by the window"""
+        turns = list(self.recent)  # snapshot; the admin panel reads this from another session
+        return sys.getsizeof(self.recent) + sum(
+            sys.getsizeof(turn) + sys.getsizeof(turn[0]) + sys.getsizeof(turn[1]) for turn in turns)
+
+    def clear(self) -> None:
+        self.recent.clear()
+        self.archive.delete(self.session_id)
+        self.archived = 0
+        self.archived_bytes = 0
@@ -0,0 +1,93 @@
+"""Class-wide quiz analytics maintained incrementally.
+
+Each submitted answer bumps one option counter and, when the score changes,
+moves one student within a sorted leaderboard. The dashboard reads these
+structures directly, so its cost depends on the number of questions and
+the leaderboard size, never on how many answers have been submitted.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+
+
+class QuestionStats:
+    __slots__ = ("text", "options", "answer", "counts")
+
+    def __init__(self, text: str, options: Tuple[str, ...], answer: int):
+        self.text = text
+        self.options = options
+        self.answer = answer
+        self.counts = [0] * len(options)
+
+    @property
+    def attempts(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def correct(self) -> int:
+        return self.counts[self.answer]
+
+    @property
+    def incorrect(self) -> int:
+        return self.attempts - self.correct
+
+    def top_distractor(self) -> Tuple[str, int]:
+        """Most chosen wrong option and how often it was picked"""
+        wrong = [(count, i) for i, count in enumerate(self.counts) if i != self.answer]
+        count, index = max(wrong) if wrong else (0, self.answer)
+        return self.options[index], count
+
+
+class ClassAnalytics:
+    """Thread-safe counters and leaderboard shared by every session"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._questions: Dict[str, QuestionStats] = {}
+        self._best: Dict[str, int] = {}
+        # Sorted ascending by (-xp, student) so the leaders come first
+        self._ranking: List[Tuple[int, str]] = []
+        self.submissions = 0
+
+    def record_answer(self, question, chosen: int, student: str = "", score: int = 0) -> None:
+        """Count one submitted answer and update the student's best XP"""
+        with self._lock:
+            stats = self._questions.get(question.text)
+            if stats is None or stats.options != question.options:
+                stats = self._questions[question.text] = QuestionStats(
+                    question.text, question.options, question.answer)
+            stats.counts[chosen] += 1
+            self.submissions += 1
+            if student:
+                self._update_score(student, score)
+
+    def _update_score(self, student: str, score: int) -> None:
+        previous = self._best.get(student)
+        if previous is not None and score <= previous:
+            return
+        if previous is not None:
+            index = bisect_left(self._ranking, (-previous, student))
+            del self._ranking[index]
+        self._best[student] = score
+        insort(self._ranking, (-score, student))
+
+    def leaderboard(self, k: int = 10) -> List[Tuple[str, int]]:
+        with self._lock:
+            return [(student, -neg) for neg, student in self._ranking[:k]]
+
+    def question_stats(self) -> List[QuestionStats]:
+        """Snapshot of every question's counters"""
+        with self._lock:
+            snapshot = []
+            for stats in self._questions.values():
+                copy = QuestionStats(stats.text, stats.options, stats.answer)
+                copy.counts = list(stats.counts)
+                snapshot.append(copy)
+            return snapshot
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            correct = sum(q.correct for q in self._questions.values())
+            return {"submissions": self.submissions, "correct": correct,
+                    "students": len(self._best), "questions": len(self._questions)}
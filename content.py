@@ -0,0 +1,36 @@
+"""Course reference content shared by the pages and the search index.
+
+Plain data with no imports, so anything can use it without pulling in a
+page's dependencies.
+"""
+
+# symbol: (name, geometric form, metaphysical meaning)
+SYMBOLS_DATA = {
+    "∧": ("Conjunction (AND)", "Two lines converging", "Unity through convergence - multiple conditions aligning"),
+    "∨": ("Disjunction (OR)", "Two lines diverging", "Possibility branching from actuality"),
+    "¬": ("Negation (NOT)", "Line with perpendicular hook", "Active principle defining boundaries of being"),
+    "→": ("Material Implication", "Arrow pointing forward", "Directional flow of causation through time"),
+    "↔": ("Biconditional", "Double-headed arrow", "Perfect reciprocity and mutual definition"),
+    "∀": ("Universal Quantifier", "Inverted triangle", "Universality flowing down into particulars"),
+    "∃": ("Existential Quantifier", "Backwards E", "Emergence from non-being into existence"),
+    "∅": ("Empty Set", "Circle with diagonal slash", "Bounded nothingness - emptiness with structure"),
+    "∈": ("Element Of", "Curved line with gap", "Participation without complete absorption"),
+    "ε": ("Epsilon", "Curved line almost closing", "The infinitely small revealing wave-reality"),
+    "∞": ("Infinity", "Figure-8 rotated", "Eternal return and self-containment"),
+    "≡": ("Equivalence", "Three parallel lines", "Identity across multiple modes of being")
+}
+
+THOUGHT_EXPERIMENTS = [
+    "🧠 **Ship of Theseus**: If you replace every part of a ship, is it still the same ship?",
+    "🏛️ **Plato's Cave**: What if everything you think is real is just shadows?", 
+    "🤖 **Chinese Room**: Can a computer truly understand, or just manipulate symbols?",
+    "∞ **Infinite Hotel**: A hotel with infinite rooms gets a new guest..."
+]
+
+DEFINITIONS = {
+    "Metaphysics": "The branch of philosophy that examines the nature of reality, being, and existence itself.",
+    "Logic": "The study of valid reasoning and argument structure.",
+    "Epsilon": "In mathematics, an arbitrarily small positive quantity; in our framework, the infinitesimal scale where linearity dissolves.",
+    "Being": "The quality or state of existence; what it means for something to exist.",
+    "Truth": "Correspondence between statements and reality; in our framework, convertible with being itself."
+}
@@ -0,0 +1,76 @@
+"""Bounded multi-turn context for the AI Philosophy Assistant.
+
+Recent turns are sent verbatim inside a token budget; turns that fall out
+of the window are folded into a running summary that is computed once per
+evicted turn and reused on every later request. Input size per request is
+therefore capped no matter how long a student chats.
+"""
+
+import re
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+Turn = Tuple[str, str]
+
+CHARS_PER_TOKEN = 4
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English prose)"""
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _clip(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 1].rstrip() + "…"
+
+
+def extractive_summary(previous: str, turns: List[Turn], max_tokens: int) -> str:
+    """Append one line per folded turn, dropping the oldest lines past the budget"""
+    lines = previous.splitlines() if previous else []
+    for question, answer in turns:
+        first_sentence = _SENTENCE_END.split(answer.strip(), maxsplit=1)[0]
+        lines.append(f"- Student asked: {_clip(question, 160)} — assistant: {_clip(first_sentence, 240)}")
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop(0)
+    return "\n".join(lines)
+
+
+class ConversationContext:
+    """Sliding window of recent turns plus a summary of everything older"""
+
+    def __init__(self, budget_tokens: int = 2000, summary_tokens: int = 400,
+                 summarizer: Callable[[str, List[Turn], int], str] = extractive_summary):
+        self.budget_tokens = budget_tokens
+        self.summary_tokens = summary_tokens
+        self.summarizer = summarizer
+        self.summary = ""
+        self.turns: Deque[Turn] = deque()
+        self._window_tokens = 0
+
+    def add_turn(self, question: str, answer: str) -> None:
+        self.turns.append((question, answer))
+        self._window_tokens += estimate_tokens(question) + estimate_tokens(answer)
+
+    def _fold_oldest(self) -> None:
+        question, answer = self.turns.popleft()
+        self._window_tokens -= estimate_tokens(question) + estimate_tokens(answer)
+        self.summary = self.summarizer(self.summary, [(question, answer)], self.summary_tokens)
+
+    def prepare(self, question: str) -> Tuple[str, List[dict]]:
+        """Summary text and Messages API turns for a new question, within budget"""
+        available = self.budget_tokens - estimate_tokens(question)
+        while self.turns and self._window_tokens + estimate_tokens(self.summary) > available:
+            self._fold_oldest()
+        messages = []
+        for past_question, past_answer in self.turns:
+            messages.append({"role": "user", "content": past_question})
+            messages.append({"role": "assistant", "content": past_answer})
+        messages.append({"role": "user", "content": question})
+        return self.summary, messages
+
+    def clear(self) -> None:
+        self.summary = ""
+        self.turns.clear()
+        self._window_tokens = 0
@@ -0,0 +1,115 @@
+"""Bounded, process-wide cache for ready-to-render Plotly figures.
+
+Figures are keyed on the visual parameters that produced them, so every
+student session that lands on the same slider values shares one figure
+instead of rebuilding meshes and ``go.Figure`` objects on each rerun.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+def _round_param(value: Any) -> Any:
+    """Normalize slider floats so 0.15 and 0.15000000000000002 share a key"""
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def make_key(name: str, **params: Any) -> Tuple:
+    """Build a hashable cache key from a figure name and its parameters"""
+    return (name,) + tuple(sorted((k, _round_param(v)) for k, v in params.items()))
+
+
+def figure_nbytes(fig: Any) -> int:
+    """Approximate the memory held by a figure's array data"""
+    total = 0
+    for trace in getattr(fig, "data", ()):
+        for attr in ("x", "y", "z"):
+            arr = getattr(trace, attr, None)
+            if arr is None:
+                continue
+            total += getattr(arr, "nbytes", sys.getsizeof(arr))
+    return total
+
+
+class FigureCache:
+    """Thread-safe LRU cache with TTL and size-based eviction.
+
+    Cached figures are shared between sessions and must be treated as
+    read-only by callers.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = 3600,
+                 max_bytes: Optional[int] = 256 * 1024 * 1024,
+                 sizeof: Callable[[Any], int] = figure_nbytes):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, building it on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created, size, value = entry
+                if self.ttl_seconds is None or now - created < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._drop(key)
+                self.expirations += 1
+            self.misses += 1
+
+        # Build outside the lock so one slow mesh doesn't block other sessions
+        value = builder()
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (now, size, value)
+            self._bytes += size
+            self._evict()
+        return value
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes and len(self._entries) > 1):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of hit/miss counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
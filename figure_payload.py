@@ -0,0 +1,226 @@
+"""Pre-serialized Plotly payloads, encoded once and sent as-is.
+
+``st.plotly_chart`` copies a ``go.Figure`` to a dict, validates it and
+JSON-encodes it on every call, even when the figure is a shared cached one
+that hasn't changed since the last rerun. ``PayloadCache`` keeps the
+encoded spec of each cached figure, addressed by a hash of its content so
+identical figures built under different parameters share one copy, and
+``send`` enqueues that spec directly.
+
+Plotly ships numpy arrays as base64 typed-array blocks (``{"dtype": "f8",
+"bdata": ...}``) that Plotly.js decodes straight into typed arrays. With
+``compact_arrays`` (the default) each block is also narrowed to the smallest dtype that
+draws the same picture: float32 for float data whose rounding error is far
+below a pixel, and the narrowest integer type for integer data.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+# float32 keeps ~7 significant digits, so rounding error stays under 1e-4 of
+# the data's span as long as the largest magnitude is within 1000x the span
+FLOAT32_SPAN_RATIO = 1e3
+_INT_DTYPES = ("i1", "u1", "i2", "u2", "i4", "u4")
+
+
+class FigurePayload(NamedTuple):
+    spec: str  # the JSON st.plotly_chart would have produced
+    digest: str  # content hash of spec
+    height: Optional[int]  # layout height in pixels, if the figure sets one
+    encode_seconds: float
+    compacted_bytes: int = 0  # how much smaller narrowing the arrays made the spec
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.spec.encode("utf-8"))
+
+
+def _narrow(values):
+    """The same values in the smallest dtype that renders identically"""
+    import numpy as np
+
+    if values.size == 0:
+        return values
+    if values.dtype.kind in "iu":
+        low, high = int(values.min()), int(values.max())
+        for dtype in _INT_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return values.astype(dtype) if np.dtype(dtype).itemsize < values.itemsize else values
+        return values
+    if values.dtype == np.float64 and np.isfinite(values).all():
+        low, high = values.min(), values.max()
+        magnitude = max(abs(low), abs(high))
+        if magnitude < np.finfo(np.float32).max and (
+                magnitude <= FLOAT32_SPAN_RATIO * (high - low) or (values.astype(np.float32) == values).all()):
+            return values.astype(np.float32)
+    return values
+
+
+def compact(node: Any) -> int:
+    """Narrow every typed-array block in a figure dict, in place; returns the bytes saved"""
+    saved = 0
+    if isinstance(node, dict):
+        if isinstance(node.get("bdata"), str) and "dtype" in node:
+            import numpy as np
+
+            values = np.frombuffer(base64.b64decode(node["bdata"]), dtype=node["dtype"])
+            narrowed = _narrow(values)
+            if narrowed is not values:
+                bdata = base64.b64encode(narrowed.tobytes()).decode("ascii")
+                # plotly's JSON writer escapes every "/" as "\u002f", six bytes on the wire
+                saved = len(node["bdata"]) + 5 * node["bdata"].count("/") - len(bdata) - 5 * bdata.count("/")
+                node["dtype"] = narrowed.dtype.str.lstrip("<|=")
+                node["bdata"] = bdata
+        else:
+            saved = sum(compact(value) for value in node.values())
+    elif isinstance(node, list):
+        saved = sum(compact(value) for value in node)
+    return saved
+
+
+def encode(fig: Any, compact_arrays: bool = True) -> FigurePayload:
+    """Serialize a figure as ``st.plotly_chart`` does, optionally with narrowed arrays"""
+    import plotly.io
+    import plotly.tools
+
+    start = time.perf_counter()
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    compacted = compact(figure) if compact_arrays else 0
+    spec = plotly.io.to_json(figure, validate=False)
+    height = figure.get("layout", {}).get("height")
+    return FigurePayload(spec, hashlib.blake2b(spec.encode("utf-8"), digest_size=16).hexdigest(),
+                         int(height) if isinstance(height, (int, float)) and height > 0 else None,
+                         time.perf_counter() - start, compacted)
+
+
+class PayloadCache:
+    """Thread-safe LRU of encoded figures, deduplicated by content hash"""
+
+    def __init__(self, max_entries: int = 256, max_bytes: Optional[int] = 128 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._keys: "OrderedDict[Hashable, str]" = OrderedDict()  # figure key -> digest
+        self._payloads: Dict[str, FigurePayload] = {}
+        self._refs: Counter = Counter()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0  # misses whose content was already cached under another key
+        self.bytes_saved = 0
+        self.seconds_saved = 0.0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], FigurePayload]) -> FigurePayload:
+        """Return the payload for ``key``, calling ``build`` (usually ``encode(figure)``) on a miss"""
+        with self._lock:
+            digest = self._keys.get(key)
+            if digest is not None:
+                self._keys.move_to_end(key)
+                payload = self._payloads[digest]
+                self.hits += 1
+                self.bytes_saved += payload.nbytes
+                self.seconds_saved += payload.encode_seconds
+                return payload
+            self.misses += 1
+
+        # Encode outside the lock; a 3D surface takes several milliseconds
+        payload = build()
+        with self._lock:
+            if key in self._keys:
+                self._release(self._keys.pop(key))
+            existing = self._payloads.get(payload.digest)
+            if existing is not None:
+                self.shared += 1
+                payload = existing
+            else:
+                self._payloads[payload.digest] = payload
+                self._bytes += payload.nbytes
+            self._keys[key] = payload.digest
+            self._refs[payload.digest] += 1
+            while len(self._keys) > self.max_entries or (
+                    self.max_bytes is not None and self._bytes > self.max_bytes and len(self._keys) > 1):
+                self._release(self._keys.popitem(last=False)[1])
+        return payload
+
+    def _release(self, digest: str) -> None:
+        self._refs[digest] -= 1
+        if not self._refs[digest]:
+            del self._refs[digest]
+            self._bytes -= self._payloads.pop(digest).nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+            self._payloads.clear()
+            self._refs.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, occupancy and the encoding work hits avoided"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "keys": len(self._keys),
+                "payloads": len(self._payloads),
+                "shared": self.shared,
+                "bytes": self._bytes,
+                "compacted_bytes": sum(p.compacted_bytes for p in self._payloads.values()),
+                "bytes_saved": self.bytes_saved,
+                "seconds_saved": self.seconds_saved,
+            }
+
+
+# Cleared the first time Streamlit's internals don't behave as ``_enqueue`` expects
+_direct_send = True
+
+
+def _enqueue(payload: FigurePayload, config: Optional[dict]) -> None:
+    """The non-selection path of ``st.plotly_chart`` minus validation and encoding.
+
+    Written against streamlit 1.66 (pinned in requirements.txt); these are
+    private APIs and may change in any release.
+    """
+    import streamlit as st
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.theme = "streamlit"
+    proto.form_id = current_form_id(dg)
+    proto.spec = payload.spec
+    proto.config = json.dumps(config or {})
+    # The digest stands in for the spec in the element ID: same uniqueness, no rehash of the JSON
+    proto.id = compute_and_register_element_id(
+        "plotly_chart", user_key=None, key_as_main_identity=False, dg=dg,
+        plotly_spec=payload.digest, plotly_config=proto.config, selection_mode=None,
+        is_selection_activated=False, theme="streamlit", width="stretch", height="content", alt=None)
+    dg._enqueue("plotly_chart", proto, layout_config=LayoutConfig(width="stretch", height=payload.height or 450))
+
+
+def send(payload: FigurePayload, config: Optional[dict] = None) -> None:
+    """Show an encoded figure at container width, like ``st.plotly_chart(fig, width="stretch")``.
+
+    If the Streamlit internals the direct path relies on are missing or
+    have changed, this and every later call fall back to ``st.plotly_chart``.
+    """
+    global _direct_send
+    if _direct_send:
+        try:
+            _enqueue(payload, config)
+            return
+        except Exception:
+            _direct_send = False
+    import streamlit as st
+    st.plotly_chart(json.loads(payload.spec), width="stretch", config=config)
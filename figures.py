@@ -0,0 +1,236 @@
+"""Plotly figure builders for the metaphysical visualizations and class analytics.
+
+Each builder is a pure function of its visual parameters so the result can
+be shared through the figure cache. Every page that draws a Plotly figure
+builds it here.
+"""
+
+import math
+
+import numpy as np
+# plotly imports pandas lazily on the first serialization, and a second session
+# serializing at the same moment gets the half-initialized module; import it first
+import pandas  # noqa: F401
+import plotly.graph_objects as go
+
+from sampling import PIXEL_BUDGET, sample_trace
+
+CUBE_SCENE = dict(aspectmode="cube",
+                  xaxis=dict(range=[-1.5, 1.5]),
+                  yaxis=dict(range=[-1.5, 1.5]),
+                  zaxis=dict(range=[-1.5, 1.5]))
+
+
+# Level-of-detail policy for the sphere surfaces
+SAMPLES_PER_WAVELENGTH = 8
+RESOLUTION_BUCKET = 5
+
+
+def mesh_resolution(frequency: float = 0, width_fraction: float = 1.0,
+                    low_power: bool = False):
+    """Pick an (n_phi, n_theta) grid for a perturbed sphere.
+
+    sin(fθ) completes f periods around the equator and sin(fφ) f/2 periods
+    from pole to pole, so each axis gets enough samples per wavelength to
+    avoid aliasing. The result is clamped between a floor that keeps the
+    silhouette smooth and a cap scaled by the column width (narrower plots
+    can't show more detail), and rounded up to a bucket so nearby slider
+    values share cached meshes.
+    """
+    width_fraction = min(max(width_fraction, 0.25), 1.0)
+    floor = 16 if low_power else int(24 + 6 * width_fraction)
+    cap = int((48 if low_power else 120) * width_fraction)
+
+    def fit(n):
+        n = RESOLUTION_BUCKET * math.ceil(n / RESOLUTION_BUCKET)
+        return int(min(max(n, floor), max(cap, floor)))
+
+    n_theta = SAMPLES_PER_WAVELENGTH * frequency + 1
+    n_phi = SAMPLES_PER_WAVELENGTH * frequency / 2 + 1
+    return fit(n_phi), fit(n_theta)
+
+
+def sphere_mesh(resolution):
+    """Polar/azimuthal angle grids for a sphere.
+
+    ``resolution`` is either a single grid size or an (n_phi, n_theta) pair.
+    """
+    if isinstance(resolution, int):
+        resolution = (resolution, resolution)
+    n_phi, n_theta = resolution
+    phi = np.linspace(0, np.pi, n_phi)   # polar angle
+    theta = np.linspace(0, 2*np.pi, n_theta)  # azimuthal angle
+    return np.meshgrid(phi, theta)
+
+
+def perturbed_sphere(resolution, frequency: float, strength: float):
+    """Cartesian coordinates of a sphere whose radius is perturbed by sin waves"""
+    phi, theta = sphere_mesh(resolution)
+    # Perturb the radius with sinusoidal function
+    r = 1 + strength * np.sin(frequency*theta) * np.sin(frequency*phi)
+    x = r * np.sin(phi) * np.cos(theta)
+    y = r * np.sin(phi) * np.sin(theta)
+    z = r * np.cos(phi)
+    return x, y, z
+
+
+def linear_figure(pixel_budget: int = PIXEL_BUDGET) -> go.Figure:
+    x_linear, y_linear = sample_trace(lambda x: np.ones_like(x) * 0.5, 0, 10, 0, pixel_budget)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x_linear, y=y_linear, mode="lines",
+                             name="Apparent Linearity", line=dict(color="blue", width=3)))
+    fig.update_layout(title="Linear Approximation", xaxis_title="x", yaxis_title="y")
+    return fig
+
+
+def sinusoidal_figure(pixel_budget: int = PIXEL_BUDGET) -> go.Figure:
+    x_sin, y_sin = sample_trace(lambda x: np.sin(x * 2) * 0.5, 0, 10, 2, pixel_budget)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x_sin, y=y_sin, mode="lines",
+                             name="Wave Reality", line=dict(color="red", width=2)))
+    fig.update_layout(title="Sinusoidal Foundation", xaxis_title="x", yaxis_title="sin(x)")
+    return fig
+
+
+def holographic_sphere_figure(resolution=30) -> go.Figure:
+    X, Y, Z = perturbed_sphere(resolution, 0, 0.0)
+    fig = go.Figure(data=[go.Surface(x=X, y=Y, z=Z, colorscale="Viridis", opacity=0.8)])
+    fig.update_layout(title="Holographic Sphere of Relational Being",
+                      scene=dict(aspectmode="cube"))
+    return fig
+
+
+def perfect_sphere_figure(resolution=50) -> go.Figure:
+    x, y, z = perturbed_sphere(resolution, 0, 0.0)
+    fig = go.Figure(data=[go.Surface(x=x, y=y, z=z, colorscale="Blues", opacity=0.8)])
+    fig.update_layout(scene=CUBE_SCENE, title="Geometric Ideal")
+    return fig
+
+
+def perturbed_sphere_figure(frequency: float, strength: float, resolution=50) -> go.Figure:
+    x, y, z = perturbed_sphere(resolution, frequency, strength)
+    fig = go.Figure(data=[go.Surface(x=x, y=y, z=z, colorscale="Plasma", opacity=0.8)])
+    fig.update_layout(scene=CUBE_SCENE, title="Sinusoidal Reality")
+    return fig
+
+
+def epsilon_figure(epsilon_scale: float, pixel_budget: int = PIXEL_BUDGET) -> go.Figure:
+    frequency = 1 / (epsilon_scale * 0.1)
+    x_eps, y_eps = sample_trace(lambda x: np.sin(frequency * x), -epsilon_scale, epsilon_scale,
+                                frequency, pixel_budget)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=x_eps, y=y_eps, mode="lines",
+                             name=f"ε = {epsilon_scale}", line=dict(color="purple")))
+    fig.update_layout(title=f"Infinitesimal Scale (ε = {epsilon_scale})",
+                      xaxis_title="ε-scale position", yaxis_title="Wave amplitude")
+    return fig
+
+
+def quick_perturbed_figure(resolution=25) -> go.Figure:
+    x, y, z = perturbed_sphere(resolution, 4, 0.15)
+    fig = go.Figure(data=[go.Surface(x=x, y=y, z=z, colorscale="Plasma", opacity=0.8)])
+    fig.update_layout(scene=dict(aspectmode="cube"),
+                      title="Geometric Forms at Epsilon Scale")
+    return fig
+
+
+# Parameter grids precomputed for the client-side animated slider mode
+ANIMATION_FREQUENCIES = list(range(1, 11))
+ANIMATION_STRENGTHS = [round(s, 2) for s in np.arange(0, 0.5 + 1e-9, 0.05)]
+ANIMATION_EPSILONS = [round(e, 2) for e in np.arange(0.01, 1.0 + 1e-9, 0.01)]
+
+
+def _slider_step(label, method, args):
+    return dict(label=label, method=method, args=args)
+
+
+def _animate_args(frame_name, redraw):
+    return [[frame_name], {"frame": {"duration": 0, "redraw": redraw},
+                           "mode": "immediate", "transition": {"duration": 0}}]
+
+
+def _nearest_index(values, value):
+    return int(np.argmin(np.abs(np.asarray(values, dtype=float) - value)))
+
+
+def perturbed_sphere_animation(resolution=25, frequency: float = 5,
+                               strength: float = 0.2) -> go.Figure:
+    """Whole frequency × strength grid as one figure scrubbed in the browser.
+
+    One Surface trace per frequency is toggled by a restyle slider, while
+    animation frames carry every trace at each perturbation strength, so
+    both sliders work without a server round trip. Coordinates are sent
+    as float32 to keep the one-off payload of 110 meshes small.
+    """
+    freq_index = _nearest_index(ANIMATION_FREQUENCIES, frequency)
+    strength_index = _nearest_index(ANIMATION_STRENGTHS, strength)
+
+    def surfaces(s):
+        # Coordinates only: a frame that also set ``visible`` would undo the frequency slider
+        traces = []
+        for f in ANIMATION_FREQUENCIES:
+            x, y, z = (a.astype(np.float32) for a in perturbed_sphere(resolution, f, s))
+            traces.append(go.Surface(x=x, y=y, z=z))
+        return traces
+
+    trace_ids = list(range(len(ANIMATION_FREQUENCIES)))
+    data = surfaces(ANIMATION_STRENGTHS[strength_index])
+    for i, trace in enumerate(data):
+        trace.update(colorscale="Plasma", opacity=0.8, showscale=False, visible=(i == freq_index))
+    fig = go.Figure(
+        data=data,
+        frames=[go.Frame(name=f"s{s:.2f}", data=surfaces(s), traces=trace_ids)
+                for s in ANIMATION_STRENGTHS],
+    )
+    frequency_steps = [
+        _slider_step(str(f), "restyle",
+                     [{"visible": [j == i for j in trace_ids]}])
+        for i, f in enumerate(ANIMATION_FREQUENCIES)
+    ]
+    strength_steps = [_slider_step(f"{s:.2f}", "animate", _animate_args(f"s{s:.2f}", True))
+                      for s in ANIMATION_STRENGTHS]
+    fig.update_layout(
+        scene=CUBE_SCENE, title="Sinusoidal Reality",
+        margin=dict(b=120),
+        sliders=[
+            dict(active=freq_index, steps=frequency_steps, y=0, len=0.9, x=0.05,
+                 currentvalue=dict(prefix="Wave Frequency: ")),
+            dict(active=strength_index, steps=strength_steps, y=-0.15, len=0.9, x=0.05,
+                 currentvalue=dict(prefix="Perturbation Strength: ")),
+        ],
+    )
+    return fig
+
+
+def epsilon_animation(pixel_budget: int = PIXEL_BUDGET, epsilon_scale: float = 0.1) -> go.Figure:
+    """Epsilon trace for every slider position, scrubbed in the browser.
+
+    Because the frequency is 1 / (0.1 ε), the wave over [-ε, ε] is the same
+    sin(10u) curve at every scale; frames therefore only carry the rescaled
+    x positions and reuse the base trace's y values.
+    """
+    start = _nearest_index(ANIMATION_EPSILONS, epsilon_scale)
+    base = epsilon_figure(ANIMATION_EPSILONS[start], pixel_budget)
+    u = base.data[0].x / ANIMATION_EPSILONS[start]
+    frames = []
+    for eps in ANIMATION_EPSILONS:
+        frames.append(go.Frame(name=f"e{eps:.2f}",
+                               data=[go.Scatter(x=(u * eps).astype(np.float32), name=f"ε = {eps}")],
+                               layout=dict(title=dict(text=f"Infinitesimal Scale (ε = {eps})"))))
+    base.frames = frames
+    base.update_layout(
+        sliders=[dict(active=start, currentvalue=dict(prefix="Zoom to Epsilon Scale: "),
+                      steps=[_slider_step(f"{eps:.2f}", "animate", _animate_args(f"e{eps:.2f}", False))
+                             for eps in ANIMATION_EPSILONS])],
+    )
+    return base
+
+
+def option_popularity(options, counts, answer: int) -> go.Figure:
+    """How many students picked each option of a question, the correct one in green"""
+    fig = go.Figure(go.Bar(
+        x=counts, y=[f"{'✅ ' if i == answer else ''}{opt}" for i, opt in enumerate(options)],
+        orientation="h", marker_color=["green" if i == answer else "indianred" for i in range(len(options))]))
+    fig.update_layout(xaxis_title="Students choosing this option", yaxis=dict(autorange="reversed"),
+                      margin=dict(l=10, r=10, t=10, b=10), height=300)
+    return fig
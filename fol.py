@@ -0,0 +1,575 @@
+"""Finite-domain model checking for first-order formulas with ∀, ∃, ∈ and ∅.
+
+A model is a domain {0, 1, ..., n-1} plus predicates and sets defined one
+per line:
+
+    Even(x) := x % 2 == 0
+    Less(x, y) := x < y
+    Primes = {2, 3, 5, 7}
+    Nothing = ∅
+
+Predicate bodies are small arithmetic/comparison expressions evaluated
+with NumPy on whole arrays of domain elements, never one element at a
+time. Each quantified variable becomes one axis of a boolean tensor, and
+∀/∃ are all()/any() reductions along that axis. When nesting would make
+the tensor larger than CHUNK_CELLS, the outer quantifier's axis is split
+into chunks, each reduced in turn, and the loop stops as soon as the
+answer can no longer change.
+"""
+
+import ast
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from logic import LogicSyntaxError
+
+MAX_DOMAIN = 1_000_000
+CHUNK_CELLS = 1 << 22  # elements per intermediate tensor, about 32 MiB as int64
+# Domain tuples a check may visit before giving up (about a second); up to n^2 for two
+# nested quantifiers, but usually far fewer because the chunk loop stops early
+MAX_CELLS = 100_000_000
+
+_CONNECTIVES = {
+    "¬": "not", "~": "not", "!": "not",
+    "∧": "and", "&": "and",
+    "∨": "or", "|": "or",
+    "→": "implies", "->": "implies", "=>": "implies",
+    "↔": "iff", "<->": "iff", "<=>": "iff",
+    "∀": "forall", "∃": "exists", "∈": "in", "∉": "notin", "∅": "empty",
+    "⊤": "true", "⊥": "false",
+    "=": "==", "≠": "!=", "!=": "!=", "<": "<", "≤": "<=", "<=": "<=", ">": ">", "≥": ">=", ">=": ">=",
+    "(": "(", ")": ")", ",": ",", ".": ".", ":": ".",
+}
+_WORDS = {"not", "and", "or", "implies", "iff", "forall", "exists", "in", "true", "false"}
+_TOKEN = re.compile(r"\s*(?:(<->|<=>|->|=>|!=|<=|>=|[¬~!∧&∨|→↔∀∃∈∉∅⊤⊥=≠<≤>≥(),.:])"
+                    r"|([A-Za-z_][A-Za-z0-9_']*)|(\d+)|(\S))")
+_COMPARE = {"==": np.equal, "!=": np.not_equal, "<": np.less, "<=": np.less_equal,
+            ">": np.greater, ">=": np.greater_equal}
+
+
+class ModelError(ValueError):
+    """A model definition or formula that is well-formed but can't be evaluated"""
+
+
+class Node(NamedTuple):
+    # "forall"/"exists" (name, body), "not"/"and"/"or"/"implies"/"iff", "true"/"false",
+    # "pred" (name, terms), "in" (set name or "" for ∅, term), a comparison op (terms)
+    op: str
+    args: Tuple = ()
+    name: str = ""
+
+
+# Terms are ("var", name) or ("const", value)
+Term = Tuple[str, object]
+
+
+def _tokens(text: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        symbol, word, number, junk = match.groups()
+        position = match.start(match.lastindex)
+        if junk is not None:
+            raise LogicSyntaxError(f"Unexpected character {junk!r}", position)
+        if symbol is not None:
+            tokens.append(("op", _CONNECTIVES[symbol], position))
+        elif number is not None:
+            tokens.append(("num", number, position))
+        elif word.lower() in _WORDS:
+            tokens.append(("op", word.lower(), position))
+        else:
+            tokens.append(("name", word, position))
+    return tokens
+
+
+class _Parser:
+    """Same precedence as logic.py; a quantifier binds like ¬ unless followed by '.'"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokens(text)
+        self.i = 0
+
+    def _peek(self, value: str) -> bool:
+        return self.i < len(self.tokens) and self.tokens[self.i][0] == "op" and self.tokens[self.i][1] == value
+
+    def _position(self) -> int:
+        return self.tokens[self.i][2] if self.i < len(self.tokens) else len(self.text)
+
+    def _expect(self, value: str) -> None:
+        if not self._peek(value):
+            raise LogicSyntaxError(f"Expected {value!r}", self._position())
+        self.i += 1
+
+    def _next(self) -> Tuple[str, str, int]:
+        if self.i >= len(self.tokens):
+            raise LogicSyntaxError("Formula ends too early", len(self.text))
+        self.i += 1
+        return self.tokens[self.i - 1]
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise LogicSyntaxError("Empty formula", 0)
+        node = self._iff()
+        if self.i < len(self.tokens):
+            raise LogicSyntaxError(f"Unexpected {self.tokens[self.i][1]!r}", self._position())
+        return node
+
+    def _iff(self) -> Node:
+        node = self._implies()
+        while self._peek("iff"):
+            self.i += 1
+            node = Node("iff", (node, self._implies()))
+        return node
+
+    def _implies(self) -> Node:
+        node = self._or()
+        if self._peek("implies"):
+            self.i += 1
+            node = Node("implies", (node, self._implies()))
+        return node
+
+    def _or(self) -> Node:
+        node = self._and()
+        while self._peek("or"):
+            self.i += 1
+            node = Node("or", (node, self._and()))
+        return node
+
+    def _and(self) -> Node:
+        node = self._unary()
+        while self._peek("and"):
+            self.i += 1
+            node = Node("and", (node, self._unary()))
+        return node
+
+    def _unary(self) -> Node:
+        if self._peek("not"):
+            self.i += 1
+            return Node("not", (self._unary(),))
+        if self._peek("forall") or self._peek("exists"):
+            quantifier = self._next()[1]
+            names = [self._variable()]
+            while self._peek(","):
+                self.i += 1
+                names.append(self._variable())
+            if self._peek("."):
+                self.i += 1
+                body = self._iff()
+            else:
+                body = self._unary()
+            for name in reversed(names):
+                body = Node(quantifier, (body,), name)
+            return body
+        return self._atom()
+
+    def _variable(self) -> str:
+        kind, value, position = self._next()
+        if kind != "name":
+            raise LogicSyntaxError(f"Expected a variable after the quantifier but found {value!r}", position)
+        return value
+
+    def _term(self) -> Term:
+        kind, value, position = self._next()
+        if kind == "name":
+            return ("var", value)
+        if kind == "num":
+            return ("const", int(value))
+        raise LogicSyntaxError(f"Expected a variable or a number but found {value!r}", position)
+
+    def _atom(self) -> Node:
+        if self._peek("true") or self._peek("false"):
+            return Node(self._next()[1])
+        if self._peek("("):
+            self.i += 1
+            node = self._iff()
+            self._expect(")")
+            return node
+        if (self.i + 1 < len(self.tokens) and self.tokens[self.i][0] == "name"
+                and self.tokens[self.i + 1][:2] == ("op", "(")):
+            name = self._next()[1]
+            self.i += 1
+            terms = [self._term()]
+            while self._peek(","):
+                self.i += 1
+                terms.append(self._term())
+            self._expect(")")
+            return Node("pred", tuple(terms), name)
+        term = self._term()
+        kind, op, position = self._next()
+        if op in ("in", "notin"):
+            kind, value, position = self._next()
+            if kind == "op" and value == "empty":
+                node = Node("in", (term,), "")
+            elif kind == "name":
+                node = Node("in", (term,), value)
+            else:
+                raise LogicSyntaxError(f"Expected a set name or ∅ but found {value!r}", position)
+            return Node("not", (node,)) if op == "notin" else node
+        if op in _COMPARE:
+            return Node(op, (term, self._term()))
+        raise LogicSyntaxError(f"Expected ∈ or a comparison but found {op!r}", position)
+
+
+def parse(text: str) -> Node:
+    return _Parser(text).parse()
+
+
+def to_text(node: Node) -> str:
+    """Render with explicit scopes: ∀x (…)"""
+    def term(t: Term) -> str:
+        return str(t[1])
+
+    op = node.op
+    if op in ("forall", "exists"):
+        return f"{'∀' if op == 'forall' else '∃'}{node.name} ({to_text(node.args[0])})"
+    if op in ("true", "false"):
+        return "⊤" if op == "true" else "⊥"
+    if op == "pred":
+        return f"{node.name}({', '.join(map(term, node.args))})"
+    if op == "in":
+        return f"{term(node.args[0])} ∈ {node.name or '∅'}"
+    if op in _COMPARE:
+        symbol = {"==": "=", "!=": "≠", "<=": "≤", ">=": "≥"}.get(op, op)
+        return f"{term(node.args[0])} {symbol} {term(node.args[1])}"
+    if op == "not":
+        inner = to_text(node.args[0])
+        return f"¬{inner}" if node.args[0].op in ("pred", "true", "false", "not") else f"¬({inner})"
+    symbol = {"and": "∧", "or": "∨", "implies": "→", "iff": "↔"}[op]
+    return " ".join([f"({to_text(node.args[0])})", symbol, f"({to_text(node.args[1])})"])
+
+
+# Predicate bodies: Python expression syntax restricted to arithmetic and comparisons
+_BINARY = {ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply, ast.FloorDiv: np.floor_divide,
+           ast.Mod: np.mod, ast.Pow: np.power}
+_DIVISIONS = (ast.FloorDiv, ast.Mod)
+_COMPARE_AST = {ast.Eq: np.equal, ast.NotEq: np.not_equal, ast.Lt: np.less, ast.LtE: np.less_equal,
+                ast.Gt: np.greater, ast.GtE: np.greater_equal}
+_EXPRESSION_SYMBOLS = {"≤": "<=", "≥": ">=", "≠": "!=", "∧": " and ", "∨": " or ", "¬": " not "}
+_INT64_LIMIT = 2.0 ** 63
+
+
+def _compile_expression(text: str, params: Tuple[str, ...]) -> Callable[..., np.ndarray]:
+    """A vectorized predicate body.
+
+    Every subexpression evaluates to (values, undefined), where ``undefined``
+    marks the elements that divide by zero. ``and``/``or`` evaluate both
+    sides over the whole array, so undefined elements only count where
+    Python's short-circuiting would have reached them: ``x > 0 and y % x
+    == 0`` is fine at x = 0, a bare ``y % x == 0`` is an error.
+    """
+    source = text
+    for symbol, replacement in _EXPRESSION_SYMBOLS.items():
+        source = source.replace(symbol, replacement)
+    try:
+        tree = ast.parse(source.strip(), mode="eval").body
+    except SyntaxError as e:
+        raise ModelError(f"Can't read {text.strip()!r}: {e.msg}") from None
+
+    def arithmetic(op, f):
+        def apply(a, b):
+            if isinstance(op, ast.Pow) and np.any(np.asarray(b) < 0):
+                raise ModelError(f"Negative exponents don't give whole numbers in {text.strip()!r}")
+            # The same sum in floating point tells whether the int64 result wrapped around
+            with np.errstate(over="ignore"):
+                approx = f(np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64))
+            if np.any(np.abs(approx) >= _INT64_LIMIT):
+                raise ModelError(f"{text.strip()!r} produces numbers too large to compute exactly")
+            return f(a, b)
+        return apply
+
+    def build(node) -> Callable[[Dict[str, np.ndarray]], Tuple[np.ndarray, np.ndarray]]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (bool, int)):
+            value = node.value
+            return lambda env: (value, np.False_)
+        if isinstance(node, ast.Name):
+            if node.id == "n":
+                return lambda env: (env["n"], np.False_)
+            if node.id not in params:
+                raise ModelError(f"Unknown name {node.id!r} in {text.strip()!r}")
+            return lambda env, name=node.id: (env[name], np.False_)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, _DIVISIONS):
+            f, left, right = _BINARY[type(node.op)], build(node.left), build(node.right)
+
+            def divide(env):
+                (a, a_undefined), (b, b_undefined) = left(env), right(env)
+                zero = np.equal(b, 0)
+                # Divide by 1 instead of 0 and mark those elements undefined
+                return f(a, np.where(zero, 1, b)), a_undefined | b_undefined | zero
+            return divide
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+            f, left, right = arithmetic(node.op, _BINARY[type(node.op)]), build(node.left), build(node.right)
+
+            def binary(env):
+                (a, a_undefined), (b, b_undefined) = left(env), right(env)
+                return f(a, b), a_undefined | b_undefined
+            return binary
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.Not)):
+            f = np.negative if isinstance(node.op, ast.USub) else np.logical_not
+            operand = build(node.operand)
+
+            def unary(env):
+                value, undefined = operand(env)
+                return f(value), undefined
+            return unary
+        if isinstance(node, ast.BoolOp):
+            conjunction = isinstance(node.op, ast.And)
+            f = np.logical_and if conjunction else np.logical_or
+            parts = [build(value) for value in node.values]
+
+            def boolean(env):
+                values, undefined, reached = [], np.False_, np.True_
+                for part in parts:
+                    value, part_undefined = part(env)
+                    values.append(np.asarray(value))
+                    undefined = undefined | (reached & part_undefined)
+                    # Python only evaluates the next operand where this one didn't decide the result
+                    truthy = np.not_equal(value, 0)
+                    reached = reached & (truthy if conjunction else ~truthy)
+                return f.reduce(np.broadcast_arrays(*values)) if len(values) > 2 \
+                    else f(values[0], values[1]), undefined
+            return boolean
+        if isinstance(node, ast.Compare) and all(type(op) in _COMPARE_AST for op in node.ops):
+            operands = [build(node.left)] + [build(c) for c in node.comparators]
+            ops = [_COMPARE_AST[type(op)] for op in node.ops]
+
+            def compare(env):
+                evaluated = [operand(env) for operand in operands]
+                values = [value for value, _ in evaluated]
+                result = ops[0](values[0], values[1])
+                for i in range(1, len(ops)):
+                    result = np.logical_and(result, ops[i](values[i], values[i + 1]))
+                undefined = np.False_
+                for _, operand_undefined in evaluated:
+                    undefined = undefined | operand_undefined
+                return result, undefined
+            return compare
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "abs" \
+                and len(node.args) == 1 and not node.keywords:
+            operand = build(node.args[0])
+
+            def absolute(env):
+                value, undefined = operand(env)
+                return np.abs(value), undefined
+            return absolute
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+            raise ModelError(f"Use // for whole-number division in {text.strip()!r}")
+        raise ModelError(f"Only arithmetic, comparisons, and/or/not and abs() are allowed in {text.strip()!r}")
+
+    evaluate = build(tree)
+
+    def run(n, *args):
+        try:
+            with np.errstate(all="raise"):
+                value, undefined = evaluate({"n": n, **dict(zip(params, args))})
+        except ModelError:
+            raise
+        except (FloatingPointError, ValueError, OverflowError) as e:
+            raise ModelError(f"Can't evaluate {text.strip()!r}: {e}") from None
+        if np.any(undefined):
+            raise ModelError(f"{text.strip()!r} divides by zero; guard it, e.g. x > 0 and y % x == 0")
+        return value
+    return run
+
+
+class Verdict(NamedTuple):
+    value: bool
+    # For a formula that starts with a quantifier: the element refuting ∀ or satisfying ∃
+    witness: Optional[Tuple[str, int]]
+    cells: int  # domain tuples actually examined
+
+
+_DEFINITION = re.compile(r"^([A-Za-z_][A-Za-z0-9_']*)\s*(?:\(([^)]*)\)\s*(?::=|:|≔)\s*(.+)|=\s*(.+))$")
+
+
+class Model:
+    """A domain 0..n-1 with named predicates and sets"""
+
+    def __init__(self, size: int, definitions: str = ""):
+        if not 1 <= size <= MAX_DOMAIN:
+            raise ModelError(f"The domain must have between 1 and {MAX_DOMAIN:,} elements")
+        self.size = size
+        self.predicates: Dict[str, Tuple[int, Callable[..., np.ndarray]]] = {}
+        self.sets: Dict[str, np.ndarray] = {}
+        self._masks: Dict[str, np.ndarray] = {}
+        for line in definitions.splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                self._define(line)
+
+    def _define(self, line: str) -> None:
+        match = _DEFINITION.match(line)
+        if not match:
+            raise ModelError(f"Can't read definition {line!r}; write Name(x) := expression or Name = {{1, 2}}")
+        name, params, body, members = match.groups()
+        if name in self.predicates or name in self.sets:
+            raise ModelError(f"{name} is defined twice")
+        if body is not None:
+            names = tuple(p.strip() for p in params.split(",")) if params.strip() else ()
+            if not names or not all(re.fullmatch(r"[A-Za-z_][A-Za-z0-9_']*", p) for p in names):
+                raise ModelError(f"{name} needs one or more parameter names, like {name}(x, y)")
+            self.predicates[name] = (len(names), _compile_expression(body, names))
+            return
+        members = members.strip()
+        mask = np.zeros(self.size, dtype=bool)
+        if members not in ("∅", "{}"):
+            if not (members.startswith("{") and members.endswith("}")):
+                raise ModelError(f"Write sets as {name} = {{1, 2, 3}} or {name} = ∅")
+            try:
+                values = [int(v) for v in members[1:-1].split(",") if v.strip()]
+            except ValueError:
+                raise ModelError(f"Set {name} may only list whole numbers") from None
+            outside = [v for v in values if not 0 <= v < self.size]
+            if outside:
+                raise ModelError(f"{outside[0]} in {name} is outside the domain 0..{self.size - 1}")
+            mask[values] = True
+        self.sets[name] = mask
+
+    def _mask(self, name: str) -> np.ndarray:
+        """A one-place predicate over the whole domain, evaluated once"""
+        mask = self._masks.get(name)
+        if mask is None:
+            mask = self._masks[name] = np.broadcast_to(
+                np.asarray(self.predicates[name][1](self.size, np.arange(self.size)), dtype=bool),
+                (self.size,))
+        return mask
+
+    def check(self, node: Node) -> Verdict:
+        self._validate(node, ())
+        # Models are cached and shared between sessions, so the work count lives with the call
+        work = _Work()
+        witness: List[Tuple[str, int]] = []
+        value = bool(self._eval(node, {}, 0, witness, work))
+        return Verdict(value, witness[0] if witness else None, work.cells)
+
+    def _validate(self, node: Node, bound: Tuple[str, ...]) -> None:
+        op = node.op
+        if op in ("forall", "exists"):
+            self._validate(node.args[0], bound + (node.name,))
+            return
+        if op in ("not", "and", "or", "implies", "iff"):
+            for child in node.args:
+                self._validate(child, bound)
+            return
+        if op == "pred":
+            if node.name not in self.predicates:
+                known = ", ".join(sorted(self.predicates)) or "none yet"
+                raise ModelError(f"Unknown predicate {node.name} (defined: {known})")
+            arity = self.predicates[node.name][0]
+            if arity != len(node.args):
+                raise ModelError(f"{node.name} takes {arity} argument(s), not {len(node.args)}")
+        if op == "in" and node.name and node.name not in self.sets:
+            if node.name in self.predicates and self.predicates[node.name][0] == 1:
+                pass  # x ∈ Even reads as Even(x)
+            else:
+                raise ModelError(f"Unknown set {node.name}")
+        for kind, value in node.args if op not in ("true", "false") else ():
+            if kind == "const" and not 0 <= value < self.size:
+                raise ModelError(f"{value} is outside the domain 0..{self.size - 1}")
+            if kind == "var" and value not in bound:
+                raise ModelError(f"{value} is not bound by any ∀ or ∃ (a quantifier covers only what follows it "
+                                 f"directly; widen it with parentheses, ∃{value} (… ∧ …), or a dot, ∃{value}. …)")
+
+    def _term(self, term: Term, env: Dict[str, np.ndarray]):
+        kind, value = term
+        return env[value] if kind == "var" else value
+
+    def _eval(self, node: Node, env: Dict[str, np.ndarray], rank: int, witness: list,
+              work: "_Work") -> np.ndarray:
+        """Boolean array over the bound variables' axes; the newest variable is axis 0"""
+        op = node.op
+        if op in ("forall", "exists"):
+            return self._quantify(node, env, rank, witness, work)
+        if op == "not":
+            return np.logical_not(self._eval(node.args[0], env, rank, [], work))
+        if op in ("and", "or", "implies", "iff"):
+            a = self._eval(node.args[0], env, rank, [], work)
+            b = self._eval(node.args[1], env, rank, [], work)
+            if op == "and":
+                return a & b
+            if op == "or":
+                return a | b
+            if op == "implies":
+                return ~a | b
+            return a == b
+        if op in ("true", "false"):
+            return np.bool_(op == "true")
+        values = [self._term(t, env) for t in node.args]
+        if op == "pred":
+            arity, predicate = self.predicates[node.name]
+            if arity == 1:
+                return self._mask(node.name)[values[0]]
+            return np.asarray(predicate(self.size, *values), dtype=bool)
+        if op == "in":
+            if not node.name:
+                return np.False_  # nothing is a member of ∅
+            mask = self.sets[node.name] if node.name in self.sets else self._mask(node.name)
+            return mask[values[0]]
+        return _COMPARE[op](values[0], values[1])
+
+    def _quantify(self, node: Node, env: Dict[str, np.ndarray], rank: int, witness: list,
+                  work: "_Work") -> np.ndarray:
+        body = node.args[0]
+        universal = node.op == "forall"
+        outer = int(np.prod([len(np.ravel(a)) for a in env.values()], dtype=np.int64)) if env else 1
+        inner = self.size ** _depth(body)
+        chunk = max(1, min(self.size, CHUNK_CELLS // (outer * inner)))
+        result = None
+        for start in range(0, self.size, chunk):
+            stop = min(start + chunk, self.size)
+            axis = np.arange(start, stop).reshape((-1,) + (1,) * rank)
+            values = np.asarray(self._eval(body, {**env, node.name: axis}, rank + 1, [], work))
+            if values.ndim <= rank:
+                # The body doesn't mention the variable: ∀x φ and ∃x φ are just φ
+                work.cells += stop - start
+                return values
+            work.cells += values.size
+            if work.cells > MAX_CELLS:
+                raise ModelError(f"Gave up after checking {work.cells:,} combinations of elements; "
+                                 f"use a smaller domain or fewer nested quantifiers")
+            reduced = values.all(axis=0) if universal else values.any(axis=0)
+            if rank == 0 and not witness and bool(reduced) != universal:
+                # A counterexample to ∀ or an instance of ∃; only the root is passed a witness list
+                hits = np.flatnonzero(~values.ravel() if universal else values.ravel())
+                witness.append((node.name, start + int(hits[0]) if values.shape[0] > 1 else start))
+            result = reduced if result is None else (result & reduced if universal else result | reduced)
+            # Stop once every entry is already decided
+            if universal and not result.any() or not universal and result.all():
+                break
+        return result
+
+
+class _Work:
+    """Cells evaluated so far by one check, against MAX_CELLS"""
+
+    __slots__ = ("cells",)
+
+    def __init__(self):
+        self.cells = 0
+
+
+def _depth(node: Node) -> int:
+    """Deepest nesting of quantifiers"""
+    if node.op in ("forall", "exists"):
+        return 1 + _depth(node.args[0])
+    if node.op in ("not", "and", "or", "implies", "iff"):
+        return max(_depth(child) for child in node.args)
+    return 0
+
+
+@lru_cache(maxsize=8)
+def model(size: int, definitions: str) -> Model:
+    """A parsed model; unary predicates are evaluated over the domain once and reused"""
+    return Model(size, definitions)
+
+
+@lru_cache(maxsize=256)
+def _check(size: int, definitions: str, formula: str) -> Verdict:
+    return model(size, definitions).check(parse(formula))
+
+
+def check(size: int, definitions: str, formula: str) -> Verdict:
+    """Evaluate ``formula`` in the model; raises LogicSyntaxError or ModelError"""
+    return _check(size, definitions.strip(), formula.strip())
@@ -0,0 +1,363 @@
+"""Concurrent-session load generator for capacity planning.
+
+Starts the app with ``streamlit run`` (or targets an already running server
+with ``--url``) and the local Anthropic stub, then drives N simulated
+students over the same websocket protocol the browser uses. Each student
+navigates the sidebar, answers quiz questions, scrubs the perturbation
+sliders and asks the assistant questions, with a think time between
+actions. Every stage reports throughput, latency percentiles per action and
+the server's resident memory, so capacity can be read off where p99
+latency starts to climb:
+
+    python loadtest.py --sessions 1 5 10 25 50 --duration 60
+    python loadtest.py --sessions 20 --assistant-latency 2.0 --out load.json
+
+Needs the ``websockets`` package, which current Streamlit releases install.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+NAV_LABEL = "Choose Section:"
+QUIZ_PAGE = "Interactive Quiz"
+VIZ_PAGE = "Visualizations"
+ASSISTANT_PAGE = "🤖 AI Philosophy Assistant"
+
+# Relative frequency of each behaviour in a simulated student's session
+BEHAVIOUR_WEIGHTS = {"navigate": 1, "quiz": 4, "scrub": 3, "assistant": 1}
+FREE_FORM_QUESTIONS = (
+    "What is being?",
+    "How does the epsilon principle relate to calculus?",
+    "Is a circle more real than a line?",
+    "Why would truth and being be convertible?",
+)
+WIDGET_TYPES = ("button", "radio", "selectbox", "slider", "checkbox", "text_area", "text_input")
+FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+            ForwardMsg.FINISHED_WITH_COMPILE_ERROR}
+
+
+class Widget(NamedTuple):
+    kind: str
+    id: str
+    options: tuple
+    fragment_id: str
+    proto: object
+
+
+class LoadError(RuntimeError):
+    pass
+
+
+class Student:
+    """One browser session speaking Streamlit's websocket protocol"""
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        self.widgets: Dict[str, Widget] = {}
+        self.values: Dict[str, WidgetState] = {}
+        self.page = None
+        self.samples: List[tuple] = []
+        self._ws = None
+        self._finished: Optional[asyncio.Future] = None
+        self._received = 0
+        self._errors = 0
+        self._reader = None
+
+    async def connect(self) -> None:
+        from websockets import connect
+
+        stream = self.url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+        self._ws = await connect(stream, subprotocols=["streamlit"], max_size=None)
+        self._reader = asyncio.create_task(self._read())
+        await self.rerun("load")
+        self.page = self.widgets[NAV_LABEL].proto.options[0]
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._ws is not None:
+            await self._ws.close()
+
+    async def _read(self) -> None:
+        async for data in self._ws:
+            self._received += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                # A full rerun redraws every widget; a fragment run only its own
+                fragments = set(msg.new_session.fragment_ids_this_run)
+                self.widgets = {label: w for label, w in self.widgets.items()
+                                if fragments and w.fragment_id not in fragments}
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                self._track(msg.delta)
+            elif kind == "script_finished" and msg.script_finished in FINISHED:
+                if self._finished is not None and not self._finished.done():
+                    self._finished.set_result(msg.script_finished)
+
+    def _track(self, delta) -> None:
+        element = delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self._errors += 1
+        elif kind in WIDGET_TYPES:
+            proto = getattr(element, kind)
+            self.widgets[proto.label] = Widget(kind, proto.id, tuple(getattr(proto, "options", ())),
+                                               delta.fragment_id, proto)
+
+    async def rerun(self, action: str, trigger: Optional[Widget] = None,
+                    fragment_id: str = "") -> None:
+        """Send the current widget values and wait for the script to finish"""
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.widget_states.widgets.extend(self.values.values())
+        if trigger is not None:
+            state.widget_states.widgets.add(id=trigger.id, trigger_value=True)
+        state.fragment_id = fragment_id
+        self._finished = asyncio.get_running_loop().create_future()
+        received, errors = self._received, self._errors
+        start = time.perf_counter()
+        await self._ws.send(msg.SerializeToString())
+        try:
+            await asyncio.wait_for(self._finished, self.timeout)
+        except asyncio.TimeoutError:
+            self.samples.append((action, time.perf_counter() - start, self._received - received, True))
+            raise LoadError(f"{action} timed out after {self.timeout:.0f}s")
+        self.samples.append((action, time.perf_counter() - start, self._received - received,
+                             self._errors > errors))
+
+    def _widget(self, label: str) -> Widget:
+        try:
+            return self.widgets[label]
+        except KeyError:
+            raise LoadError(f"no widget labelled {label!r} on {self.page!r}") from None
+
+    def _set(self, label: str, **value) -> Widget:
+        widget = self._widget(label)
+        self.values[widget.id] = WidgetState(id=widget.id, **value)
+        return widget
+
+    async def change(self, action: str, label: str, **value) -> None:
+        """Change a widget the way the browser does: set it, then rerun its scope"""
+        widget = self._set(label, **value)
+        await self.rerun(action, fragment_id=widget.fragment_id)
+
+    async def click(self, action: str, label: str) -> None:
+        widget = self._widget(label)
+        await self.rerun(action, trigger=widget, fragment_id=widget.fragment_id)
+
+    async def open(self, page: str) -> None:
+        if self.page != page:
+            await self.change("navigate", NAV_LABEL, string_value=page)
+            self.page = page
+
+
+async def navigate(s: Student) -> None:
+    await s.open(random.choice(s.widgets[NAV_LABEL].proto.options))
+
+
+async def quiz(s: Student) -> None:
+    await s.open(QUIZ_PAGE)
+    if "Submit Answer" in s.widgets:
+        await s.change("quiz select", "Choose your answer:",
+                       string_value=random.choice(s.widgets["Choose your answer:"].options))
+        await s.click("quiz submit", "Submit Answer")
+    elif "Next Question" in s.widgets:
+        await s.click("quiz next", "Next Question")
+    else:
+        await s.click("quiz restart", "🔄 Restart Quiz")
+
+
+async def scrub(s: Student) -> None:
+    await s.open(VIZ_PAGE)
+    # A drag usually lands a few values in a row on the same slider
+    label = random.choice(("Wave Frequency", "Perturbation Strength"))
+    slider = s.widgets[label].proto
+    steps = int(round((slider.max - slider.min) / slider.step))
+    for _ in range(random.randint(1, 3)):
+        value = slider.min + random.randint(0, steps) * slider.step
+        await s.change("slider scrub", label, double_array_value={"data": [value]})
+
+
+async def ask(s: Student) -> None:
+    await s.open(ASSISTANT_PAGE)
+    s._set("Ask your philosophical question:", string_value=random.choice(FREE_FORM_QUESTIONS))
+    await s.click("assistant ask", "🔮 Ask Assistant")
+    # The box is cleared on the server once the question is queued
+    s._set("Ask your philosophical question:", string_value="")
+
+
+BEHAVIOURS = {"navigate": navigate, "quiz": quiz, "scrub": scrub, "assistant": ask}
+
+
+async def student_loop(s: Student, deadline: float, think: tuple) -> None:
+    names, weights = zip(*BEHAVIOUR_WEIGHTS.items())
+    while time.monotonic() < deadline:
+        await asyncio.sleep(random.uniform(*think))
+        try:
+            await BEHAVIOURS[random.choices(names, weights)[0]](s)
+        except LoadError:
+            # Resynchronise from a fresh full rerun, as a browser reload would
+            s.widgets = {}
+            await s.rerun("reload")
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))] if ordered else 0.0
+
+
+def server_rss_mb(pid: Optional[int]) -> Optional[float]:
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _summarize(samples: List[tuple]) -> dict:
+    latencies = [latency for _, latency, _, _ in samples]
+    return {
+        "count": len(samples),
+        "errors": sum(error for *_, error in samples),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(max(latencies, default=0) * 1000, 1),
+        "mean_kib": round(sum(size for _, _, size, _ in samples) / max(len(samples), 1) / 1024, 1),
+    }
+
+
+async def run_stage(url: str, sessions: int, duration: float, think: tuple, ramp: float,
+                    timeout: float) -> dict:
+    students = [Student(url, timeout) for _ in range(sessions)]
+    for s in students:
+        await s.connect()
+        if ramp:
+            await asyncio.sleep(ramp / sessions)
+    start = time.monotonic()
+    await asyncio.gather(*(student_loop(s, start + duration, think) for s in students))
+    elapsed = time.monotonic() - start
+    samples = [sample for s in students for sample in s.samples if sample[0] != "load"]
+    by_action = defaultdict(list)
+    for sample in samples:
+        by_action[sample[0]].append(sample)
+    result = {"sessions": sessions, "seconds": round(elapsed, 1),
+              "throughput_per_s": round(len(samples) / elapsed, 2),
+              "all": _summarize(samples),
+              "actions": {action: _summarize(group) for action, group in sorted(by_action.items())}}
+    await asyncio.gather(*(s.close() for s in students))
+    return result
+
+
+def start_server(port: int, env: dict) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(HERE, "app.py"),
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=2):
+                return server
+        except OSError:
+            if server.poll() is not None:
+                break
+            time.sleep(0.5)
+    server.kill()
+    raise LoadError("streamlit server did not become healthy")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Simulate concurrent students against one app server")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25],
+                        help="concurrent session counts, one stage each")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per stage")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.5, 2.0), metavar=("MIN", "MAX"),
+                        help="seconds a student pauses between actions")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which a stage's sessions connect")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds before an action counts as failed")
+    parser.add_argument("--assistant-latency", type=float, default=0.8,
+                        help="stub API delay before the first token, in seconds")
+    parser.add_argument("--token-latency", type=float, default=0.02, help="stub API delay between tokens")
+    parser.add_argument("--url", help="target an already running server instead of starting one")
+    parser.add_argument("--port", type=int, default=8599)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="write the results as JSON")
+    args = parser.parse_args(argv)
+    random.seed(args.seed)
+
+    server = None
+    stub = None
+    url = args.url
+    if url is None:
+        sys.path.insert(0, HERE)
+        import stub_anthropic
+
+        stub = stub_anthropic.serve(config=stub_anthropic.StubConfig(
+            first_token_latency=args.assistant_latency, token_latency=args.token_latency))
+        workdir = tempfile.mkdtemp(prefix="phl201-load-")
+        env = dict(os.environ, ANTHROPIC_API_KEY="stub", ANTHROPIC_BASE_URL=stub_anthropic.base_url(stub),
+                   PHL201_DATA_DIR=os.path.join(workdir, "data"), PHL201_CACHE_DIR=os.path.join(workdir, "cache"))
+        server = start_server(args.port, env)
+        url = f"http://127.0.0.1:{args.port}"
+
+    stages = []
+    try:
+        baseline = server_rss_mb(server and server.pid)
+        for sessions in args.sessions:
+            stage = asyncio.run(run_stage(url, sessions, args.duration, tuple(args.think),
+                                          args.ramp, args.timeout))
+            rss = server_rss_mb(server and server.pid)
+            stage["server_rss_mb"] = rss and round(rss, 1)
+            stage["rss_growth_per_session_mb"] = (round((rss - baseline) / sessions, 2)
+                                                  if rss and baseline else None)
+            stages.append(stage)
+            overall = stage["all"]
+            print(f"{sessions:>4} sessions  {stage['throughput_per_s']:>7.2f} actions/s  "
+                  f"p50 {overall['p50_ms']:>7.0f} ms  p90 {overall['p90_ms']:>7.0f} ms  "
+                  f"p99 {overall['p99_ms']:>7.0f} ms  errors {overall['errors']:>3}  "
+                  f"rss {stage['server_rss_mb'] or float('nan'):>7.1f} MB")
+            for action, summary in stage["actions"].items():
+                print(f"      {action:<16} n={summary['count']:<5} p50 {summary['p50_ms']:>7.0f} ms  "
+                      f"p99 {summary['p99_ms']:>7.0f} ms  {summary['mean_kib']:>8.1f} KiB/action")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+        if stub is not None:
+            stub.shutdown()
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"created": time.time(), "url": url, "baseline_rss_mb": baseline,
+                       "assistant_latency": args.assistant_latency, "stages": stages},
+                      f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""Propositional logic: parsing, vectorized evaluation and truth tables.
+
+Formulas use the course's symbols (¬ ∧ ∨ → ↔) or ASCII stand-ins (~ & |
+-> <->, or the words not/and/or/implies/iff). A formula is parsed once and
+compiled into a short, deduplicated program of NumPy operations with one
+step per distinct subformula. A page of the truth table is then evaluated
+in a handful of array operations, and whole-table model counts run on
+packed 64-row bitset words, so tables with 20+ variables are browsed a page
+at a time without ever materialising 2^n rows.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# Row numbers are uint64, so every row index must fit in 64 bits
+MAX_VARIABLES = 63
+# Counting models walks all 2^n rows (a few hundred ms at 26 variables); beyond
+# that only the requested page of the table is evaluated
+MAX_COUNT_VARIABLES = 26
+CHUNK_WORDS = 1 << 16  # 4M rows per bitset chunk
+
+SYMBOLS = {"not": "¬", "and": "∧", "or": "∨", "implies": "→", "iff": "↔"}
+_ALIASES = {
+    "¬": "not", "~": "not", "!": "not",
+    "∧": "and", "&": "and", "/\\": "and",
+    "∨": "or", "|": "or", "\\/": "or",
+    "→": "implies", "->": "implies", "=>": "implies",
+    "↔": "iff", "<->": "iff", "<=>": "iff", "≡": "iff",
+    "⊤": "true", "⊥": "false",
+}
+_WORDS = {"not", "and", "or", "implies", "iff", "true", "false"}
+_TOKEN = re.compile(r"\s*(?:(<->|<=>|->|=>|/\\|\\/|[¬~!∧&∨|→↔≡⊤⊥()])|([A-Za-z_][A-Za-z0-9_']*)|(\S))")
+
+# Binding strength, loosest first; → is right-associative, the rest left
+_PRECEDENCE = {"iff": 1, "implies": 2, "or": 3, "and": 4, "not": 5}
+
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+_ONE = np.uint64(1)
+
+
+class LogicSyntaxError(ValueError):
+    """A formula that cannot be parsed; ``position`` is the offending character"""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} (at character {position + 1})")
+        self.position = position
+
+
+class Node(NamedTuple):
+    op: str  # "var", "true", "false", "not", "and", "or", "implies" or "iff"
+    args: Tuple["Node", ...] = ()
+    name: str = ""
+
+
+def _tokens(text: str) -> List[Tuple[str, str, int]]:
+    """(kind, value, position) triples; kind is "op", "var", "(" or ")" """
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        symbol, word, junk = match.groups()
+        position = match.start(match.lastindex) if match.lastindex else match.start()
+        if junk is not None:
+            raise LogicSyntaxError(f"Unexpected character {junk!r}", position)
+        if symbol in ("(", ")"):
+            tokens.append((symbol, symbol, position))
+        elif symbol is not None:
+            tokens.append(("op", _ALIASES[symbol], position))
+        elif word is not None:
+            lowered = word.lower()
+            tokens.append(("op", lowered, position) if lowered in _WORDS else ("var", word, position))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokens(text)
+        self.i = 0
+
+    def _peek(self, value: str) -> bool:
+        return self.i < len(self.tokens) and self.tokens[self.i][1] == value and self.tokens[self.i][0] != "var"
+
+    def _position(self) -> int:
+        return self.tokens[self.i][2] if self.i < len(self.tokens) else len(self.text)
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise LogicSyntaxError("Empty formula", 0)
+        try:
+            node = self._iff()
+        except RecursionError:
+            # Chains of connectives and ¬ are built in loops; only nested parentheses recurse
+            raise LogicSyntaxError("Too many nested parentheses", 0) from None
+        if self.i < len(self.tokens):
+            raise LogicSyntaxError(f"Unexpected {self.tokens[self.i][1]!r}", self._position())
+        return node
+
+    def _iff(self) -> Node:
+        node = self._implies()
+        while self._peek("iff"):
+            self.i += 1
+            node = Node("iff", (node, self._implies()))
+        return node
+
+    def _implies(self) -> Node:
+        operands = [self._binary("or", self._binary_and)]
+        while self._peek("implies"):
+            self.i += 1
+            operands.append(self._binary("or", self._binary_and))
+        # → groups to the right: a → b → c is a → (b → c)
+        node = operands.pop()
+        while operands:
+            node = Node("implies", (operands.pop(), node))
+        return node
+
+    def _binary(self, op: str, operand) -> Node:
+        node = operand()
+        while self._peek(op):
+            self.i += 1
+            node = Node(op, (node, operand()))
+        return node
+
+    def _binary_and(self) -> Node:
+        return self._binary("and", self._unary)
+
+    def _unary(self) -> Node:
+        negations = 0
+        while self._peek("not"):
+            self.i += 1
+            negations += 1
+        node = self._atom()
+        for _ in range(negations):
+            node = Node("not", (node,))
+        return node
+
+    def _atom(self) -> Node:
+        if self.i >= len(self.tokens):
+            raise LogicSyntaxError("Formula ends too early", len(self.text))
+        kind, value, position = self.tokens[self.i]
+        self.i += 1
+        if kind == "var":
+            return Node("var", name=value)
+        if kind == "op" and value in ("true", "false"):
+            return Node(value)
+        if kind == "(":
+            node = self._iff()
+            if not self._peek(")"):
+                raise LogicSyntaxError("Missing closing parenthesis", self._position())
+            self.i += 1
+            return node
+        raise LogicSyntaxError(f"Expected a variable or '(' but found {value!r}", position)
+
+
+def postorder(node: Node) -> Iterator[Node]:
+    """Every node object in a tree once, children before parents, left to right.
+
+    Iterative, so formulas thousands of connectives deep are fine. Callers
+    memoize on ``id(node)``: comparing or hashing deep trees as keys would
+    recurse through them.
+    """
+    seen = set()
+    stack = [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if expanded:
+            yield current
+        elif id(current) not in seen:
+            seen.add(id(current))
+            stack.append((current, True))
+            stack.extend((child, False) for child in reversed(current.args))
+
+
+def _render(node: Node, args: List[str]) -> str:
+    """One node's text, given its children's"""
+    if node.op == "var":
+        return node.name
+    if node.op in ("true", "false"):
+        return "⊤" if node.op == "true" else "⊥"
+    if node.op == "not":
+        (child,) = node.args
+        return f"¬{args[0]}" if child.op in ("var", "true", "false", "not") else f"¬({args[0]})"
+    precedence = _PRECEDENCE[node.op]
+
+    def side(child: Node, text: str, is_left: bool) -> str:
+        child_precedence = _PRECEDENCE.get(child.op, 6)
+        # → groups to the right, the others to the left
+        tight = is_left if node.op == "implies" else not is_left
+        if child_precedence < precedence or (child_precedence == precedence and tight):
+            return f"({text})"
+        return text
+
+    left, right = node.args
+    return f"{side(left, args[0], True)} {SYMBOLS[node.op]} {side(right, args[1], False)}"
+
+
+def to_text(node: Node) -> str:
+    """Render a formula in the course's symbols with only the parentheses it needs"""
+    texts: Dict[int, str] = {}
+    for current in postorder(node):
+        texts[id(current)] = _render(current, [texts[id(child)] for child in current.args])
+    return texts[id(node)]
+
+
+def parse_tree(text: str) -> Node:
+    """Parse a formula without compiling it, for callers with no variable limit"""
+    return _Parser(text).parse()
+
+
+def variables(node: Node) -> List[str]:
+    """The formula's variable names in natural order (x2 before x10)"""
+    names: set = set()
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.op == "var":
+            names.add(node.name)
+        stack.extend(node.args)
+    return sorted(names, key=natural_key)
+
+
+def natural_key(name: str):
+    """Sort key that orders x2 before x10"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+class Formula:
+    """A parsed formula compiled to a vectorized evaluation program"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.root = parse_tree(text)
+        self.variables: Tuple[str, ...] = tuple(variables(self.root))
+        if len(self.variables) > MAX_VARIABLES:
+            raise LogicSyntaxError(f"At most {MAX_VARIABLES} variables are supported", 0)
+        # Straight-line program: one step per distinct subformula, children first
+        self._steps: List[Tuple[str, Tuple[int, ...]]] = []
+        nodes: List[Node] = []
+        index: Dict[Tuple[str, str, Tuple[int, ...]], int] = {}  # (op, name, argument steps) -> step
+        steps: Dict[int, int] = {}  # id(node) -> step
+        texts: Dict[int, str] = {}
+        for node in [Node("var", name=name) for name in self.variables] + list(postorder(self.root)):
+            args = tuple(steps[id(child)] for child in node.args)
+            key = (node.op, node.name, args)
+            if key not in index:
+                index[key] = len(self._steps)
+                self._steps.append((node.op, args))
+                nodes.append(node)
+            steps[id(node)] = index[key]
+            texts[id(node)] = _render(node, [texts[id(child)] for child in node.args])
+        # One column per variable and compound subformula; the formula itself is always last
+        root = steps[id(self.root)]
+        shown = [i for i, node in enumerate(nodes) if node.op not in ("true", "false") or i == root]
+        self.columns: Tuple[str, ...] = tuple(texts[id(nodes[i])] for i in shown)
+        self._column_steps = shown
+        self._models: Optional[int] = None
+
+    def __str__(self) -> str:
+        return to_text(self.root)
+
+    @property
+    def row_count(self) -> int:
+        return 1 << len(self.variables)
+
+    def _run(self, inputs: List[np.ndarray], true: np.ndarray, false: np.ndarray) -> List[np.ndarray]:
+        """Execute the program; works on bool rows and on uint64 bitset words alike"""
+        values: List[np.ndarray] = []
+        for op, args in self._steps:
+            if op == "var":
+                values.append(inputs[len(values)])
+            elif op == "true":
+                values.append(true)
+            elif op == "false":
+                values.append(false)
+            elif op == "not":
+                values.append(~values[args[0]])
+            else:
+                a, b = values[args[0]], values[args[1]]
+                if op == "and":
+                    values.append(a & b)
+                elif op == "or":
+                    values.append(a | b)
+                elif op == "implies":
+                    values.append(~a | b)
+                else:
+                    values.append(~(a ^ b))
+        return values
+
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """Boolean matrix of rows ``start..stop-1`` with one column per entry of ``columns``.
+
+        Row 0 has every variable true, and the first variable changes slowest,
+        as in a textbook truth table.
+        """
+        n = len(self.variables)
+        stop = min(stop, self.row_count)
+        index = np.arange(start, max(stop, start), dtype=np.uint64)
+        inputs = [((index >> np.uint64(n - 1 - i)) & _ONE) == 0 for i in range(n)]
+        values = self._run(inputs, np.ones(len(index), dtype=bool), np.zeros(len(index), dtype=bool))
+        return np.column_stack([np.broadcast_to(values[i], index.shape) for i in self._column_steps]) \
+            if len(index) else np.zeros((0, len(self.columns)), dtype=bool)
+
+    def pages(self, page_rows: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """Stream the whole table as (first row, matrix) pages"""
+        for start in range(0, self.row_count, page_rows):
+            yield start, self.rows(start, start + page_rows)
+
+    def _word_inputs(self, words: np.ndarray) -> List[np.ndarray]:
+        """Each variable's truth values for 64 rows per uint64 word"""
+        n = len(self.variables)
+        inputs = []
+        for i in range(n):
+            shift = n - 1 - i
+            if shift < 6:
+                # Low variables repeat the same pattern in every word
+                lanes = [lane for lane in range(64) if not (lane >> shift) & 1]
+                pattern = np.uint64(sum(1 << lane for lane in lanes))
+                inputs.append(np.full(len(words), pattern, dtype=np.uint64))
+            else:
+                # High variables are constant across a word: all ones or all zeros
+                inputs.append(((words >> np.uint64(shift - 6)) & _ONE) - _ONE)
+        return inputs
+
+    def count_models(self) -> int:
+        """How many rows make the formula true, counted 64 rows per machine word"""
+        if self._models is None:
+            n = len(self.variables)
+            if n > MAX_COUNT_VARIABLES:
+                raise ValueError(f"Counting models is limited to {MAX_COUNT_VARIABLES} variables")
+            if n < 6:
+                self._models = int(self.rows(0, self.row_count)[:, -1].sum())
+            else:
+                total = 0
+                word_count = 1 << (n - 6)
+                for first in range(0, word_count, CHUNK_WORDS):
+                    words = np.arange(first, min(first + CHUNK_WORDS, word_count), dtype=np.uint64)
+                    result = self._run(self._word_inputs(words), np.full(len(words), _ALL_ONES),
+                                       np.zeros(len(words), dtype=np.uint64))[-1]
+                    total += int(np.bitwise_count(result).sum())
+                self._models = total
+        return self._models
+
+    def classify(self) -> str:
+        """"tautology", "contradiction" or "contingent" """
+        models = self.count_models()
+        if models == self.row_count:
+            return "tautology"
+        return "contradiction" if models == 0 else "contingent"
+
+
+@lru_cache(maxsize=512)
+def parse(text: str) -> Formula:
+    """Parse and compile a formula; repeated texts share one compiled Formula"""
+    return Formula(text)
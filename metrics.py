@@ -0,0 +1,204 @@
+"""Low-overhead timing spans for the app's hot paths.
+
+Each span name keeps a fixed-bucket latency histogram: cumulative counts
+for export, plus per-minute slices so recent percentiles can be read
+without storing individual samples. Recording a span is a perf_counter
+pair, a bisect and a few integer increments under one lock, cheap enough
+to leave on in production.
+
+Snapshots can be written periodically for outside collectors, either in
+the Prometheus text exposition format (for node_exporter's textfile
+collector) or as JSON lines:
+
+    METRICS_EXPORT_PATH=/var/lib/node_exporter/phl201.prom
+    METRICS_EXPORT_PATH=.data/metrics.jsonl
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+# Bucket upper bounds in seconds; the last bucket is +Inf
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SLICE_SECONDS = 60
+MAX_WINDOW_SECONDS = 15 * 60
+METRIC_NAME = "phl201_span_seconds"
+DEFAULT_EXPORT_PATH = os.path.join(os.environ.get("PHL201_DATA_DIR", ".data"), "metrics.prom")
+
+
+class _Slice:
+    __slots__ = ("index", "counts", "sum", "max")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class Histogram:
+    """Cumulative bucket counts plus a rolling window of per-minute slices"""
+
+    __slots__ = ("counts", "sum", "_slices")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self._slices: Deque[_Slice] = deque(maxlen=MAX_WINDOW_SECONDS // SLICE_SECONDS)
+
+    def observe(self, seconds: float, now: float) -> None:
+        bucket = bisect_left(BUCKETS, seconds)
+        self.counts[bucket] += 1
+        self.sum += seconds
+        index = int(now // SLICE_SECONDS)
+        if not self._slices or self._slices[-1].index != index:
+            self._slices.append(_Slice(index))
+        current = self._slices[-1]
+        current.counts[bucket] += 1
+        current.sum += seconds
+        if seconds > current.max:
+            current.max = seconds
+
+    def window(self, seconds: float, now: float) -> Tuple[List[int], float, float]:
+        """Bucket counts, sum and max over roughly the last ``seconds``"""
+        oldest = int(now // SLICE_SECONDS) - max(int(seconds // SLICE_SECONDS), 1) + 1
+        counts = [0] * (len(BUCKETS) + 1)
+        total = peak = 0.0
+        for piece in self._slices:
+            if piece.index >= oldest:
+                counts = [a + b for a, b in zip(counts, piece.counts)]
+                total += piece.sum
+                peak = max(peak, piece.max)
+        return counts, total, peak
+
+
+def quantile(counts: List[int], q: float, peak: float = 0.0) -> float:
+    """Estimate a quantile by interpolating inside the bucket that holds it"""
+    n = sum(counts)
+    if not n:
+        return 0.0
+    rank = q * n
+    seen = 0
+    for i, c in enumerate(counts):
+        if c and seen + c >= rank:
+            lower = BUCKETS[i - 1] if i else 0.0
+            upper = BUCKETS[i] if i < len(BUCKETS) else max(peak, lower)
+            estimate = lower + (upper - lower) * (rank - seen) / c
+            return min(estimate, peak) if peak else estimate
+        seen += c
+    return peak
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Thread-safe registry of span histograms shared by every session"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        now = time.time()
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds, now)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def summary(self, window_seconds: float = 300) -> List[dict]:
+        """Per-span count and latency percentiles (ms) over a recent window"""
+        now = time.time()
+        rows = []
+        with self._lock:
+            windows = {name: h.window(window_seconds, now) for name, h in self._histograms.items()}
+        for name, (counts, total, peak) in sorted(windows.items()):
+            n = sum(counts)
+            if n:
+                rows.append({"span": name, "count": n, "mean_ms": round(total / n * 1000, 2),
+                             "p50_ms": round(quantile(counts, 0.5, peak) * 1000, 2),
+                             "p90_ms": round(quantile(counts, 0.9, peak) * 1000, 2),
+                             "p99_ms": round(quantile(counts, 0.99, peak) * 1000, 2),
+                             "max_ms": round(peak * 1000, 2)})
+        return rows
+
+    def _snapshot(self) -> List[Tuple[str, List[int], float]]:
+        with self._lock:
+            return [(name, list(h.counts), h.sum) for name, h in sorted(self._histograms.items())]
+
+    def prometheus_text(self) -> str:
+        lines = [f"# HELP {METRIC_NAME} Time spent in instrumented app hot paths",
+                 f"# TYPE {METRIC_NAME} histogram"]
+        for name, counts, total in self._snapshot():
+            span = _label(name)
+            cumulative = 0
+            for bound, c in zip(BUCKETS + (float("inf"),), counts):
+                cumulative += c
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{METRIC_NAME}_bucket{{span="{span}",le="{le}"}} {cumulative}')
+            lines.append(f'{METRIC_NAME}_sum{{span="{span}"}} {total!r}')
+            lines.append(f'{METRIC_NAME}_count{{span="{span}"}} {cumulative}')
+        return "\n".join(lines) + "\n"
+
+    def json_lines(self) -> str:
+        now = round(time.time(), 3)
+        return "".join(json.dumps({"ts": now, "span": name, "count": sum(counts), "sum": total,
+                                   "buckets": dict(zip(map(repr, BUCKETS + (float("inf"),)), counts))},
+                                  ensure_ascii=False) + "\n"
+                       for name, counts, total in self._snapshot())
+
+    def export(self, path: str) -> None:
+        """Write a Prometheus text file (replaced atomically) or append JSON lines"""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if path.endswith(".jsonl"):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(self.json_lines())
+            return
+        # The textfile collector may read at any moment, so never expose a partial file
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp, path)
+
+
+class Exporter:
+    """Background thread that exports a snapshot every ``interval`` seconds"""
+
+    def __init__(self, metrics: Metrics, path: str, interval: float = 15.0):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self.exports = 0
+        self.last_error: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.metrics.export(self.path)
+                self.exports += 1
+                self.last_error = None
+            except OSError as e:
+                self.last_error = str(e)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=5)
@@ -0,0 +1,130 @@
+"""Durable quiz progress that survives reconnects and server restarts.
+
+Saves are queued in memory and written by one background thread in
+batched transactions against a SQLite database in WAL mode, so answering a
+question never waits on disk. Repeated saves for the same student before a
+flush are coalesced into one row write, and loads see queued saves
+immediately.
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_PATH = os.path.join(os.environ.get("PHL201_DATA_DIR", ".data"), "progress.sqlite3")
+
+# Session-state fields that make up a student's quiz progress
+PROGRESS_FIELDS = ("quiz_seed", "current", "score", "answered", "selected_answer", "feedback")
+
+
+class ProgressStore:
+    """Write-behind progress store backed by SQLite"""
+
+    def __init__(self, path: str = DEFAULT_PATH, flush_interval: float = 0.5, max_batch: int = 500):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS progress ("
+            " student_id TEXT PRIMARY KEY, state TEXT NOT NULL, updated REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self._db_lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # Batch currently being written, still visible to load()
+        self._inflight: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self.saves = 0
+        self.rows_written = 0
+        self.batches = 0
+        self._writer = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def save(self, student_id: str, state: Dict[str, Any]) -> None:
+        """Queue a snapshot of a student's progress; returns immediately"""
+        with self._cond:
+            self._pending[student_id] = dict(state)
+            self.saves += 1
+            if len(self._pending) >= self.max_batch:
+                self._cond.notify()
+
+    def load(self, student_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            for queued in (self._pending, self._inflight):
+                if student_id in queued:
+                    return dict(queued[student_id])
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT state FROM progress WHERE student_id = ?", (student_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write(self, batch: Dict[str, Dict[str, Any]]) -> None:
+        now = time.time()
+        rows = [(sid, json.dumps(state), now) for sid, state in batch.items()]
+        with self._db_lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO progress (student_id, state, updated) VALUES (?, ?, ?)"
+                    " ON CONFLICT(student_id) DO UPDATE SET state = excluded.state,"
+                    " updated = excluded.updated", rows)
+        with self._cond:
+            self._inflight = {}
+            self.rows_written += len(rows)
+            self.batches += 1
+
+    def _take_batch(self) -> Dict[str, Dict[str, Any]]:
+        batch, self._pending = self._pending, {}
+        self._inflight = batch
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                # Let saves accumulate for one interval unless a full batch is ready
+                if len(self._pending) < self.max_batch and not self._closed:
+                    self._cond.wait(self.flush_interval)
+                closed = self._closed
+                batch = self._take_batch()
+            if batch:
+                try:
+                    self._write(batch)
+                except sqlite3.Error:
+                    # Put the batch back (newer saves win) and retry on the next tick
+                    with self._cond:
+                        self._pending = {**batch, **self._pending}
+                        self._inflight = {}
+                    time.sleep(self.flush_interval)
+            if closed:
+                return
+
+    def flush(self) -> None:
+        """Synchronously write everything queued so far"""
+        with self._cond:
+            batch = self._take_batch()
+        if batch:
+            self._write(batch)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._writer.join(timeout=5)
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {"saves": self.saves, "pending": len(self._pending),
+                    "rows_written": self.rows_written, "batches": self.batches}
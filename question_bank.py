@@ -0,0 +1,125 @@
+"""Quiz question bank loaded from JSON or CSV.
+
+A bank file is parsed once per process into an immutable tuple of
+``Question`` records that every session shares; sessions keep only an
+integer seed (which ordering) and a cursor (how far they are). The file is
+re-read automatically when it changes on disk.
+
+JSON files hold a list of ``{"question", "options", "answer"}`` objects
+where ``answer`` is the 0-based index of the correct option. CSV files have
+``question``, ``options`` (separated by ``|``) and ``answer`` columns.
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+import warnings
+from typing import Dict, NamedTuple, Tuple
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.json")
+RELOAD_CHECK_SECONDS = 2.0
+
+
+class Question(NamedTuple):
+    text: str
+    options: Tuple[str, ...]
+    answer: int
+
+    @property
+    def correct_option(self) -> str:
+        return self.options[self.answer]
+
+
+def _question(text, options, answer, where: str) -> Question:
+    options = tuple(str(o) for o in options)
+    answer = int(answer)
+    if not text or len(options) < 2:
+        raise ValueError(f"{where}: a question needs text and at least two options")
+    if not 0 <= answer < len(options):
+        raise ValueError(f"{where}: answer index {answer} is out of range")
+    return Question(str(text), options, answer)
+
+
+def parse_file(path: str) -> Tuple[Question, ...]:
+    """Parse a JSON or CSV bank into validated, immutable questions"""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            return tuple(_question(row["question"], row["options"].split("|"), row["answer"],
+                                   f"{path}:{line}")
+                         for line, row in enumerate(csv.DictReader(f), start=2))
+    with open(path, encoding="utf-8") as f:
+        items = json.load(f)
+    return tuple(_question(item["question"], item["options"], item["answer"], f"{path}[{i}]")
+                 for i, item in enumerate(items))
+
+
+class QuestionBank:
+    """Immutable question store with seeded orderings"""
+
+    def __init__(self, questions: Tuple[Question, ...], version: float = 0.0):
+        self.questions = questions
+        self.version = version
+        self._orders: Dict[int, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __getitem__(self, index: int) -> Question:
+        return self.questions[index]
+
+    def order(self, seed: int) -> Tuple[int, ...]:
+        """Question indices for a quiz run; seed 0 keeps the course order"""
+        order = self._orders.get(seed)
+        if order is None:
+            if seed == 0:
+                order = tuple(range(len(self.questions)))
+            else:
+                # numpy is only needed for shuffled runs, so keep it off the quiz's import path
+                import numpy as np
+
+                order = tuple(np.random.default_rng(seed).permutation(len(self.questions)).tolist())
+            if len(self._orders) < 256:
+                self._orders[seed] = order
+        return order
+
+    def at(self, seed: int, cursor: int) -> Question:
+        return self.questions[self.order(seed)[cursor]]
+
+
+class _Registry:
+    """Process-wide bank per path, reloaded when the file's mtime changes"""
+
+    def __init__(self):
+        self._banks: Dict[str, Tuple[float, float, QuestionBank]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> QuestionBank:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._banks.get(path)
+            if entry is not None and now - entry[0] < RELOAD_CHECK_SECONDS:
+                return entry[2]
+            mtime = os.stat(path).st_mtime
+            if entry is not None and entry[1] == mtime:
+                bank = entry[2]
+            elif entry is None:
+                bank = QuestionBank(parse_file(path), version=mtime)
+            else:
+                try:
+                    bank = QuestionBank(parse_file(path), version=mtime)
+                except (ValueError, KeyError) as e:
+                    # Keep serving the last good bank while an edit is half-finished
+                    warnings.warn(f"Question bank reload failed, keeping previous version: {e}")
+                    bank = entry[2]
+            self._banks[path] = (now, mtime, bank)
+            return bank
+
+
+_registry = _Registry()
+
+
+def load(path: str = DEFAULT_PATH) -> QuestionBank:
+    """The shared bank for ``path``, re-parsed only if the file changed"""
+    return _registry.get(path)
@@ -0,0 +1,118 @@
+"""Disk-backed cache of assistant answers for the suggested questions.
+
+Entries are keyed on (model, system prompt hash, normalized question,
+temperature bucket) and stored in SQLite so they survive restarts and are
+shared by every worker on the host. Run this module to pre-warm the cache
+at deploy time:
+
+    ANTHROPIC_API_KEY=... python response_cache.py --prewarm
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_PATH = os.path.join(os.environ.get("PHL201_CACHE_DIR", ".cache"), "responses.sqlite3")
+
+
+def normalize_question(question: str) -> str:
+    """Collapse case and whitespace so trivially different prompts share an entry"""
+    return " ".join(question.lower().split())
+
+
+def make_key(model: str, system_prompt: str, question: str, temperature: float) -> str:
+    prompt_hash = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+    bucket = f"{round(temperature, 1):.1f}"
+    raw = "\x1f".join((model, prompt_hash, normalize_question(question), bucket))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite response store with TTL expiry and LRU eviction"""
+
+    def __init__(self, path: str = DEFAULT_PATH, ttl_seconds: Optional[float] = 7 * 24 * 3600,
+                 max_entries: int = 500):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, model TEXT, question TEXT, answer TEXT,"
+            " created REAL, last_used REAL)"
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, system_prompt: str, question: str, temperature: float) -> Optional[str]:
+        key = make_key(model, system_prompt, question, temperature)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answer, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl_seconds is not None and now - row[1] >= self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, model: str, system_prompt: str, question: str, temperature: float, answer: str) -> None:
+        key = make_key(model, system_prompt, question, temperature)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, normalize_question(question), answer, now, now))
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses"
+                " ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_entries,))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+            }
+
+
+def prewarm(client, cache: ResponseCache) -> int:
+    """Answer every suggested question that isn't cached yet; returns how many were fetched"""
+    import assistant
+
+    fetched = 0
+    for question in assistant.SUGGESTED_QUESTIONS.values():
+        if cache.get(assistant.MODEL, assistant.SYSTEM_PROMPT, question, assistant.TEMPERATURE) is None:
+            answer = assistant.ask(client, question)
+            cache.put(assistant.MODEL, assistant.SYSTEM_PROMPT, question, assistant.TEMPERATURE, answer)
+            fetched += 1
+    return fetched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the assistant response cache")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="cache database path")
+    parser.add_argument("--prewarm", action="store_true", help="fetch answers for the suggested questions")
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.db)
+    if args.prewarm:
+        import anthropic
+
+        fetched = prewarm(anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"]), cache)
+        print(f"Pre-warmed {fetched} suggested question(s)")
+    print(cache.stats())
@@ -0,0 +1,53 @@
+"""Frequency-aware sampling and shape-preserving decimation for 2D traces.
+
+Points are generated from the signal's angular frequency rather than a
+fixed count, then reduced to a pixel budget with min/max buckets so peaks
+survive while the payload sent to the browser stays flat.
+"""
+
+import math
+from typing import Callable, Tuple
+
+import numpy as np
+
+SAMPLES_PER_PERIOD = 64
+PIXEL_BUDGET = 800
+
+
+def adaptive_linspace(start: float, stop: float, angular_frequency: float,
+                      samples_per_period: int = SAMPLES_PER_PERIOD,
+                      min_samples: int = 2, max_samples: int = 200_000) -> np.ndarray:
+    """Evenly spaced positions with enough points per period of the signal"""
+    periods = abs(stop - start) * abs(angular_frequency) / (2 * np.pi)
+    n = math.ceil(periods * samples_per_period) + 1
+    return np.linspace(start, stop, int(min(max(n, min_samples), max_samples)))
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, pixel_budget: int = PIXEL_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the min and max of each bucket so the drawn envelope is unchanged.
+
+    Returns at most ``pixel_budget`` points (two per bucket) in the original
+    order, always including the first and last sample.
+    """
+    n = len(y)
+    if n <= pixel_budget:
+        return x, y
+    buckets = max((pixel_budget - 2) // 2, 1)
+    width = math.ceil(n / buckets)
+    padded = np.full(buckets * width, np.nan)
+    padded[:n] = y
+    grid = padded.reshape(buckets, width)
+    # Trailing buckets can be pure padding when n doesn't divide evenly
+    valid = ~np.all(np.isnan(grid), axis=1)
+    offsets = np.arange(buckets)[valid] * width
+    lo = offsets + np.nanargmin(grid[valid], axis=1)
+    hi = offsets + np.nanargmax(grid[valid], axis=1)
+    keep = np.unique(np.concatenate(([0, n - 1], lo, hi)))
+    return x[keep], y[keep]
+
+
+def sample_trace(fn: Callable[[np.ndarray], np.ndarray], start: float, stop: float,
+                 angular_frequency: float, pixel_budget: int = PIXEL_BUDGET) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample ``fn`` faithfully over [start, stop], then fit it to the pixel budget"""
+    x = adaptive_linspace(start, stop, angular_frequency)
+    return minmax_decimate(x, fn(x), pixel_budget)
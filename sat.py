@@ -0,0 +1,428 @@
+"""Validity checking for propositional arguments with a CDCL SAT solver.
+
+An argument is valid when its premises together with the negated
+conclusion are unsatisfiable. Premises and conclusion are turned into CNF
+directly where a premise is already a conjunction of clauses, and with the
+Tseitin encoding (one fresh variable per distinct nested subformula)
+elsewhere, so the clause count grows linearly with the argument. The solver is a
+conflict-driven clause-learning (CDCL) solver with two watched literals,
+first-UIP learning, activity-based branching, phase saving and Luby
+restarts. It is incremental: each premise set keeps one solver, and every
+conclusion checked against it is tried under an assumption, so learnt
+clauses carry over from one check to the next. Verdicts are memoized on
+the canonical form of the argument, with premises deduplicated and sorted.
+"""
+
+import heapq
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import logic
+
+RESTART_BASE = 100  # conflicts per Luby unit
+_CONCLUSION = re.compile(r"^(?:∴|therefore\b|hence\b|so\b|thus\b)[\s,:]*", re.IGNORECASE)
+_NUMBERING = re.compile(r"^(?:\(?\d+[.):]|premise\s*\d*\s*:|conclusion\s*:)\s*", re.IGNORECASE)
+
+
+def _luby(i: int) -> int:
+    """The i-th (1-based) term of the Luby sequence 1 1 2 1 1 2 4 ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class Solver:
+    """Incremental CDCL solver over DIMACS-style integer literals"""
+
+    def __init__(self):
+        self.num_vars = 0
+        self.ok = True  # False once the clauses are unsatisfiable without assumptions
+        self.model: List[int] = []
+        self.conflicts = 0
+        self.decisions = 0
+        self.clauses = 0
+        self.learnt = 0
+        self._value = [0]  # per variable: 1 true, -1 false, 0 unassigned
+        self._level = [0]
+        self._reason: List[Optional[List[int]]] = [None]
+        self._activity = [0.0]
+        self._phase = [-1]
+        self._watches: Dict[int, List[List[int]]] = {}
+        self._trail: List[int] = []
+        self._trail_lim: List[int] = []
+        self._head = 0
+        self._heap: List[Tuple[float, int]] = []
+        self._bump = 1.0
+
+    def new_var(self) -> int:
+        self.num_vars += 1
+        v = self.num_vars
+        self._value.append(0)
+        self._level.append(0)
+        self._reason.append(None)
+        self._activity.append(0.0)
+        self._phase.append(-1)
+        self._watches[v] = []
+        self._watches[-v] = []
+        heapq.heappush(self._heap, (0.0, v))
+        return v
+
+    def _lit_value(self, lit: int) -> int:
+        value = self._value[abs(lit)]
+        return value if lit > 0 else -value
+
+    def _assign(self, lit: int, reason: Optional[List[int]]) -> None:
+        v = abs(lit)
+        self._value[v] = 1 if lit > 0 else -1
+        self._level[v] = len(self._trail_lim)
+        self._reason[v] = reason
+        self._trail.append(lit)
+
+    def add_clause(self, lits: Sequence[int]) -> bool:
+        """Add a permanent clause; returns False if the clauses became unsatisfiable"""
+        if not self.ok:
+            return False
+        self._backtrack(0)
+        clause = []
+        for lit in dict.fromkeys(lits):
+            value = self._lit_value(lit)
+            if value == 1 or -lit in clause:
+                return True  # already satisfied, or a tautology
+            if value == 0:
+                clause.append(lit)
+        self.clauses += 1
+        if not clause:
+            self.ok = False
+        elif len(clause) == 1:
+            self._assign(clause[0], None)
+            self.ok = self._propagate() is None
+        else:
+            self._watches[clause[0]].append(clause)
+            self._watches[clause[1]].append(clause)
+        return self.ok
+
+    def _propagate(self) -> Optional[List[int]]:
+        """Unit propagation; returns a conflicting clause, if any"""
+        value = self._value
+        while self._head < len(self._trail):
+            false_lit = -self._trail[self._head]
+            self._head += 1
+            watching = self._watches[false_lit]
+            kept = []
+            i = 0
+            while i < len(watching):
+                clause = watching[i]
+                i += 1
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], clause[0]
+                first = clause[0]
+                first_value = value[abs(first)] if first > 0 else -value[abs(first)]
+                if first_value == 1:
+                    kept.append(clause)
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if (value[abs(lit)] if lit > 0 else -value[abs(lit)]) != -1:
+                        clause[1], clause[k] = lit, false_lit
+                        self._watches[lit].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if first_value == -1:
+                        kept.extend(watching[i:])
+                        self._watches[false_lit] = kept
+                        return clause
+                    self._assign(first, clause)
+            self._watches[false_lit] = kept
+        return None
+
+    def _bump_var(self, v: int) -> None:
+        self._activity[v] += self._bump
+        if self._activity[v] > 1e100:
+            self._activity = [a * 1e-100 for a in self._activity]
+            self._bump *= 1e-100
+            self._heap = [(-self._activity[u], u) for u in range(1, self.num_vars + 1) if not self._value[u]]
+            heapq.heapify(self._heap)
+        elif not self._value[v]:
+            heapq.heappush(self._heap, (-self._activity[v], v))
+
+    def _analyze(self, conflict: List[int]) -> Tuple[List[int], int]:
+        """First-UIP learnt clause (asserting literal first) and the level to jump back to"""
+        level = len(self._trail_lim)
+        seen = set()
+        learnt = [0]
+        pending = 0
+        index = len(self._trail) - 1
+        clause, skip = conflict, 0
+        while True:
+            for lit in clause[skip:]:
+                v = abs(lit)
+                if v not in seen and self._level[v] > 0:
+                    seen.add(v)
+                    self._bump_var(v)
+                    if self._level[v] == level:
+                        pending += 1
+                    else:
+                        learnt.append(lit)
+            while abs(self._trail[index]) not in seen:
+                index -= 1
+            uip = self._trail[index]
+            index -= 1
+            pending -= 1
+            if not pending:
+                break
+            # The implied literal sits first in its reason clause
+            clause, skip = self._reason[abs(uip)], 1
+        learnt[0] = -uip
+        self._bump *= 1.05
+        if len(learnt) == 1:
+            return learnt, 0
+        # Watch the literal from the highest remaining level second
+        best = max(range(1, len(learnt)), key=lambda j: self._level[abs(learnt[j])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self._level[abs(learnt[1])]
+
+    def _backtrack(self, level: int) -> None:
+        if len(self._trail_lim) <= level:
+            return
+        for lit in self._trail[self._trail_lim[level]:]:
+            v = abs(lit)
+            self._phase[v] = self._value[v]
+            self._value[v] = 0
+            self._reason[v] = None
+            heapq.heappush(self._heap, (-self._activity[v], v))
+        del self._trail[self._trail_lim[level]:]
+        del self._trail_lim[level:]
+        self._head = len(self._trail)
+
+    def _pick(self) -> int:
+        while self._heap:
+            _, v = heapq.heappop(self._heap)
+            if not self._value[v]:
+                return v if self._phase[v] > 0 else -v
+        return 0
+
+    def solve(self, assumptions: Sequence[int] = ()) -> bool:
+        """Satisfiable with every assumption literal true? On success ``model`` holds one solution"""
+        self.model = []
+        if not self.ok:
+            return False
+        self._backtrack(0)
+        if self._propagate() is not None:
+            self.ok = False
+            return False
+        restart = 1
+        budget = RESTART_BASE * _luby(restart)
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                budget -= 1
+                if not self._trail_lim:
+                    self.ok = False
+                    return False
+                learnt, level = self._analyze(conflict)
+                self._backtrack(level)
+                if len(learnt) == 1:
+                    self._assign(learnt[0], None)
+                else:
+                    self._watches[learnt[0]].append(learnt)
+                    self._watches[learnt[1]].append(learnt)
+                    self.learnt += 1
+                    self._assign(learnt[0], learnt)
+                continue
+            if budget <= 0:
+                restart += 1
+                budget = RESTART_BASE * _luby(restart)
+                self._backtrack(0)
+                continue
+            depth = len(self._trail_lim)
+            if depth < len(assumptions):
+                # Assumptions are the first decisions, one level each
+                lit = assumptions[depth]
+                value = self._lit_value(lit)
+                if value == -1:
+                    self._backtrack(0)
+                    return False
+                self._trail_lim.append(len(self._trail))
+                if value == 0:
+                    self._assign(lit, None)
+                continue
+            lit = self._pick()
+            if not lit:
+                self.model = list(self._value)
+                self._backtrack(0)
+                return True
+            self.decisions += 1
+            self._trail_lim.append(len(self._trail))
+            self._assign(lit, None)
+
+
+class Encoder:
+    """Tseitin encoding of formulas into a Solver; shared subformulas share a variable"""
+
+    def __init__(self, solver: Solver):
+        self.solver = solver
+        self.atoms: Dict[str, int] = {}
+        self._literals: Dict[Tuple[str, str, Tuple[int, ...]], int] = {}
+        self._true = 0
+
+    def assert_formula(self, node: logic.Node) -> None:
+        """Add ``node`` as a fact, turning its top-level ∧ and ∨ straight into clauses"""
+        conjuncts = [node]
+        while conjuncts:
+            current = conjuncts.pop()
+            op, args = current.op, current.args
+            if op == "and":
+                conjuncts.extend(args)
+                continue
+            if op == "not" and args[0].op in ("not", "or", "implies"):
+                inner = args[0]
+                if inner.op == "not":
+                    conjuncts.append(inner.args[0])
+                elif inner.op == "or":  # ¬(a ∨ b) is ¬a ∧ ¬b
+                    conjuncts.extend(logic.Node("not", (child,)) for child in inner.args)
+                else:  # ¬(a → b) is a ∧ ¬b
+                    conjuncts.extend((inner.args[0], logic.Node("not", (inner.args[1],))))
+                continue
+            clause = []
+            disjuncts = [current]
+            while disjuncts:
+                current = disjuncts.pop()
+                if current.op == "or":
+                    disjuncts.extend(current.args)
+                elif current.op == "implies":
+                    disjuncts.extend((logic.Node("not", (current.args[0],)), current.args[1]))
+                else:
+                    clause.append(self.literal(current))
+            self.solver.add_clause(clause)
+
+    def literal(self, node: logic.Node) -> int:
+        """A literal that is true exactly when ``node`` is"""
+        # Iterative walk, so long chains of connectives don't hit the recursion limit; subformulas are
+        # shared by (op, name, argument literals), which never compares whole trees
+        literals: Dict[int, int] = {}
+        for current in logic.postorder(node):
+            args = tuple(literals[id(child)] for child in current.args)
+            key = (current.op, current.name, args)
+            if key not in self._literals:
+                self._literals[key] = self._encode(current.op, current.name, args)
+            literals[id(current)] = self._literals[key]
+        return literals[id(node)]
+
+    def _encode(self, op: str, name: str, args: Tuple[int, ...]) -> int:
+        solver = self.solver
+        if op == "var":
+            if name not in self.atoms:
+                self.atoms[name] = solver.new_var()
+            return self.atoms[name]
+        if op in ("true", "false"):
+            if not self._true:
+                self._true = solver.new_var()
+                solver.add_clause([self._true])
+            return self._true if op == "true" else -self._true
+        if op == "not":
+            return -args[0]
+        a, b = args
+        if op == "implies":
+            a = -a
+        x = solver.new_var()
+        if op == "and":
+            clauses = [[-x, a], [-x, b], [x, -a, -b]]
+        elif op in ("or", "implies"):
+            clauses = [[x, -a], [x, -b], [-x, a, b]]
+        else:
+            clauses = [[-x, -a, b], [-x, a, -b], [x, a, b], [x, -a, -b]]
+        for clause in clauses:
+            solver.add_clause(clause)
+        return x
+
+
+class Verdict(NamedTuple):
+    valid: bool
+    # Atom values that make every premise true and the conclusion false
+    counter_model: Optional[Dict[str, bool]]
+    consistent: bool  # whether the premises can all be true at once
+    atoms: int
+    clauses: int
+    conflicts: int
+
+
+class _PremiseSet:
+    """One incremental solver holding a premise set's clauses"""
+
+    def __init__(self, premises: Tuple[str, ...]):
+        self.solver = Solver()
+        self.encoder = Encoder(self.solver)
+        self.lock = threading.Lock()
+        self.atoms = set()
+        for premise in premises:
+            tree = logic.parse_tree(premise)
+            self.atoms.update(logic.variables(tree))
+            self.encoder.assert_formula(tree)
+        self.consistent = self.solver.solve()
+
+    def check(self, conclusion: str) -> Verdict:
+        tree = logic.parse_tree(conclusion)
+        with self.lock:
+            conflicts = self.solver.conflicts
+            goal = self.encoder.literal(tree)
+            valid = not self.solver.solve([-goal])
+            counter_model = None
+            if not valid:
+                model = self.solver.model
+                names = sorted(self.atoms.union(logic.variables(tree)), key=logic.natural_key)
+                counter_model = {name: model[self.encoder.atoms[name]] > 0 for name in names}
+            return Verdict(valid, counter_model, self.consistent, len(self.encoder.atoms), self.solver.clauses,
+                           self.solver.conflicts - conflicts)
+
+
+@lru_cache(maxsize=64)
+def _premise_set(premises: Tuple[str, ...]) -> _PremiseSet:
+    return _PremiseSet(premises)
+
+
+@lru_cache(maxsize=1024)
+def _check(premises: Tuple[str, ...], conclusion: str) -> Verdict:
+    return _premise_set(premises).check(conclusion)
+
+
+def check_argument(premises: Sequence[str], conclusion: str) -> Verdict:
+    """Decide whether ``conclusion`` follows from ``premises``.
+
+    Raises logic.LogicSyntaxError for a formula that cannot be parsed.
+    """
+    canonical = tuple(sorted({logic.to_text(logic.parse_tree(p)) for p in premises}))
+    return _check(canonical, logic.to_text(logic.parse_tree(conclusion)))
+
+
+def split_argument(text: str) -> Tuple[List[str], str]:
+    """Premises and conclusion of an argument written one statement per line.
+
+    The conclusion is the line starting with ∴ / therefore / hence / so /
+    thus, or else the last line. Line numbering such as "1." or "Premise 2:"
+    is ignored.
+    """
+    premises, conclusion = [], None
+    for line in text.splitlines():
+        line = _NUMBERING.sub("", line.strip()).strip()
+        if not line:
+            continue
+        marked = _CONCLUSION.sub("", line)
+        if marked != line and conclusion is None:
+            conclusion = marked.strip()
+        else:
+            premises.append(line)
+    if conclusion is None:
+        if not premises:
+            raise logic.LogicSyntaxError("Empty argument", 0)
+        conclusion = premises.pop()
+    return premises, conclusion
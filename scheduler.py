@@ -0,0 +1,213 @@
+"""Server-wide admission control for assistant requests.
+
+Every session's request waits here for a slot. A slot needs a token from a
+rate-limit bucket and a free in-flight position, and waiting sessions are
+served round-robin so one busy student can't starve the rest. Transient
+API failures are retried with jittered exponential backoff, and each retry
+goes back through the queue.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Optional
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+RETRYABLE_ERRORS = {"APIConnectionError", "APITimeoutError"}
+
+
+class QueueTimeout(Exception):
+    """Raised when a request waited longer than the scheduler allows"""
+
+
+class _Ticket:
+    __slots__ = ("session_id", "granted")
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.granted = False
+
+
+class TokenBucket:
+    """Classic token bucket; callers hold the scheduler lock"""
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def seconds_until_token(self) -> float:
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate) if self.rate > 0 else float("inf")
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Rate limits, overload and dropped connections are worth another try"""
+    if type(exc).__name__ in RETRYABLE_ERRORS:
+        return True
+    return getattr(exc, "status_code", None) in RETRYABLE_STATUS
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Server-suggested delay from a Retry-After header, if any"""
+    response = getattr(exc, "response", None)
+    value = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class AssistantScheduler:
+    """Fair, rate-limited gate in front of the Anthropic API"""
+
+    def __init__(self, rate_per_minute: float = 50, burst: int = 10, max_in_flight: int = 8,
+                 max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 20.0,
+                 max_wait: float = 180.0, poll_interval: float = 0.5):
+        self.bucket = TokenBucket(rate_per_minute / 60.0, burst)
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        # Per-session FIFO queues, in round-robin order
+        self._queues: "OrderedDict[str, Deque[_Ticket]]" = OrderedDict()
+        self.in_flight = 0
+        self.completed = 0
+        self.retries = 0
+        self.failures = 0
+
+    def _dispatch(self) -> None:
+        while self._queues and self.in_flight < self.max_in_flight and self.bucket.try_take():
+            session_id, queue = next(iter(self._queues.items()))
+            ticket = queue.popleft()
+            ticket.granted = True
+            self.in_flight += 1
+            # Serve the next session before this one gets another turn
+            del self._queues[session_id]
+            if queue:
+                self._queues[session_id] = queue
+            self._cond.notify_all()
+
+    def _position(self, ticket: _Ticket) -> int:
+        """1-based place in line under round-robin service"""
+        queue = self._queues.get(ticket.session_id, ())
+        depth = next((i for i, t in enumerate(queue) if t is ticket), 0)
+        sessions = list(self._queues)
+        own_rank = sessions.index(ticket.session_id) if ticket.session_id in self._queues else len(sessions)
+        ahead = 0
+        for rank, session_id in enumerate(sessions):
+            # Sessions before ours in the ring get depth+1 turns first, the rest depth turns
+            turns = depth + 1 if rank < own_rank else depth
+            ahead += min(len(self._queues[session_id]), turns)
+        return ahead + 1
+
+    def _remove(self, ticket: _Ticket) -> None:
+        queue = self._queues.get(ticket.session_id)
+        if queue is not None and ticket in queue:
+            queue.remove(ticket)
+            if not queue:
+                del self._queues[ticket.session_id]
+
+    def acquire(self, session_id: str, on_wait: Optional[Callable[[int], None]] = None) -> None:
+        """Block until this session may call the API, reporting its queue position"""
+        ticket = _Ticket(session_id)
+        deadline = time.monotonic() + self.max_wait
+        with self._cond:
+            self._queues.setdefault(session_id, deque()).append(ticket)
+        try:
+            while True:
+                with self._cond:
+                    self._dispatch()
+                    if ticket.granted:
+                        return
+                    if time.monotonic() >= deadline:
+                        raise QueueTimeout("The assistant queue is full; please try again shortly.")
+                    position = self._position(ticket)
+                if on_wait is not None:
+                    on_wait(position)
+                with self._cond:
+                    if not ticket.granted:
+                        wait = min(self.poll_interval, max(self.bucket.seconds_until_token(), 0.01))
+                        self._cond.wait(wait)
+        except BaseException:
+            # Streamlit stops a script by raising into it; don't leave a ghost in line
+            with self._cond:
+                if ticket.granted:
+                    self.in_flight -= 1
+                else:
+                    self._remove(ticket)
+                self._dispatch()
+            raise
+
+    def release(self) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self.completed += 1
+            self._dispatch()
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, session_id: str, on_wait: Optional[Callable[[int], None]] = None):
+        self.acquire(session_id, on_wait)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def backoff(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Full-jitter exponential delay, never shorter than a Retry-After hint"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        hinted = retry_after(exc) if exc is not None else None
+        return max(delay, hinted or 0.0)
+
+    def run(self, session_id: str, call: Callable[[], object],
+            on_wait: Optional[Callable[[int], None]] = None,
+            on_retry: Optional[Callable[[int, float], None]] = None):
+        """Run ``call`` inside a slot, retrying transient failures.
+
+        ``call`` must be safe to repeat; it is retried only when it raises a
+        retryable error.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.slot(session_id, on_wait):
+                    return call()
+            except Exception as exc:
+                if attempt == self.max_retries or not is_retryable(exc):
+                    with self._cond:
+                        self.failures += 1
+                    raise
+                delay = self.backoff(attempt, exc)
+                with self._cond:
+                    self.retries += 1
+                if on_retry is not None:
+                    on_retry(attempt + 1, delay)
+                time.sleep(delay)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "in_flight": self.in_flight,
+                "queued": sum(len(q) for q in self._queues.values()),
+                "completed": self.completed,
+                "retries": self.retries,
+                "failures": self.failures,
+            }
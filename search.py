@@ -0,0 +1,326 @@
+"""In-process full-text search over the course content.
+
+Quiz questions, the symbol glossary, definitions, thought experiments and
+the Resources page's links are indexed into one inverted index. Symbols
+and their names are folded into a shared vocabulary, so "∧", "conjunction"
+and "conjunctions" are the same term. Each query word matches exactly,
+as a prefix (for search-as-you-type), or within a small edit distance (for
+typos). Results are ranked by field-weighted TF-IDF, and documents that
+match every query word come first. Fuzzy candidates come from a
+deletion-neighbourhood table rather than a vocabulary scan, so a query
+costs well under a millisecond.
+
+Content is indexed per source with a version (a file mtime, say);
+``update`` re-indexes only the documents of a source whose version
+changed, so editing the question bank doesn't rebuild everything else.
+"""
+
+import ast
+import math
+import re
+import runpy
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+QUIZ_PAGE = "Interactive Quiz"
+SYMBOLS_PAGE = "Logic Symbol Reference"
+RESOURCES_PAGE = "Resources & Further Reading"
+
+TITLE_WEIGHT = 3.0
+PREFIX_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.5
+MAX_EXPANSIONS = 30  # prefix and fuzzy candidates per query word
+SNIPPET_CHARS = 140
+MIN_RESOURCE_TERMS = 5  # skip buttons that only reveal a word or two
+
+# Symbols and the words for them, all folded to one term
+_SYNONYMS = {
+    "∧": "conjunction", "conjunct": "conjunction",
+    "∨": "disjunction", "disjunct": "disjunction",
+    "¬": "negation", "negate": "negation", "negated": "negation",
+    "→": "implication", "implies": "implication", "conditional": "implication", "entailment": "implication",
+    "↔": "biconditional", "iff": "biconditional",
+    "∀": "universal", "forall": "universal",
+    "∃": "existential", "exists": "existential",
+    "∅": "emptyset",
+    "∈": "membership", "element": "membership", "member": "membership",
+    "ε": "epsilon", "infinitesimal": "epsilon",
+    "∞": "infinity", "infinite": "infinity",
+    "≡": "equivalence", "equivalent": "equivalence", "identity": "equivalence",
+}
+# Two words in prose but one concept
+_PHRASES = {"empty set": "emptyset", "if and only if": "iff"}
+# Connective words are filler in prose but, typed on their own, mean the operator
+_OPERATOR_WORDS = {"and": "conjunction", "or": "disjunction", "not": "negation", "if": "implication"}
+_STOPWORDS = frozenset(
+    "a an and are as at be by can does for from how if in into is it its not of on or that the their this "
+    "to what when where which who why with you your".split())
+_TOKEN = re.compile(r"[^\W\d_][\w']*|\d+|[" + "".join(k for k in _SYNONYMS if len(k) == 1) + "]")
+_MARKUP = re.compile(r"\(https?://[^)]*\)|[*_`#\[\]]")
+
+
+class Document(NamedTuple):
+    key: str  # unique across sources, e.g. "symbol:∧"
+    kind: str  # "Question", "Symbol", "Definition", "Thought experiment" or "Resource"
+    title: str
+    text: str
+    page: str  # the app page where it lives
+
+
+class Hit(NamedTuple):
+    document: Document
+    score: float
+    snippet: str
+
+
+def _normalize(word: str) -> str:
+    word = _SYNONYMS.get(word, word)
+    # Light plural folding: "symbols" -> "symbol", not "class" -> "clas"
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = _SYNONYMS.get(word[:-1], word[:-1])
+    return word
+
+
+def tokenize(text: str, query: bool = False) -> List[str]:
+    """Search terms in ``text``, in order, stopwords dropped.
+
+    In a ``query``, "and", "or", "not" and "if" are kept as the operators
+    they name, so searching "AND" finds conjunction.
+    """
+    lowered = _MARKUP.sub(" ", text).lower()
+    for phrase, term in _PHRASES.items():
+        lowered = lowered.replace(phrase, term)
+    terms = []
+    for word in _TOKEN.findall(lowered):
+        word = word.strip("'")
+        if query and word in _OPERATOR_WORDS:
+            terms.append(_OPERATOR_WORDS[word])
+        elif word not in _STOPWORDS:
+            terms.append(_normalize(word))
+    return terms
+
+
+def _deletes(term: str) -> Set[str]:
+    """The term with any one character removed"""
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within(a: str, b: str, limit: int) -> bool:
+    """Levenshtein distance between a and b is at most ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return False
+        previous = current
+    return previous[-1] <= limit
+
+
+class SearchIndex:
+    """Inverted index with incremental per-source updates; safe to share across sessions"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._documents: Dict[str, Document] = {}
+        self._weights: Dict[str, Dict[str, float]] = {}  # document key -> term -> weight
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)  # term -> document key -> weight
+        self._vocabulary: List[str] = []  # sorted, for prefix lookups
+        self._neighbours: Dict[str, Set[str]] = defaultdict(set)  # one-deletion variant -> terms
+        self._sources: Dict[str, Tuple[object, Set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def version(self, source: str) -> Optional[object]:
+        entry = self._sources.get(source)
+        return entry[0] if entry else None
+
+    def update(self, source: str, version: object, documents: Iterable[Document]) -> int:
+        """Replace a source's documents; returns how many were (re)indexed"""
+        documents = {d.key: d for d in documents}
+        with self._lock:
+            _, old_keys = self._sources.get(source, (None, set()))
+            changed = [d for key, d in documents.items() if self._documents.get(key) != d]
+            for key in old_keys - documents.keys():
+                self._remove(key)
+            for document in changed:
+                self._remove(document.key)
+                self._add(document)
+            self._sources[source] = (version, set(documents))
+        return len(changed)
+
+    def _add(self, document: Document) -> None:
+        counts: Dict[str, float] = defaultdict(float)
+        for term in tokenize(document.title):
+            counts[term] += TITLE_WEIGHT
+        for term in tokenize(document.text):
+            counts[term] += 1.0
+        # Dampened term frequency, normalized so long documents don't win on length alone
+        norm = math.sqrt(sum(counts.values())) or 1.0
+        weights = {term: (1 + math.log(count)) / norm for term, count in counts.items()}
+        self._documents[document.key] = document
+        self._weights[document.key] = weights
+        for term, weight in weights.items():
+            postings = self._postings[term]
+            if not postings:
+                self._vocabulary.insert(bisect_left(self._vocabulary, term), term)
+                for variant in _deletes(term):
+                    self._neighbours[variant].add(term)
+            postings[document.key] = weight
+
+    def _remove(self, key: str) -> None:
+        if key not in self._documents:
+            return
+        del self._documents[key]
+        for term in self._weights.pop(key):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+                for variant in _deletes(term):
+                    self._neighbours[variant].discard(term)
+                    if not self._neighbours[variant]:
+                        del self._neighbours[variant]
+
+    def _expand(self, word: str) -> Dict[str, float]:
+        """Vocabulary terms a query word stands for, with how strongly"""
+        matches: Dict[str, float] = {}
+        if word in self._postings:
+            matches[word] = 1.0
+        if len(word) >= 2:
+            i = bisect_left(self._vocabulary, word)
+            while i < len(self._vocabulary) and self._vocabulary[i].startswith(word) and \
+                    len(matches) < MAX_EXPANSIONS:
+                matches.setdefault(self._vocabulary[i], PREFIX_WEIGHT)
+                i += 1
+        if len(word) >= 4:
+            # Terms one edit away share a one-deletion variant (or are one): substitutions,
+            # insertions and deletions all show up here
+            limit = 1 if len(word) < 8 else 2
+            candidates = set(self._neighbours.get(word, ()))
+            for variant in _deletes(word) | {word}:
+                candidates.update(self._neighbours.get(variant, ()))
+                if variant in self._postings:
+                    candidates.add(variant)
+            for term in sorted(candidates)[:MAX_EXPANSIONS]:
+                if term not in matches and _within(word, term, limit):
+                    matches[term] = FUZZY_WEIGHT
+        return matches
+
+    def search(self, query: str, limit: int = 8) -> List[Hit]:
+        words = list(dict.fromkeys(tokenize(query, query=True)))
+        if not words:
+            return []
+        with self._lock:
+            total = len(self._documents)
+            scores: Dict[str, float] = defaultdict(float)
+            matched: Dict[str, int] = defaultdict(int)
+            for word in words:
+                best: Dict[str, float] = {}
+                for term, strength in self._expand(word).items():
+                    postings = self._postings[term]
+                    idf = math.log(1 + total / len(postings))
+                    for key, weight in postings.items():
+                        score = strength * weight * idf
+                        if score > best.get(key, 0.0):
+                            best[key] = score
+                for key, score in best.items():
+                    scores[key] += score
+                    matched[key] += 1
+            # Documents matching every word first, then by score
+            ranked = sorted(scores, key=lambda key: (matched[key] < len(words), -scores[key], key))[:limit]
+            return [Hit(self._documents[key], round(scores[key], 4), _snippet(self._documents[key], words))
+                    for key in ranked]
+
+
+def _snippet(document: Document, words: List[str]) -> str:
+    """A stretch of the document's text around the first query word it contains"""
+    text = " ".join(_MARKUP.sub("", document.text).split())
+    if len(text) <= SNIPPET_CHARS:
+        return text
+    lowered = text.lower()
+    positions = [lowered.find(word) for word in words if word.isalpha() and word in lowered]
+    start = max(min(positions) - SNIPPET_CHARS // 3, 0) if positions else 0
+    snippet = text[start:start + SNIPPET_CHARS].strip()
+    return ("…" if start else "") + snippet + ("…" if start + SNIPPET_CHARS < len(text) else "")
+
+
+def question_documents(questions) -> List[Document]:
+    """Quiz questions; the options are searchable but the answer isn't marked"""
+    return [Document(f"question:{i}", "Question", q.text, " · ".join(q.options), QUIZ_PAGE)
+            for i, q in enumerate(questions)]
+
+
+def content_documents(path: str) -> List[Document]:
+    """Symbols, definitions and thought experiments from content.py at ``path``.
+
+    The file is executed into a private namespace rather than imported, so
+    re-indexing an edited copy never swaps out the module the pages use.
+    """
+    content = runpy.run_path(path)
+    documents = [Document(f"symbol:{symbol}", "Symbol", f"{symbol} {name}",
+                          f"Geometric form: {geometry}. Meaning: {meaning}", SYMBOLS_PAGE)
+                 for symbol, (name, geometry, meaning) in content["SYMBOLS_DATA"].items()]
+    documents += [Document(f"definition:{term}", "Definition", term, definition, RESOURCES_PAGE)
+                  for term, definition in content["DEFINITIONS"].items()]
+    for experiment in content["THOUGHT_EXPERIMENTS"]:
+        title, _, text = _MARKUP.sub("", experiment).partition(":")
+        title = " ".join(_label(title))
+        documents.append(Document(f"thought:{title}", "Thought experiment", title, text.strip(), RESOURCES_PAGE))
+    return documents
+
+
+def resource_documents(path: str) -> List[Document]:
+    """The Resources page's buttons and toggles, read from its source.
+
+    Each ``if st.button(label)`` / ``if st.toggle(label)`` block in the page's
+    ``render`` becomes a document titled with the label and holding the
+    block's strings (plus the docstrings of page helpers it calls), so the
+    page needs no separate catalogue kept in sync by hand.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    helpers = {node.name: ast.get_docstring(node) or "" for node in tree.body if isinstance(node, ast.FunctionDef)}
+    documents = []
+
+    def strings(nodes) -> List[str]:
+        found = []
+        for node in (n for root in nodes for n in ast.walk(root)):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                found.append(node.value)
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in helpers:
+                found.append(helpers[node.func.id])
+        return found
+
+    def visit(node) -> None:
+        for child in ast.iter_child_nodes(node):
+            test = getattr(child, "test", None)
+            if isinstance(child, ast.FunctionDef) and child.name != "render":
+                continue
+            if isinstance(child, ast.If) and isinstance(test, ast.Call) and \
+                    isinstance(test.func, ast.Attribute) and test.func.attr in ("button", "toggle") and \
+                    test.args and isinstance(test.args[0], ast.Constant):
+                label = " ".join(_label(test.args[0].value))
+                text = " ".join(" ".join(s.split()) for s in strings(child.body))
+                if len(tokenize(text)) >= MIN_RESOURCE_TERMS:
+                    documents.append(Document(f"resource:{label}", "Resource", label, text, RESOURCES_PAGE))
+            else:
+                visit(child)
+
+    visit(tree)
+    return documents
+
+
+def _label(label: str) -> List[str]:
+    """A button label without its leading emoji"""
+    words = label.split()
+    while words and not any(c.isalnum() or c in _SYNONYMS for c in words[0]):
+        words.pop(0)
+    return words
@@ -0,0 +1 @@
+"""Course pages, each imported the first time a student opens it."""
@@ -0,0 +1,60 @@
+"""Instructor Class Analytics page."""
+
+import streamlit as st
+
+import figures
+from services import get_class_analytics, get_setting
+
+def show_class_analytics():
+    """Instructor dashboard of class-wide quiz results"""
+    analytics = get_class_analytics()
+    summary = analytics.summary()
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Submissions", summary["submissions"])
+    c2.metric("Correct", f"{summary['correct'] / summary['submissions']:.0%}" if summary["submissions"] else "—")
+    c3.metric("Students with an ID", summary["students"])
+    c4.metric("Questions attempted", summary["questions"])
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        st.subheader("📋 Per-Question Results")
+        stats = analytics.question_stats()
+        if stats:
+            rows = []
+            for q in stats:
+                distractor, picks = q.top_distractor()
+                rows.append({
+                    "Question": q.text,
+                    "Correct": q.correct,
+                    "Incorrect": q.incorrect,
+                    "% Correct": round(100 * q.correct / q.attempts) if q.attempts else 0,
+                    "Top distractor": f"{distractor} ({picks})" if picks else "—",
+                })
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+            
+            selected = st.selectbox("Option popularity for:", range(len(stats)),
+                                    format_func=lambda i: stats[i].text)
+            q = stats[selected]
+            st.plotly_chart(figures.option_popularity(q.options, q.counts, q.answer), use_container_width=True)
+        else:
+            st.info("No answers submitted yet.")
+    
+    with col2:
+        st.subheader("🏆 Leaderboard")
+        leaders = analytics.leaderboard(10)
+        if leaders:
+            st.dataframe([{"Rank": i + 1, "Student": name, "Best XP": xp} for i, (name, xp) in enumerate(leaders)],
+                         use_container_width=True, hide_index=True)
+        else:
+            st.info("Students appear here once they enter a Student ID.")
+
+def render():
+    """Password-gated instructor dashboard; app.py lists it only when INSTRUCTOR_PASSWORD is set"""
+    st.header("📊 Class Analytics")
+    instructor_password = get_setting("INSTRUCTOR_PASSWORD")
+    if st.text_input("🔒 Instructor password", type="password") != instructor_password:
+        st.warning("This dashboard is for instructors only.")
+    else:
+        if st.button("🔄 Refresh"):
+            st.rerun()
+        show_class_analytics()
@@ -0,0 +1,209 @@
+"""AI Philosophy Assistant page."""
+
+import streamlit as st
+
+import assistant
+from conversation import ConversationContext
+from scheduler import QueueTimeout
+from services import (get_anthropic_client, get_api_key, get_assistant_scheduler, get_metrics,
+                      get_response_cache, get_setting, new_chat_history)
+
+def queue_question():
+    """Move the typed question out of the input box before the rerun"""
+    st.session_state.pending_question = st.session_state.user_input.strip()
+    st.session_state.user_input = ""
+
+def show_turn(question, answer):
+    """One question and answer from the chat history"""
+    with st.container():
+        st.markdown(f"**🧠 You:** {question}")
+        st.markdown(f"**🤖 Assistant:** {answer}")
+        st.markdown("---")
+
+def render():
+    """Suggested questions, chat history and the ask box"""
+    api_key = get_api_key()
+    st.header("🤖 AI Philosophy Assistant")
+    st.markdown("**Ask deep questions about metaphysics, logic symbols, and the nature of reality**")
+    
+    # Check if API key is available
+    if not api_key:
+        st.error("🔑 API key required. Please add your Anthropic API key in the sidebar to use the AI assistant.")
+        st.info("This feature requires an Anthropic API key to function. Contact your instructor if you need access.")
+    else:
+        try:
+            import anthropic
+            
+            # Shared, pooled Anthropic client
+            client = get_anthropic_client(api_key)
+            
+            # Suggested important questions
+            st.subheader("💡 Suggested Philosophical Questions")
+            
+            for col, (group, suggestions) in zip(st.columns(2), assistant.SUGGESTED_QUESTION_GROUPS.items()):
+                with col:
+                    st.markdown(f"**{group}:**")
+                    for label, prompt in suggestions.items():
+                        if st.button(label, use_container_width=True):
+                            st.session_state.current_question = prompt
+            
+            with st.expander("⚙️ Response cache statistics"):
+                stats = get_response_cache().stats()
+                c1, c2, c3, c4 = st.columns(4)
+                c1.metric("Hits", stats["hits"])
+                c2.metric("Misses", stats["misses"])
+                c3.metric("Hit rate", f"{stats['hit_rate']:.0%}")
+                c4.metric("Cached answers", stats["entries"])
+            
+            # Initialize chat history in session state
+            if 'chat_history' not in st.session_state:
+                st.session_state.chat_history = new_chat_history()
+            if 'conversation' not in st.session_state:
+                st.session_state.conversation = ConversationContext(
+                    budget_tokens=int(get_setting("ASSISTANT_CONTEXT_TOKENS", 2000)))
+            
+            # Handle suggested questions
+            if 'current_question' in st.session_state:
+                st.session_state.user_input = st.session_state.current_question
+                del st.session_state.current_question
+            
+            # Chat interface
+            st.subheader("💬 Philosophy Chat")
+            
+            history = st.session_state.chat_history
+            
+            # Older turns live on disk and are only read back when asked for
+            if history.archived:
+                with st.expander(f"📜 Earlier conversation ({history.archived} turns)"):
+                    if st.toggle("Load earlier turns", key="show_archived_turns"):
+                        pages = history.page_count()
+                        page = 1
+                        if pages > 1:
+                            page = st.number_input("Page (1 = most recent)", 1, pages, 1, key="archive_page")
+                        for question, answer in history.older(page - 1):
+                            show_turn(question, answer)
+            
+            # Display chat history
+            for question, answer in history:
+                show_turn(question, answer)
+            
+            # The turn being answered renders here, directly below the history
+            live_turn = st.container()
+            
+            # User input
+            st.text_area(
+                "Ask your philosophical question:",
+                key="user_input",
+                height=100,
+                placeholder="e.g., How do logic symbols encode the structure of reality?"
+            )
+            
+            col1, col2, col3 = st.columns([1, 1, 3])
+            with col1:
+                st.button("🔮 Ask Assistant", type="primary", on_click=queue_question)
+            with col2:
+                stream_responses = st.toggle("⚡ Stream", value=True,
+                                             help="Show the answer word by word as it is written")
+            with col3:
+                if st.button("🗑️ Clear Chat History"):
+                    st.session_state.chat_history.clear()
+                    st.session_state.conversation.clear()
+                    st.rerun()
+            
+            user_question = st.session_state.pop("pending_question", "")
+            if user_question:
+                try:
+                    # Suggested questions are answered without the conversation so far: the
+                    # shared cache is keyed on the question alone, and a context-specific
+                    # answer must never be served to another student
+                    cache = get_response_cache() if assistant.is_suggested(user_question) else None
+                    if cache is not None:
+                        summary, messages = "", None
+                    else:
+                        # Recent turns verbatim, older ones as a running summary
+                        summary, messages = st.session_state.conversation.prepare(user_question)
+                    cached = cache.get(assistant.MODEL, assistant.SYSTEM_PROMPT, user_question,
+                                       assistant.TEMPERATURE) if cache else None
+                    with live_turn:
+                        st.markdown(f"**🧠 You:** {user_question}")
+                        if cached is not None:
+                            # Suggested questions are answered from the shared on-disk cache
+                            response = cached
+                            st.markdown(f"**🤖 Assistant:** {response}")
+                        else:
+                            st.markdown("**🤖 Assistant:**")
+                            status = st.empty()
+                            answer_slot = st.empty()
+                            
+                            def show_position(position):
+                                status.info(f"⏳ The assistant is helping other students - you're #{position} in line")
+                            
+                            def show_retry(attempt, delay):
+                                status.warning(f"🔁 The assistant is busy - retrying in {delay:.0f}s (attempt {attempt})")
+                            
+                            def answer():
+                                status.empty()
+                                # A retry replaces whatever a failed attempt had streamed
+                                answer_slot.empty()
+                                with answer_slot.container(), get_metrics().span("assistant/request"):
+                                    if stream_responses:
+                                        # Render tokens as they arrive instead of waiting for the full answer
+                                        return st.write_stream(assistant.stream_answer(client, user_question, messages, summary))
+                                    with st.spinner("🤔 Contemplating your philosophical question..."):
+                                        text = assistant.ask(client, user_question, messages, summary)
+                                    st.markdown(text)
+                                    return text
+                            
+                            # Includes time spent queued behind other students and retries
+                            with get_metrics().span("assistant/total"):
+                                response = get_assistant_scheduler().run(
+                                    st.session_state.session_id, answer,
+                                    on_wait=show_position, on_retry=show_retry)
+                        st.markdown("---")
+                    
+                    if cache is not None and cached is None:
+                        cache.put(assistant.MODEL, assistant.SYSTEM_PROMPT, user_question,
+                                  assistant.TEMPERATURE, response)
+                    
+                    # Add to chat history; the turn is already on screen so no rerun is needed
+                    st.session_state.chat_history.append(user_question, response)
+                    st.session_state.conversation.add_turn(user_question, response)
+                    
+                except QueueTimeout as e:
+                    st.warning(f"⏳ {e}")
+                except Exception as e:
+                    st.error(f"Error getting response: {str(e)}")
+                    st.info("Please check your API key and try again.")
+        
+        except ImportError:
+            st.error("📦 Missing required library. Please install: `pip install anthropic`")
+            st.info("The Anthropic library is required for the AI assistant functionality.")
+    
+    # Philosophy tips
+    st.markdown("---")
+    st.subheader("💡 Tips for Philosophical Inquiry")
+    
+    tip_cols = st.columns(3)
+    with tip_cols[0]:
+        st.markdown("""
+        **🤔 Ask Deep Questions**
+        - Why does this concept exist?
+        - What assumptions am I making?
+        - How do the pieces connect?
+        """)
+    
+    with tip_cols[1]:
+        st.markdown("""
+        **🔍 Examine Closely**
+        - What exactly does this mean?
+        - Can I think of counterexamples?
+        - What would critics say?
+        """)
+    
+    with tip_cols[2]:
+        st.markdown("""
+        **🌐 Connect Ideas**
+        - How does this relate to other concepts?
+        - What are the implications?
+        - Where does this lead?
+        """)
@@ -0,0 +1,55 @@
+"""Admin-only sidebar panel with hot-path timings."""
+
+import streamlit as st
+
+from metrics import DEFAULT_EXPORT_PATH
+from services import get_chat_archive, get_metrics, get_metrics_exporter, get_payload_cache, get_setting
+
+WINDOW_MINUTES = (1, 5, 15)
+
+def render():
+    """Rolling span percentiles plus Prometheus / JSON lines export"""
+    with st.expander("⏱️ Performance"):
+        admin_password = get_setting("ADMIN_PASSWORD")
+        if not admin_password:
+            st.info("Set `ADMIN_PASSWORD` in Streamlit secrets to enable the performance panel.")
+            return
+        if st.text_input("🔒 Admin password", type="password", key="admin_password") != admin_password:
+            return
+        
+        metrics = get_metrics()
+        minutes = st.selectbox("Window", WINDOW_MINUTES, index=1, format_func=lambda m: f"Last {m} min")
+        rows = metrics.summary(minutes * 60)
+        if rows:
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+        else:
+            st.caption("No spans recorded in this window yet.")
+        
+        chats = get_chat_archive().stats()
+        st.caption(f"💬 Chat history: {chats['sessions']} live session(s) hold "
+                   f"{chats['memory_bytes'] / 1024:.0f} KiB (largest {chats['max_session_bytes'] / 1024:.0f} KiB); "
+                   f"{chats['archived_turns']} archived turns use {chats['archived_bytes'] / 1024:.0f} KiB on disk")
+        
+        payloads = get_payload_cache().stats()
+        st.caption(f"📈 Figure payloads: {payloads['hits']} sends skipped encoding, saving "
+                   f"{payloads['bytes_saved'] / 1024 / 1024:.1f} MiB of JSON and {payloads['seconds_saved']:.2f}s; "
+                   f"{payloads['payloads']} cached in {payloads['bytes'] / 1024:.0f} KiB "
+                   f"({payloads['compacted_bytes'] / 1024:.0f} KiB less than with float64 arrays)")
+        
+        exporter = get_metrics_exporter()
+        if exporter is not None:
+            st.caption(f"Exporting to `{exporter.path}` every {exporter.interval:.0f}s "
+                       f"({exporter.exports} snapshots written)")
+            if exporter.last_error:
+                st.warning(f"Last export failed: {exporter.last_error}")
+        path = exporter.path if exporter is not None else get_setting("METRICS_EXPORT_PATH", DEFAULT_EXPORT_PATH)
+        if st.button("💾 Export now", help=f"Write a snapshot to {path}"):
+            try:
+                metrics.export(path)
+                st.success(f"Wrote `{path}`")
+            except OSError as e:
+                st.error(f"Export failed: {e}")
+        
+        col1, col2 = st.columns(2)
+        col1.download_button("Prometheus", metrics.prometheus_text(), "phl201-metrics.prom", "text/plain")
+        col2.download_button("JSON lines", metrics.json_lines(), "phl201-metrics.jsonl", "application/jsonl")
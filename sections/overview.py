@@ -0,0 +1,38 @@
+"""Course Overview page."""
+
+import streamlit as st
+
+OVERVIEW_MARKDOWN = """
+    Welcome to **CognitiveCloud.ai's** revolutionary approach to metaphysics! This course explores how the **geometry of logic symbols** 
+    encodes deep metaphysical truths about the nature of reality.
+    
+    ## 🎯 Core Insights
+    
+    **Logic Symbols as Geometric Intuitions:**
+    - **∧ (AND)**: Convergence - two paths meeting at truth
+    - **∨ (OR)**: Divergence - one reality branching into possibilities  
+    - **¬ (NOT)**: Boundary creation - the active principle of negation
+    - **→ (IMPLIES)**: Directional flow - the arrow of causation
+    - **ε (Epsilon)**: The infinitely small that reveals wave-reality
+    
+    ## 🌊 The Epsilon Revolution
+    
+    At the **epsilon (ε) scale**, linearity collapses! What appears as straight lines at human scale 
+    dissolves into **sinusoidal wave patterns** - confirming string theory's insight that reality 
+    is fundamentally vibrational and relational.
+    
+    ## 🔮 Dimensional Transcendence
+    
+    - **1D**: Linear illusion (macro view)
+    - **2D**: Sinusoidal projections (partial truth)  
+    - **3D**: Spherical totality (holographic reality)
+    
+    **Meta-Geometric Principle**: The visual forms of logic symbols embody the structure of reality itself.
+    """
+
+
+def render():
+    """Course introduction"""
+    st.header("🌟 Metaphysics Through Logic Symbol Geometry")
+    
+    st.markdown(OVERVIEW_MARKDOWN)
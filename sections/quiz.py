@@ -0,0 +1,131 @@
+"""Interactive Quiz page."""
+
+import uuid
+
+import streamlit as st
+
+from services import get_class_analytics, get_question_bank, save_progress, show_progress, timed
+
+def submit_answer(question):
+    """Grade the selected option; runs before the quiz card redraws"""
+    ans = st.session_state[f"q{st.session_state.current}"]
+    st.session_state.selected_answer = ans
+    if ans == question.answer:
+        st.session_state.feedback = ("success", "✅ Correct! +10 XP")
+        st.session_state.score += 10
+    else:
+        st.session_state.feedback = ("error", f"❌ Incorrect. The answer is: **{question.correct_option}**")
+    st.session_state.answered = True
+    save_progress()
+    get_class_analytics().record_answer(question, ans, st.session_state.student_id.strip(),
+                                        st.session_state.score)
+
+def next_question():
+    """Advance the cursor to the next question"""
+    st.session_state.current += 1
+    st.session_state.answered = False
+    st.session_state.feedback = None
+    st.session_state.selected_answer = None
+    save_progress()
+
+def skip_to_end():
+    """Jump straight to the end-of-quiz summary"""
+    st.session_state.current = len(get_question_bank())
+    save_progress()
+
+@timed("quiz/show_question")
+def show_question():
+    """Display current question with enhanced UI"""
+    bank = get_question_bank()
+    if st.session_state.current < len(bank):
+        question = bank.at(st.session_state.quiz_seed, st.session_state.current)
+        opts = question.options
+        
+        # Progress bar
+        progress = (st.session_state.current + 1) / len(bank)
+        st.progress(progress, text=f"Question {st.session_state.current + 1} of {len(bank)}")
+        
+        st.subheader(f"Question {st.session_state.current + 1}")
+        st.write(f"**{question.text}**")
+        
+        # Radio button for answers
+        if not st.session_state.answered:
+            st.radio("Choose your answer:", range(len(opts)), format_func=lambda i: opts[i],
+                     key=f"q{st.session_state.current}")
+            
+            col1, col2, col3 = st.columns([1, 1, 2])
+            with col1:
+                st.button("Submit Answer", type="primary", on_click=submit_answer, args=(question,))
+        else:
+            # Show the question and selected answer when answered
+            st.write(f"**Your answer:** {opts[st.session_state.selected_answer]}")
+            show_feedback()
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button("Next Question", type="primary", on_click=next_question)
+            with col2:
+                st.button("Skip to End", on_click=skip_to_end)
+
+def show_feedback():
+    """Display feedback with enhanced styling"""
+    if st.session_state.feedback:
+        typ, msg = st.session_state.feedback
+        if typ == "success":
+            st.success(msg)
+        else:
+            st.error(msg)
+
+def show_score():
+    """Display current score with styling"""
+    col1, col2, col3 = st.columns(3)
+    with col2:
+        st.metric("Current Score", f"{st.session_state.score} XP", 
+                 delta=f"{st.session_state.current} answered")
+
+def restart_quiz():
+    """Reset quiz state"""
+    st.session_state.quiz_seed = uuid.uuid4().int % 2**31 + 1 if st.session_state.shuffle_quiz else 0
+    st.session_state.current = 0
+    st.session_state.score = 0
+    st.session_state.feedback = None
+    st.session_state.selected_answer = None
+    st.session_state.answered = False
+    save_progress()
+
+@st.fragment
+def quiz_card():
+    """Score, question and summary; quiz clicks rerun only this fragment"""
+    show_score()
+    
+    # Keep the sidebar's progress in step with fragment-only reruns
+    with st.sidebar:
+        show_progress()
+    
+    if st.session_state.current < len(get_question_bank()):
+        show_question()
+    else:
+        st.balloons()
+        st.success(f"🎉 **Quiz Complete!** Final Score: {st.session_state.score} XP")
+        
+        # Performance analysis
+        total_possible = len(get_question_bank()) * 10
+        percentage = (st.session_state.score / total_possible) * 100
+        
+        if percentage >= 90:
+            st.success("🏆 **Metaphysical Master!** You've transcended linear thinking.")
+        elif percentage >= 80:
+            st.info("🎓 **Advanced Understanding** - You grasp the epsilon principle!")
+        elif percentage >= 70:
+            st.warning("📚 **Good Progress** - Continue exploring dimensional transcendence.")
+        else:
+            st.error("🔄 **Keep Learning** - The path to geometric wisdom continues.")
+        
+        st.checkbox("🔀 Shuffle the questions next time", key="shuffle_quiz")
+        st.button("🔄 Restart Quiz", type="secondary", on_click=restart_quiz)
+
+def render():
+    """Quiz card, score and end-of-quiz summary"""
+    st.header("🎯 Test Your Metaphysical Understanding")
+    
+    quiz_card()
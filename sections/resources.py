@@ -0,0 +1,382 @@
+"""Resources & Further Reading page."""
+
+import functools
+import random
+
+import numpy as np
+import streamlit as st
+
+import logic
+import sat
+from content import DEFINITIONS, THOUGHT_EXPERIMENTS
+
+TRUTH_TABLE_PAGE_ROWS = 32
+# Whole tables are offered as CSV only while they stay small
+TRUTH_TABLE_CSV_VARIABLES = 12
+JS_MAX_SAFE_INTEGER = 2 ** 53 - 1
+GAME_FORMULAS = ["P ∧ Q", "P ∨ Q", "P → Q", "P ↔ Q", "¬P ∨ Q", "¬(P ∧ Q)", "P ∧ ¬Q", "(P → Q) ∧ (Q → P)"]
+
+
+def _truth_columns(formula, rows):
+    return {name: np.where(rows[:, i], "T", "F") for i, name in enumerate(formula.columns)}
+
+
+@functools.lru_cache(maxsize=32)
+def truth_table_csv(text: str) -> bytes:
+    """A whole truth table as CSV, built as one byte matrix rather than row by row"""
+    formula = logic.parse(text)
+    rows = formula.rows(0, formula.row_count)
+    # Each cell is one letter followed by a comma, or by a newline at the end of the row
+    cells = np.full((len(rows), 2 * rows.shape[1]), ord(","), dtype=np.uint8)
+    cells[:, ::2] = np.where(rows, ord("T"), ord("F"))
+    cells[:, -1] = ord("\n")
+    return (",".join(formula.columns) + "\n").encode("utf-8") + cells.tobytes()
+
+
+def truth_table_generator():
+    """Truth table of a student's formula, one page at a time"""
+    text = st.text_input("Formula", "P ∧ Q", key="truth_table_formula",
+                         help="Use ¬ ∧ ∨ → ↔, or type ~ & | -> <-> (or not/and/or/implies/iff)")
+    try:
+        formula = logic.parse(text)
+    except logic.LogicSyntaxError as e:
+        st.error(f"Can't read that formula: {e}")
+        return
+
+    n = len(formula.variables)
+    summary = f"**{formula}** · {n} variable{'s' if n != 1 else ''} · {formula.row_count:,} rows"
+    if n <= logic.MAX_COUNT_VARIABLES:
+        models = formula.count_models()
+        summary += f" · true in {models:,} · **{formula.classify()}**"
+    st.markdown(summary)
+
+    page_count = -(-formula.row_count // TRUTH_TABLE_PAGE_ROWS)
+    page = 1
+    if page_count > 1:
+        # A text box rather than st.number_input: with 59+ variables the page count
+        # exceeds the 2^53 - 1 that the browser's number widgets can hold
+        entry = st.text_input(f"Page (of {page_count:,})", "1", key="truth_table_page")
+        try:
+            page = int(entry.replace(",", "").replace("_", "").strip())
+        except ValueError:
+            page = 0
+        if not 1 <= page <= page_count:
+            st.warning(f"Enter a page number from 1 to {page_count:,}; showing page 1.")
+            page = 1
+    start = (page - 1) * TRUTH_TABLE_PAGE_ROWS
+    rows = formula.rows(start, start + TRUTH_TABLE_PAGE_ROWS)
+    numbers = range(start + 1, start + 1 + len(rows))
+    # Row numbers past 2^53 would be rounded in the browser, so those are sent as text
+    table = {"Row": np.array(numbers, dtype=np.int64) if numbers.stop <= JS_MAX_SAFE_INTEGER
+             else [f"{i:,}" for i in numbers]}
+    table.update(_truth_columns(formula, rows))
+    st.dataframe(table, hide_index=True, use_container_width=True)
+
+    if n <= TRUTH_TABLE_CSV_VARIABLES:
+        # Built only when the button is clicked, and once per formula
+        st.download_button("⬇️ Download CSV", functools.partial(truth_table_csv, formula.text),
+                           file_name="truth_table.csv", mime="text/csv", key="truth_table_csv")
+
+
+def _new_game_formula():
+    current = st.session_state.get("truth_game_formula")
+    st.session_state.truth_game_formula = random.choice([f for f in GAME_FORMULAS if f != current])
+    for row in range(4):
+        st.session_state.pop(f"truth_game_row{row}", None)
+
+
+def truth_table_game():
+    """Fill in the last column of a two-variable truth table"""
+    if "truth_game_formula" not in st.session_state:
+        st.session_state.truth_game_formula = GAME_FORMULAS[0]
+    formula = logic.parse(st.session_state.truth_game_formula)
+    st.markdown(f"**Challenge: Complete the truth table for `{formula}`**")
+    rows = formula.rows(0, formula.row_count)
+    guesses = []
+    for row, values in enumerate(rows):
+        inputs = ", ".join(f"{name}={'T' if value else 'F'}" for name, value in zip(formula.variables, values))
+        guesses.append(st.radio(f"{inputs} → ?", ["T", "F"], index=None, horizontal=True,
+                                key=f"truth_game_row{row}"))
+    if st.button("Check Truth Table"):
+        wrong = [row + 1 for row, (guess, values) in enumerate(zip(guesses, rows))
+                 if guess != ("T" if values[-1] else "F")]
+        if not wrong:
+            st.success(f"Perfect! That is exactly when {formula} holds.")
+        else:
+            st.error(f"Not quite - check row{'s' if len(wrong) > 1 else ''} {', '.join(map(str, wrong))}.")
+    st.button("🔀 New formula", on_click=_new_game_formula)
+
+
+def analyze_argument(text):
+    """Premises, conclusion and a validity verdict with a counter-model when invalid"""
+    try:
+        premises, conclusion = sat.split_argument(text)
+        verdict = sat.check_argument(premises, conclusion)
+    except logic.LogicSyntaxError as e:
+        st.error(f"Can't read that argument: {e}")
+        return
+    for i, premise in enumerate(premises, 1):
+        st.write(f"**Premise {i}:** {logic.to_text(logic.parse_tree(premise))}")
+    st.write(f"**Conclusion:** ∴ {logic.to_text(logic.parse_tree(conclusion))}")
+    if not verdict.consistent:
+        st.warning("Valid, but only vacuously: the premises contradict each other, so anything follows from them.")
+    elif verdict.valid:
+        st.success("**Form:** Valid. Whenever every premise is true, the conclusion is true too.")
+    else:
+        st.error("**Form:** Invalid. Here the premises are all true but the conclusion is false:")
+        st.dataframe({name: ["T" if value else "F"] for name, value in verdict.counter_model.items()},
+                     hide_index=True)
+    st.caption(f"Checked {verdict.atoms} atom(s) as {verdict.clauses} clauses with a SAT solver.")
+
+
+def render():
+    """Links, logic games and practice workouts"""
+    st.header("🎯 Interactive Philosophy Resources")
+    
+    # Create tabs for different resource categories
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Quick Start", "Interactive Logic", "Philosophy Videos", "Research Tools", "Practice Hub"])
+    
+    with tab1:
+        st.subheader("🚀 Jump Into Philosophy")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📚 Essential First Reads")
+            
+            # Stanford Encyclopedia button - opens link
+            if st.button("📖 Stanford Encyclopedia: Metaphysics", use_container_width=True):
+                st.markdown("**Opening Stanford Encyclopedia of Philosophy...**")
+                st.markdown("**[Click here to access: Stanford Encyclopedia - Metaphysics](https://plato.stanford.edu/entries/metaphysics/)**")
+                st.success("Authoritative overview of metaphysical concepts - perfect for understanding the foundations behind our symbolic framework.")
+            
+            # Nagel PDF button  
+            if st.button("🧠 What Does It All Mean? (Free PDF)", use_container_width=True):
+                st.markdown("**Thomas Nagel's Classic Introduction**")
+                st.markdown("**[Access through Internet Archive](https://archive.org/details/whatdoesitallmea0000nage)**")
+                st.success("Essential 100-page introduction to philosophy. Check your university library's digital access for the latest edition.")
+            
+            # Philosophy Bites button
+            if st.button("🎭 Philosophy Bites Podcast", use_container_width=True):
+                st.markdown("**[Listen to Philosophy Bites](https://www.philosophybites.com/)**")
+                st.success("15-minute philosophy podcasts with world-class philosophers. Start with their logic and metaphysics episodes.")
+                
+                # Show recent episode suggestions
+                st.markdown("**Recommended episodes:**")
+                st.markdown("- 'Logic and Language' with Susan Haack")
+                st.markdown("- 'Metaphysics' with Peter van Inwagen") 
+                st.markdown("- 'What is Philosophy?' with Simon Critchley")
+        
+        with col2:
+            st.markdown("### 🔗 Logic Foundations")
+            
+            # Interactive Logic Tutorial
+            if st.button("⚡ Interactive Logic Tutorial", use_container_width=True):
+                st.markdown("**[Open Logitext - MIT's Visual Logic Tool](https://logitext.mit.edu/main)**")
+                st.success("MIT's interactive logic tool. Practice the symbols we explore in class with immediate feedback.")
+                
+                # Embed a simple logic exercise
+                st.markdown("**Try this in Logitext:**")
+                st.code("P ∧ Q → R")
+                st.info("This reads: 'If P and Q, then R' - notice how ∧ shows convergence leading to implication →")
+            
+            # Truth Table Generator
+            if st.toggle("🎯 Truth Table Generator", key="show_truth_tables"):
+                st.markdown("**[Open Stanford Truth Table Tool](https://web.stanford.edu/class/cs103/tools/truth-table-tool/)**")
+                st.success("Build the truth table of any expression right here. Input ∧, ∨, ¬, →, ↔ and see how they work.")
+                truth_table_generator()
+
+            # Argument Mapper
+            if st.button("📊 Argument Mapper", use_container_width=True):
+                st.markdown("**[Open Rationale Online](https://www.rationaleonline.com/)**")
+                st.success("Visual argument analysis - see how premises connect to conclusions geometrically.")
+                
+                # Show argument structure example
+                st.markdown("**Example argument structure:**")
+                st.markdown("""
+                ```
+                Premise 1: All logic symbols have geometric meaning
+                Premise 2: ∧ is a logic symbol
+                ────────────────────────────────────────────────
+                Conclusion: Therefore, ∧ has geometric meaning
+                ```
+                """)
+                st.info("Notice the geometric flow from premises to conclusion - just like ∧ shows convergence!")
+    
+    with tab2:
+        st.subheader("🔧 Interactive Logic Practice")
+        
+        st.markdown("### Quick Logic Challenges")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            if st.button("🎮 Logic Game 1: Symbol Matching", use_container_width=True):
+                st.markdown("**Challenge: Match symbols to meanings**")
+                symbols = ["∧", "∨", "¬", "→", "↔"]
+                meanings = ["AND", "OR", "NOT", "IMPLIES", "IF AND ONLY IF"]
+                
+                # Simple matching exercise
+                st.write("**Symbols:** " + " | ".join(symbols))
+                st.write("**Meanings:** " + " | ".join(meanings))
+                
+                answer = st.text_input("Type your matches (e.g., ∧=AND, ∨=OR...)")
+                if st.button("Check Answer"):
+                    if "∧=AND" in answer and "∨=OR" in answer:
+                        st.success("Correct! You understand the basic geometric intuitions.")
+                    else:
+                        st.error("Try again - think about convergence vs divergence.")
+        
+        with col2:
+            if st.toggle("🧩 Logic Game 2: Truth Tables", key="show_truth_table_game"):
+                truth_table_game()
+        
+        with col3:
+            if st.button("🌊 Epsilon Challenge", use_container_width=True):
+                st.markdown("**Challenge: Epsilon intuition**")
+                
+                epsilon_input = st.slider("What happens as ε approaches 0?", 0.01, 1.0, 0.5)
+                
+                if epsilon_input < 0.1:
+                    st.success("Exactly! As ε→0, linearity collapses into wave patterns.")
+                    st.write("🌊 You're grasping the infinitesimal principle!")
+                else:
+                    st.info("Try moving the slider closer to zero...")
+    
+    with tab3:
+        st.subheader("🎬 Philosophy in Action")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📺 Essential Philosophy Videos")
+            
+            if st.button("🏛️ Plato's Cave (Animated)", use_container_width=True):
+                st.markdown("**[TED-Ed: Plato's Allegory of the Cave](https://www.youtube.com/watch?v=1RWOpQXTltA)**")
+                st.info("4-minute animated explanation - connects to our dimensional transcendence concepts.")
+            
+            if st.button("🧠 What is Consciousness?", use_container_width=True):
+                st.markdown("**[Crash Course Philosophy #8](https://www.youtube.com/watch?v=GDrBFu5diBs)**")
+                st.info("Explores the hard problem of consciousness - relates to our being/thinking unity.")
+            
+            if st.button("⚖️ Kant in 90 Seconds", use_container_width=True):
+                st.markdown("**[Philosophy Tube: Kant](https://www.youtube.com/watch?v=xwOCmJevigw)**")
+                st.info("Quick intro to transcendental idealism - connects to our meta-geometric principles.")
+        
+        with col2:
+            st.markdown("### 🎓 Academic Lectures")
+            
+            if st.button("🔬 MIT: Metaphysics Lecture", use_container_width=True):
+                st.markdown("**[MIT OpenCourseWare](https://ocw.mit.edu/courses/linguistics-and-philosophy/24-221-metaphysics-fall-2005/)**")
+                st.info("Full university-level metaphysics course materials available free.")
+            
+            if st.button("📐 Logic & Mathematics", use_container_width=True):
+                st.markdown("**[Stanford: Mathematical Logic](https://www.youtube.com/playlist?list=PL_onPhFCkVQiZgE9U539_QmKLJV_0YvlQ)**")
+                st.info("Deep dive into formal logic systems - foundation for symbolic reasoning.")
+            
+            if st.button("🌀 String Theory & Philosophy", use_container_width=True):
+                st.markdown("**[Royal Institution Lectures](https://www.youtube.com/watch?v=YtdE662eY_M)**")
+                st.info("Physics meets philosophy - explores the mathematical nature of reality.")
+    
+    with tab4:
+        st.subheader("🔍 Research & Analysis Tools")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 🗃️ Academic Databases")
+            
+            if st.button("📚 PhilPapers Search", use_container_width=True):
+                st.markdown("**[PhilPapers.org](https://philpapers.org/)**")
+                st.info("Search over 2.9 million philosophy papers. Try searching 'logic symbolism' or 'metaphysics mathematics'.")
+                
+                search_term = st.text_input("Quick search term:")
+                if search_term:
+                    st.markdown(f"**[Search PhilPapers for '{search_term}'](https://philpapers.org/s/{search_term})**")
+            
+            if st.button("🎓 Stanford Encyclopedia", use_container_width=True):
+                st.markdown("**[Stanford Encyclopedia of Philosophy](https://plato.stanford.edu/)**")
+                st.info("Gold standard for philosophical information - peer-reviewed and authoritative.")
+            
+            if st.button("📖 Internet Encyclopedia", use_container_width=True):
+                st.markdown("**[Internet Encyclopedia of Philosophy](https://iep.utm.edu/)**")
+                st.info("Comprehensive philosophy articles - good for getting different perspectives.")
+        
+        with col2:
+            st.markdown("### 🛠️ Analysis Tools")
+            
+            if st.button("🗺️ Argument Mapping", use_container_width=True):
+                st.markdown("**[Rationale Online](https://www.rationaleonline.com/)**")
+                st.info("Visual argument analysis - map premises and conclusions like geometric structures.")
+            
+            if st.button("📊 Logic Checker", use_container_width=True):
+                st.markdown("**[Logic & Arguments](https://logic.stanford.edu/)**")
+                st.info("Stanford's logic tools - verify symbolic logic expressions.")
+            
+            if st.button("🔬 Citation Builder", use_container_width=True):
+                st.markdown("**[ZBib by Zotero](https://zbib.org/)**")
+                st.info("Auto-generate citations for philosophy papers - just paste URLs.")
+    
+    with tab5:
+        st.subheader("💪 Philosophy Practice Hub")
+        
+        st.markdown("### Quick Philosophy Workouts")
+        
+        practice_type = st.selectbox("Choose your practice:", [
+            "Argument Analysis",
+            "Symbol Translation", 
+            "Thought Experiments",
+            "Definition Building"
+        ])
+        
+        if practice_type == "Argument Analysis":
+            st.markdown("**Practice: Is this argument valid?**")
+            argument = st.text_area("Write one premise per line, then the conclusion after ∴ (or 'Therefore'):",
+                                    "P → Q\nQ → R\nP\n∴ R",
+                                    help="Use ¬ ∧ ∨ → ↔, or type ~ & | -> <-> (or not/and/or/implies/iff)")
+            
+            if st.button("Analyze Structure"):
+                if argument.strip():
+                    analyze_argument(argument)
+        
+        elif practice_type == "Symbol Translation":
+            st.markdown("**Practice: Translate to symbols**")
+            english = st.text_input("English statement:", "If it rains, then the ground gets wet")
+            
+            if st.button("Show Translation"):
+                if "if" in english.lower() and "then" in english.lower():
+                    st.write("**Symbolic form:** P → Q")
+                    st.write("**Where:** P = 'it rains', Q = 'ground gets wet'")
+                    st.write("**Geometric meaning:** Arrow shows causal flow")
+        
+        elif practice_type == "Thought Experiments":
+            
+            selected = st.selectbox("Choose a thought experiment:", THOUGHT_EXPERIMENTS)
+            if st.button("Explore This"):
+                st.info("Think through the implications... what does this reveal about reality's nature?")
+        
+        elif practice_type == "Definition Building":
+            st.markdown("**Practice: Define key terms**")
+            term = st.selectbox("Define:", ["Metaphysics", "Logic", "Epsilon", "Being", "Truth"])
+            
+            definition = st.text_area(f"Your definition of {term}:")
+            
+            if st.button("Compare with Standard"):
+                st.write(f"**Standard definition:** {DEFINITIONS[term]}")
+                if definition:
+                    st.write(f"**Your definition:** {definition}")
+    
+    st.markdown("---")
+    st.warning("**Academic Note**: This course presents an interpretive framework connecting logic symbols to metaphysical concepts. While this can stimulate philosophical thinking, distinguish between established scholarship and speculative frameworks when conducting research.")
+    
+    # Quick access footer
+    st.markdown("### 🔗 Quick Links")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown("**[Stanford Phil](https://plato.stanford.edu/)**")
+    with col2:
+        st.markdown("**[PhilPapers](https://philpapers.org/)**")
+    with col3:
+        st.markdown("**[MIT Logic](https://logitext.mit.edu/)**")
+    with col4:
+        st.markdown("**[Philosophy Bites](https://www.philosophybites.com/)**")
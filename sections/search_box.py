@@ -0,0 +1,27 @@
+"""Sidebar search over the whole course."""
+
+import streamlit as st
+
+from services import search_course
+
+KIND_ICONS = {"Question": "❓", "Symbol": "🔣", "Definition": "📖", "Thought experiment": "💭", "Resource": "🔗"}
+
+def _open(page):
+    st.session_state.page = page
+
+def render():
+    """Search box with the top hits, each linking to the page it lives on"""
+    query = st.text_input("🔍 Search the course", key="search_query",
+                          placeholder="e.g. ∧, conjunction, Plato's cave")
+    if not query.strip():
+        return
+    hits = search_course(query)
+    if not hits:
+        st.caption("No matches.")
+        return
+    for i, hit in enumerate(hits):
+        document = hit.document
+        st.markdown(f"{KIND_ICONS.get(document.kind, '•')} **{document.title}**")
+        if hit.snippet:
+            st.caption(hit.snippet)
+        st.button(f"Open {document.page}", key=f"search_open_{i}", on_click=_open, args=(document.page,))
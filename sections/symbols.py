@@ -0,0 +1,109 @@
+"""Logic Symbol Reference page."""
+
+import streamlit as st
+
+import bdd
+import fol
+import logic
+from content import SYMBOLS_DATA
+
+MODEL_DEFINITIONS = """Even(x) := x % 2 == 0
+Less(x, y) := x < y
+Divides(x, y) := x > 0 and y % x == 0
+Primes = {2, 3, 5, 7}
+Nothing = ∅"""
+MODEL_EXAMPLES = ["∃x ∀y (x ≤ y)", "∀x ∃y Less(x, y)", "∀x (x ∈ Primes → ¬Even(x) ∨ x = 2)",
+                  "∃x x ∈ Nothing", "∀x. Even(x) → ∃y Divides(y, x)"]
+FORMULA_HELP = "Use ¬ ∧ ∨ → ↔, or type ~ & | -> <-> (or not/and/or/implies/iff)"
+
+
+def show_minimal_forms(label, text):
+    forms = bdd.minimal_forms(text)
+    too_long = f"more than {bdd.MAX_TERMS} terms"
+    st.markdown(f"**{label}**  \nDNF: `{forms.dnf or too_long}`  \nCNF: `{forms.cnf or too_long}`")
+    if not forms.exact:
+        st.caption("Too large to prove a minimum; these forms are irredundant but may not be the shortest.")
+
+
+def equivalence_checker():
+    """Do two formulas say the same thing? (≡ / ↔ in practice)"""
+    st.subheader("≡ Equivalence Checker")
+    st.write("Two formulas are equivalent (≡) when their biconditional (↔) is true on every row.")
+    col1, col2 = st.columns(2)
+    with col1:
+        left = st.text_input("First formula", "P → Q", key="equivalence_left", help=FORMULA_HELP)
+    with col2:
+        right = st.text_input("Second formula", "¬Q → ¬P", key="equivalence_right", help=FORMULA_HELP)
+    try:
+        left, right = (logic.to_text(logic.parse_tree(text)) for text in (left, right))
+        result = bdd.equivalence(left, right)
+    except logic.LogicSyntaxError as e:
+        st.error(f"Can't read that formula: {e}")
+        return
+    except bdd.DiagramTooLarge as e:
+        st.error(str(e))
+        return
+
+    if result.equivalent:
+        st.success(f"{left} ≡ {right}: they agree on every assignment.")
+    else:
+        values = ", ".join(f"{name}={'T' if value else 'F'}" for name, value in result.witness.items())
+        if len(result.witness) < len(logic.variables(logic.parse_tree(f"({left}) ∧ ({right})"))):
+            values += " (and anything for the rest)"
+        st.error(f"Not equivalent. With {values} the first formula is "
+                 f"{'true' if result.left_value else 'false'} and the second is "
+                 f"{'false' if result.left_value else 'true'}.")
+    with st.expander("Simplest forms"):
+        show_minimal_forms("First formula", left)
+        show_minimal_forms("Second formula", right)
+
+
+def model_checker():
+    """Evaluate ∀ / ∃ / ∈ / ∅ formulas over a small world the student defines"""
+    st.subheader("∀ ∃ Model Checker")
+    st.write("Define a world of numbers 0, 1, …, n−1 with some predicates and sets, "
+             "then ask whether a quantified statement is true in it.")
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        size = st.number_input("Domain size n", 1, fol.MAX_DOMAIN, 10, key="model_size")
+    with col2:
+        example = st.selectbox("Example statements", MODEL_EXAMPLES, key="model_example")
+    definitions = st.text_area("Predicates and sets (one per line)", MODEL_DEFINITIONS, key="model_definitions",
+                               help="Name(x, y) := expression using + - * // % and comparisons, "
+                                    "or Name = {1, 2, 3}, or Name = ∅")
+    formula = st.text_input("Statement", example, key=f"model_formula_{example}",
+                            help="∀x / ∃x cover the next item; widen them with parentheses or a dot (∀x. …). "
+                                 "Use ∈, ∉, ∅, =, ≠, <, ≤ and ¬ ∧ ∨ → ↔ (or forall/exists/in and ASCII)")
+    try:
+        verdict = fol.check(int(size), definitions, formula)
+    except (logic.LogicSyntaxError, fol.ModelError) as e:
+        st.error(str(e))
+        return
+
+    tree = fol.parse(formula)
+    reading = fol.to_text(tree)
+    if verdict.value:
+        st.success(f"True in this world: {reading}")
+    else:
+        st.error(f"False in this world: {reading}")
+    if verdict.witness:
+        name, element = verdict.witness
+        st.write(f"{'Counterexample' if tree.op == 'forall' else 'Example'}: {name} = {element}")
+    st.caption(f"Checked {verdict.cells:,} combination(s) of elements.")
+
+
+def render():
+    """Symbol glossary"""
+    st.header("📖 Logic Symbol Geometry Reference")
+    
+    for symbol, (name, geometry, meaning) in SYMBOLS_DATA.items():
+        with st.expander(f"**{symbol}** - {name}"):
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                st.markdown(f"## {symbol}")
+            with col2:
+                st.write(f"**Geometric Form**: {geometry}")
+                st.write(f"**Metaphysical Meaning**: {meaning}")
+
+    equivalence_checker()
+    model_checker()
@@ -0,0 +1,201 @@
+"""Metaphysical Visualizations page."""
+
+import streamlit as st
+
+import figures
+from figure_payload import send
+from services import cached_payload, get_figure_cache, get_metrics, get_payload_cache, timed
+
+def show_figure(payload):
+    """Send an already-encoded figure to the browser"""
+    with get_metrics().span("figure/send"):
+        send(payload)
+
+# Each tab is its own fragment: moving a tab's slider or toggle reruns and
+# resends that tab only, not the page, the sidebar or the other tabs.
+
+@st.fragment
+@timed("viz/linear")
+def linear_tab():
+    """Linear illusion next to sinusoidal reality"""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Linear Illusion (Macro Scale)")
+        show_figure(cached_payload("linear", figures.linear_figure))
+
+    with col2:
+        st.subheader("Sinusoidal Reality (True Nature)")
+        show_figure(cached_payload("sinusoidal", figures.sinusoidal_figure))
+
+@st.fragment
+@timed("viz/sphere")
+def sphere_tab(low_power):
+    """Holographic sphere"""
+    st.subheader("3D Spherical Totality")
+    fig3 = cached_payload("holographic_sphere", figures.holographic_sphere_figure,
+                         resolution=figures.mesh_resolution(0, 1.0, low_power))
+    show_figure(fig3)
+    st.info("💡 **Insight**: Every point on this sphere exists only in relation to all other points - no isolated existence possible.")
+
+@st.fragment
+@timed("viz/perturbation")
+def perturbation_tab(low_power):
+    """Perfect sphere next to its wave-perturbed counterpart"""
+    st.subheader("Wave-Perturbed Reality: Perfect Forms Dissolve")
+
+    animated = st.toggle("🎞️ Scrub in browser", key="animate_perturbation",
+                         help="Precompute every frequency/strength combination once and scrub the sliders without a server round trip")
+
+    if animated:
+        # Every slider combination ships once; scrubbing happens entirely client-side
+        perturbation_strength = None
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Perfect Sphere (Platonic Ideal)**")
+            fig_perfect = cached_payload("perfect_sphere", figures.perfect_sphere_figure,
+                                        resolution=figures.mesh_resolution(0, 0.5, low_power))
+            show_figure(fig_perfect)
+        with col2:
+            st.write("**Wave-Perturbed Reality (ε-Scale Truth)**")
+            fig_animated = cached_payload("perturbed_sphere_animation", figures.perturbed_sphere_animation,
+                                         resolution=16 if low_power else 25)
+            show_figure(fig_animated)
+    else:
+        # Controls for the perturbation
+        col1, col2 = st.columns(2)
+        with col1:
+            wave_frequency = st.slider("Wave Frequency", 1, 10, 5, 1, 
+                                     help="How many waves appear on the sphere surface")
+        with col2:
+            perturbation_strength = st.slider("Perturbation Strength", 0.0, 0.5, 0.2, 0.05,
+                                            help="How much the waves distort the perfect sphere")
+
+        # Create comparison: perfect vs perturbed
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**Perfect Sphere (Platonic Ideal)**")
+            fig_perfect = cached_payload("perfect_sphere", figures.perfect_sphere_figure,
+                                        resolution=figures.mesh_resolution(0, 0.5, low_power))
+            show_figure(fig_perfect)
+
+        with col2:
+            st.write("**Wave-Perturbed Reality (ε-Scale Truth)**")
+            fig_perturbed = cached_payload("perturbed_sphere", figures.perturbed_sphere_figure,
+                                          frequency=wave_frequency, strength=perturbation_strength,
+                                          resolution=figures.mesh_resolution(wave_frequency, 0.5, low_power))
+            show_figure(fig_perturbed)
+
+    # Metaphysical explanation
+    if perturbation_strength is None:
+        st.info("💡 Drag the strength slider under the plot to watch geometric ideals become wave-reality at the ε-scale.")
+    elif perturbation_strength > 0.1:
+        st.success("🌊 **Epsilon Revelation**: Even 'perfect' geometric forms dissolve into wave patterns when examined closely!")
+    else:
+        st.info("💡 Increase perturbation strength to see how geometric ideals become wave-reality at the ε-scale.")
+
+    st.markdown("""
+    **Metaphysical Insight**: This demonstrates that what Plato called "perfect Forms" are actually 
+    sinusoidal perturbations when examined at the epsilon (ε) scale. The "perfect sphere" is a 
+    macroscopic approximation - reality's foundation is wave-like vibration.
+
+    - **Left**: The Platonic ideal - what we think reality should be
+    - **Right**: Actual reality - waves perturbing perfect forms
+    - **Truth**: Geometry itself emerges from underlying sinusoidal patterns
+    """)
+
+@st.fragment
+@timed("viz/epsilon")
+def epsilon_tab():
+    """Zoom from the macro scale down to the epsilon scale"""
+    st.subheader("Epsilon (ε) Scale Revelation")
+    animated = st.toggle("🎞️ Scrub in browser", key="animate_epsilon",
+                         help="Precompute the whole epsilon range once and zoom without a server round trip")
+
+    if animated:
+        fig4 = cached_payload("epsilon_animation", figures.epsilon_animation)
+        show_figure(fig4)
+        st.caption("Below ε = 0.05, linearity collapses - everything is wave-like.")
+    else:
+        epsilon_scale = st.slider("Zoom to Epsilon Scale", 0.01, 1.0, 0.1, 0.01)
+
+        fig4 = cached_payload("epsilon", figures.epsilon_figure, epsilon_scale=epsilon_scale)
+        show_figure(fig4)
+
+        if epsilon_scale < 0.05:
+            st.success("🎯 **Linearity Collapses!** At this scale, everything is wave-like.")
+
+@st.fragment
+@timed("viz/explorer")
+def explorer_tab(low_power):
+    """Pick a metaphysical perspective"""
+    st.subheader("Interactive Metaphysical State Explorer")
+    mode = st.selectbox("Choose metaphysical perspective:", [
+        "Linear Illusion (Macroscopic)",
+        "Sinusoidal Emergence (ε Scale)",
+        "3D Transcendence (Dimensional)",
+        "Point Interdependence (Relational)",
+        "Spherical Totality (Holographic)",
+        "Wave-Perturbed Forms (Epsilon Reality)"
+    ])
+
+    if mode == "Linear Illusion (Macroscopic)":
+        st.write("**State**: Conventional reality - straight lines and linear causation")
+        # Show linear visualization
+    elif mode == "Sinusoidal Emergence (ε Scale)":
+        st.write("**State**: Wave nature revealed - linearity dissolves into oscillation")
+        # Show sinusoidal visualization
+    elif mode == "3D Transcendence (Dimensional)":
+        st.write("**State**: Breaking free from 2D projections into true dimensional reality")
+        # Show 3D visualization
+    elif mode == "Point Interdependence (Relational)":
+        st.write("**State**: No isolated points - everything exists through relationships")
+        # Show network visualization
+    elif mode == "Spherical Totality (Holographic)":
+        st.write("**State**: Complete holographic reality where each part contains the whole")
+        # Show sphere visualization
+    elif mode == "Wave-Perturbed Forms (Epsilon Reality)":
+        st.write("**State**: Perfect geometric forms reveal their sinusoidal foundation")
+        # Quick perturbed sphere
+        fig_quick = cached_payload("quick_perturbed", figures.quick_perturbed_figure,
+                                  resolution=figures.mesh_resolution(4, 1.0, low_power))
+        show_figure(fig_quick)
+
+def render():
+    """Create the metaphysical visualizations"""
+    st.header("📊 Metaphysical Visualizations")
+
+    low_power = st.toggle("🔋 Low-power mode", key="low_power",
+                          help="Render lighter 3D meshes on slower devices")
+
+    # Tabs for different visualizations
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Linear vs Sinusoidal", "3D Spherical Reality", "Wave-Perturbed Reality", "Epsilon Scale", "Interactive Explorer"])
+
+    with tab1:
+        linear_tab()
+    with tab2:
+        sphere_tab(low_power)
+    with tab3:
+        perturbation_tab(low_power)
+    with tab4:
+        epsilon_tab()
+    with tab5:
+        explorer_tab(low_power)
+
+    with st.expander("⚙️ Figure cache statistics"):
+        stats = get_figure_cache().stats()
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Hits", stats["hits"])
+        c2.metric("Misses", stats["misses"])
+        c3.metric("Hit rate", f"{stats['hit_rate']:.0%}")
+        c4.metric("Cached figures", stats["entries"])
+        payloads = get_payload_cache().stats()
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Encoded hits", payloads["hits"])
+        c2.metric("Encoded payloads", payloads["payloads"],
+                  help=f"{payloads['bytes'] / 1024:.0f} KiB, {payloads['compacted_bytes'] / 1024:.0f} KiB smaller "
+                       "than full-precision arrays")
+        c3.metric("Encoding skipped", f"{payloads['bytes_saved'] / 1024 / 1024:.1f} MiB")
+        c4.metric("Time saved", f"{payloads['seconds_saved'] * 1000:.0f} ms")
+
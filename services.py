@@ -0,0 +1,195 @@
+"""Process-wide services and session helpers shared by every page.
+
+Only lightweight modules are imported here so the app shell stays cheap;
+page-specific dependencies (numpy, plotly, anthropic) load with the page
+that needs them.
+"""
+
+import functools
+import os
+
+import streamlit as st
+
+import assistant
+import chat_history
+import progress_store
+import question_bank
+import search
+from chat_history import ChatArchive, ChatHistory
+from class_analytics import ClassAnalytics
+from figure_cache import FigureCache, make_key
+from figure_payload import PayloadCache, encode
+from metrics import Exporter, Metrics
+from progress_store import PROGRESS_FIELDS, ProgressStore
+from response_cache import ResponseCache
+from scheduler import AssistantScheduler
+from search import SearchIndex
+
+def get_setting(name, default=None):
+    """Read a deployment setting from Streamlit secrets, then the environment"""
+    try:
+        return st.secrets[name]
+    except (KeyError, FileNotFoundError):
+        return os.environ.get(name, default)
+
+def get_api_key():
+    """Anthropic key from secrets, or the one typed into the sidebar for testing"""
+    return get_setting("ANTHROPIC_API_KEY") or st.session_state.get("manual_api_key", "")
+
+def get_question_bank():
+    """Shared, immutable question bank; reloaded when the bank file changes"""
+    return question_bank.load(get_setting("QUESTION_BANK_PATH", question_bank.DEFAULT_PATH))
+
+CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content.py")
+RESOURCES_PAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sections", "resources.py")
+
+@st.cache_resource
+def get_search_index():
+    """Process-wide search index over questions, symbols, definitions and resources"""
+    index = SearchIndex()
+    refresh_search_index(index)
+    return index
+
+def refresh_search_index(index):
+    """Re-index only the sources whose file changed since they were last indexed"""
+    bank = get_question_bank()
+    if index.version("questions") != bank.version:
+        index.update("questions", bank.version, search.question_documents(bank.questions))
+    content_version = os.path.getmtime(CONTENT_PATH)
+    if index.version("content") != content_version:
+        index.update("content", content_version, search.content_documents(CONTENT_PATH))
+    resources_version = os.path.getmtime(RESOURCES_PAGE_PATH)
+    if index.version("resources") != resources_version:
+        index.update("resources", resources_version, search.resource_documents(RESOURCES_PAGE_PATH))
+
+def search_course(query, limit=8):
+    """Ranked hits for the sidebar search box"""
+    index = get_search_index()
+    with get_metrics().span("search/query"):
+        refresh_search_index(index)
+        return index.search(query, limit)
+
+@st.cache_resource
+def get_progress_store():
+    """Durable, write-behind store of every student's quiz progress"""
+    return ProgressStore(get_setting("PROGRESS_DB_PATH", progress_store.DEFAULT_PATH))
+
+@st.cache_resource
+def get_class_analytics():
+    """Class-wide answer counters and leaderboard, updated per submission"""
+    return ClassAnalytics()
+
+def save_progress():
+    """Queue this student's quiz progress; never blocks on disk"""
+    student_id = st.session_state.get("student_id", "").strip()
+    if student_id:
+        get_progress_store().save(student_id, {f: st.session_state[f] for f in PROGRESS_FIELDS})
+
+def show_progress():
+    """Completion and score metrics for the sidebar"""
+    if len(get_question_bank()):
+        progress_pct = min(st.session_state.current / len(get_question_bank()), 1) * 100
+        st.metric("Completion", f"{progress_pct:.1f}%")
+        st.metric("Score", f"{st.session_state.score} XP")
+
+def restore_progress():
+    """Pick up where a returning student left off"""
+    student_id = st.session_state.student_id.strip()
+    if not student_id:
+        st.query_params.pop("student", None)
+        return
+    saved = get_progress_store().load(student_id)
+    if saved:
+        for field in PROGRESS_FIELDS:
+            if field in saved:
+                st.session_state[field] = saved[field]
+    else:
+        save_progress()
+    # Keep the ID in the URL so a reload or reconnect restores automatically
+    st.query_params["student"] = student_id
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide figure cache shared by every student session"""
+    return FigureCache(max_entries=256, ttl_seconds=3600)
+
+def cached_figure(name, builder, **params):
+    """Fetch a ready-to-send figure keyed on its visual parameters"""
+    def build():
+        with get_metrics().span(f"figure/build/{name}"):
+            return builder(**params)
+    return get_figure_cache().get_or_build(make_key(name, **params), build)
+
+@st.cache_resource
+def get_payload_cache():
+    """Process-wide cache of figures already validated and JSON-encoded for the browser"""
+    return PayloadCache(max_entries=256)
+
+def cached_payload(name, builder, **params):
+    """Encoded figure for ``figure_payload.send``; validation and encoding run once per figure.
+
+    Arrays go out narrowed to float32 / small ints unless COMPACT_FIGURES is "0".
+    """
+    def build():
+        fig = cached_figure(name, builder, **params)
+        with get_metrics().span(f"figure/encode/{name}"):
+            return encode(fig, compact_arrays=get_setting("COMPACT_FIGURES", "1") != "0")
+    return get_payload_cache().get_or_build(make_key(name, **params), build)
+
+@st.cache_resource
+def get_metrics():
+    """Process-wide timing histograms for the hot paths"""
+    return Metrics()
+
+@st.cache_resource
+def get_metrics_exporter():
+    """Periodic snapshot writer, running only when METRICS_EXPORT_PATH is set"""
+    path = get_setting("METRICS_EXPORT_PATH")
+    if not path:
+        return None
+    return Exporter(get_metrics(), path, interval=float(get_setting("METRICS_EXPORT_INTERVAL", 15)))
+
+def timed(name):
+    """Record every call of the decorated function under span ``name``"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_metrics().span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+@st.cache_resource
+def get_anthropic_client(api_key):
+    """One pooled client per API key, shared by every session in the process"""
+    return assistant.create_client(
+        api_key,
+        base_url=get_setting("ANTHROPIC_BASE_URL"),
+        max_connections=int(get_setting("ASSISTANT_MAX_CONNECTIONS", assistant.MAX_CONNECTIONS)),
+        max_keepalive_connections=int(get_setting("ASSISTANT_MAX_KEEPALIVE_CONNECTIONS",
+                                                  assistant.MAX_KEEPALIVE_CONNECTIONS)),
+    )
+
+@st.cache_resource
+def get_assistant_scheduler():
+    """Server-wide rate limit, in-flight cap and fair queue for assistant calls"""
+    return AssistantScheduler(
+        rate_per_minute=float(get_setting("ASSISTANT_RATE_PER_MINUTE", 50)),
+        burst=int(get_setting("ASSISTANT_BURST", 10)),
+        max_in_flight=int(get_setting("ASSISTANT_MAX_IN_FLIGHT", 8)),
+    )
+
+@st.cache_resource
+def get_chat_archive():
+    """Compressed on-disk store for chat turns that fell out of a session's window"""
+    return ChatArchive(get_setting("CHAT_ARCHIVE_PATH", chat_history.DEFAULT_PATH))
+
+def new_chat_history():
+    """Chat history for this session, keeping CHAT_WINDOW_TURNS turns in memory"""
+    return ChatHistory(st.session_state.session_id, get_chat_archive(),
+                       window=int(get_setting("CHAT_WINDOW_TURNS", chat_history.WINDOW_TURNS)))
+
+@st.cache_resource
+def get_response_cache():
+    """On-disk cache of answers to the suggested questions, shared by all sessions"""
+    return ResponseCache()
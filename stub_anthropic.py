@@ -0,0 +1,141 @@
+"""Local stand-in for the Anthropic Messages API.
+
+Serves ``POST /v1/messages`` in both blocking and streaming (SSE) form with
+configurable latency, so the assistant can be exercised in tests, benchmarks
+and load runs without network access or API spend. Point the app at it with
+the ``ANTHROPIC_BASE_URL`` setting:
+
+    python stub_anthropic.py --port 8765 --first-token-latency 0.4
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stub streamlit run app.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class StubConfig:
+    """Latency and response-shape knobs shared by all handler threads"""
+
+    def __init__(self, first_token_latency: float = 0.2, token_latency: float = 0.005,
+                 answer_tokens: int = 60):
+        self.first_token_latency = first_token_latency
+        self.token_latency = token_latency
+        self.answer_tokens = answer_tokens
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count(self) -> int:
+        with self._lock:
+            self.requests += 1
+            return self.requests
+
+
+def _answer_tokens(question: str, n: int):
+    words = f"Stub reflection on: {question}".split()
+    filler = "being and truth converge where linearity dissolves into waves".split()
+    tokens = words + [filler[i % len(filler)] for i in range(max(n - len(words), 0))]
+    return [w + " " for w in tokens[:max(n, 1)]]
+
+
+def _text_of(content) -> str:
+    if isinstance(content, str):
+        return content
+    return " ".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pooling is exercised
+    config: StubConfig = StubConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if not self.path.startswith("/v1/messages"):
+            self.send_error(404)
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        n = self.config.count()
+        messages = body.get("messages") or [{"content": ""}]
+        tokens = _answer_tokens(_text_of(messages[-1]["content"]),
+                                min(self.config.answer_tokens, body.get("max_tokens", 1000)))
+        input_tokens = sum(len(_text_of(m["content"]).split()) for m in messages)
+        message = {
+            "id": f"msg_stub_{n}", "type": "message", "role": "assistant",
+            "model": body.get("model", "stub"), "content": [],
+            "stop_reason": None, "stop_sequence": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": 0},
+        }
+        time.sleep(self.config.first_token_latency)
+        if body.get("stream"):
+            self._stream(message, tokens)
+        else:
+            time.sleep(self.config.token_latency * len(tokens))
+            message.update(content=[{"type": "text", "text": "".join(tokens)}],
+                           stop_reason="end_turn")
+            message["usage"]["output_tokens"] = len(tokens)
+            payload = json.dumps(message).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def _chunk(self, event: str, data: dict) -> None:
+        raw = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(raw):x}\r\n".encode("ascii") + raw + b"\r\n")
+        self.wfile.flush()
+
+    def _stream(self, message: dict, tokens) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk("message_start", {"type": "message_start", "message": message})
+        self._chunk("content_block_start", {"type": "content_block_start", "index": 0,
+                                            "content_block": {"type": "text", "text": ""}})
+        for token in tokens:
+            self._chunk("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                "delta": {"type": "text_delta", "text": token}})
+            time.sleep(self.config.token_latency)
+        self._chunk("content_block_stop", {"type": "content_block_stop", "index": 0})
+        self._chunk("message_delta", {"type": "message_delta",
+                                      "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                      "usage": {"output_tokens": len(tokens)}})
+        self._chunk("message_stop", {"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+def serve(port: int = 0, config: Optional[StubConfig] = None) -> ThreadingHTTPServer:
+    """Start the stub in a daemon thread; ``server.server_address`` has the bound port"""
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"config": config or StubConfig()})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def base_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Anthropic Messages API for local testing")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--first-token-latency", type=float, default=0.2, help="seconds before the first token")
+    parser.add_argument("--token-latency", type=float, default=0.005, help="seconds between tokens")
+    parser.add_argument("--answer-tokens", type=int, default=60)
+    args = parser.parse_args()
+
+    server = serve(args.port, StubConfig(args.first_token_latency, args.token_latency, args.answer_tokens))
+    print(f"Stub Anthropic API listening on {base_url(server)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,121 @@
+import random
+import warnings
+
+import pytest
+
+import fol
+
+DEFINITIONS = """
+Even(x) := x % 2 == 0
+Less(x, y) := x < y
+Divides(x, y) := x > 0 and y % x == 0
+Sum(x, y, z) := x + y == z
+Primes = {2, 3, 5}
+Nothing = ∅
+"""
+PREDICATES = {
+    "Even": lambda x: x % 2 == 0,
+    "Less": lambda x, y: x < y,
+    "Divides": lambda x, y: x > 0 and y % x == 0,
+    "Sum": lambda x, y, z: x + y == z,
+}
+SETS = {"Primes": {2, 3, 5}, "Nothing": set()}
+VARIABLES = ["x", "y", "z"]
+
+
+def random_formula(rng, bound, depth):
+    if bound and (depth == 0 or rng.random() < 0.3):
+        def term():
+            return rng.choice(bound) if rng.random() < 0.8 else str(rng.randrange(3))
+
+        kind = rng.randrange(6)
+        if kind == 0:
+            return f"Even({term()})"
+        if kind == 1:
+            return f"Less({term()}, {term()})"
+        if kind == 2:
+            return f"Divides({term()}, {term()})"
+        if kind == 3:
+            return f"Sum({term()}, {term()}, {term()})"
+        if kind == 4:
+            return f"{term()} {rng.choice(['∈', '∉'])} {rng.choice(['Primes', 'Nothing', '∅'])}"
+        return f"{term()} {rng.choice(['=', '≠', '<', '≤'])} {term()}"
+    choice = rng.random()
+    free = [v for v in VARIABLES if v not in bound]
+    if not bound or (free and choice < 0.35):
+        name = rng.choice(free)
+        return f"{rng.choice('∀∃')}{name} ({random_formula(rng, bound + [name], depth - 1)})"
+    if choice < 0.5:
+        return f"¬({random_formula(rng, bound, depth - 1)})"
+    connective = rng.choice(["∧", "∨", "→", "↔"])
+    return f"({random_formula(rng, bound, depth - 1)}) {connective} ({random_formula(rng, bound, depth - 1)})"
+
+
+def evaluate(node, n, env):
+    op = node.op
+    if op in ("forall", "exists"):
+        results = (evaluate(node.args[0], n, {**env, node.name: value}) for value in range(n))
+        return all(results) if op == "forall" else any(results)
+    if op == "not":
+        return not evaluate(node.args[0], n, env)
+    if op in ("and", "or", "implies", "iff"):
+        a, b = (evaluate(child, n, env) for child in node.args)
+        return {"and": a and b, "or": a or b, "implies": not a or b, "iff": a == b}[op]
+    if op in ("true", "false"):
+        return op == "true"
+    values = [env[value] if kind == "var" else value for kind, value in node.args]
+    if op == "pred":
+        return PREDICATES[node.name](*values)
+    if op == "in":
+        return values[0] in SETS.get(node.name, set())
+    return {"==": values[0] == values[1], "!=": values[0] != values[1], "<": values[0] < values[1],
+            "<=": values[0] <= values[1], ">": values[0] > values[1], ">=": values[0] >= values[1]}[op]
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    n = rng.randint(6, 8)
+    text = random_formula(rng, [], 4)
+    node = fol.parse(text)
+    verdict = fol.check(n, DEFINITIONS, text)
+    assert verdict.value == evaluate(node, n, {})
+    if verdict.witness:
+        name, element = verdict.witness
+        assert node.op in ("forall", "exists") and name == node.name
+        # A counterexample refutes the ∀ body; an example satisfies the ∃ body
+        assert evaluate(node.args[0], n, {name: element}) == (node.op == "exists")
+
+
+def test_chunked_quantifiers(monkeypatch):
+    monkeypatch.setattr(fol, "CHUNK_CELLS", 7)
+    for seed in range(50):
+        rng = random.Random(seed)
+        text = random_formula(rng, [], 4)
+        assert fol.model(6, DEFINITIONS.strip()).check(fol.parse(text)).value == evaluate(fol.parse(text), 6, {})
+
+
+def test_guarded_division_does_not_warn():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert fol.check(10, DEFINITIONS, "∀x. Even(x) → ∃y Divides(y, x)").value
+        assert fol.check(10, "Q(x) := not (x == 0 or 5 // x > 1)", "∃x Q(x)").witness == ("x", 3)
+
+
+@pytest.mark.parametrize("size, definitions, formula, message", [
+    (10, "P(x) := x ** -1 == 0", "∀x P(x)", "Negative exponents"),
+    (100, "Big(x) := 2 ** x > 0", "∀x Big(x)", "too large"),
+    (100_000, "Big(x) := x * x * x * x > 0", "∀x Big(x)", "too large"),
+    (10, "Bad(x, y) := y % x == 0", "∀x ∀y Bad(x, y)", "divides by zero"),
+    (10, "Bad(x, y) := y // x == 0", "∃x ∃y Bad(x, y)", "divides by zero"),
+])
+def test_arithmetic_errors(size, definitions, formula, message):
+    with pytest.raises(fol.ModelError, match=message):
+        fol.check(size, definitions, formula)
+
+
+def test_out_of_domain_constants():
+    with pytest.raises(fol.ModelError):
+        fol.check(6, DEFINITIONS, "Even(6)")
+    with pytest.raises(fol.ModelError):
+        fol.check(6, DEFINITIONS, "¬Even(6)")
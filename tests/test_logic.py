@@ -0,0 +1,106 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+import logic
+from sections.resources import truth_table_csv
+
+CONNECTIVES = ["∧", "∨", "→", "↔"]
+
+
+def random_formula(rng, atoms, depth):
+    if depth == 0 or rng.random() < 0.2:
+        return rng.choice(["⊤", "⊥"]) if rng.random() < 0.05 else rng.choice(atoms)
+    if rng.random() < 0.2:
+        return f"¬{random_formula(rng, atoms, depth - 1)}"
+    return f"({random_formula(rng, atoms, depth - 1)} {rng.choice(CONNECTIVES)} " \
+           f"{random_formula(rng, atoms, depth - 1)})"
+
+
+def evaluate(node, values):
+    if node.op == "var":
+        return values[node.name]
+    if node.op in ("true", "false"):
+        return node.op == "true"
+    args = [evaluate(child, values) for child in node.args]
+    if node.op == "not":
+        return not args[0]
+    a, b = args
+    return {"and": a and b, "or": a or b, "implies": not a or b, "iff": a == b}[node.op]
+
+
+def truth_values(formula):
+    """The formula's value on every row, in table order: all-true first, first variable slowest"""
+    return [evaluate(formula.root, dict(zip(formula.variables, bits)))
+            for bits in itertools.product([True, False], repeat=len(formula.variables))]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    # Up to 9 variables, so both the row path (< 6) and the 64-row word path are covered
+    atoms = [f"x{i}" for i in range(rng.randint(1, 9))]
+    formula = logic.Formula(random_formula(rng, atoms, 5))
+    expected = truth_values(formula)
+    assert formula.rows(0, formula.row_count)[:, -1].tolist() == expected
+    assert formula.count_models() == sum(expected)
+    start = rng.randrange(formula.row_count)
+    assert formula.rows(start, start + 7)[:, -1].tolist() == expected[start:start + 7]
+
+
+def test_chunked_count(monkeypatch):
+    monkeypatch.setattr(logic, "CHUNK_WORDS", 3)
+    rng = random.Random(0)
+    for _ in range(20):
+        formula = logic.Formula(random_formula(rng, [f"x{i}" for i in range(10)], 6))
+        assert formula.count_models() == sum(truth_values(formula))
+
+
+def test_text_round_trip():
+    rng = random.Random(1)
+    for _ in range(200):
+        tree = logic.parse_tree(random_formula(rng, ["P", "Q", "R"], 5))
+        assert logic.parse_tree(logic.to_text(tree)) == tree
+
+
+def test_columns_and_classification():
+    formula = logic.parse("(P → Q) ∧ (Q → P)")
+    assert formula.columns == ("P", "Q", "P → Q", "Q → P", "(P → Q) ∧ (Q → P)")
+    assert formula.classify() == "contingent"
+    assert logic.parse("P ∨ ¬P").classify() == "tautology"
+    assert logic.parse("P ∧ ¬P").classify() == "contradiction"
+    assert str(logic.parse("a -> b -> c")) == "a → b → c"
+    assert str(logic.parse("(a -> b) -> c")) == "(a → b) → c"
+
+
+def test_last_rows_of_a_huge_table():
+    formula = logic.parse(" ∧ ".join(f"x{i}" for i in range(logic.MAX_VARIABLES)))
+    rows = formula.rows(formula.row_count - 2, formula.row_count + 5)
+    assert rows.shape == (2, len(formula.columns))
+    assert not rows[:, -1].any()
+    assert formula.rows(0, 1)[0].all()
+
+
+def test_syntax_errors():
+    for text in ["", "P ∧", "(P", "P Q", "P $ Q", "(" * 5000 + "P" + ")" * 5000]:
+        with pytest.raises(logic.LogicSyntaxError):
+            logic.parse(text)
+    with pytest.raises(logic.LogicSyntaxError):
+        logic.parse(" ∧ ".join(f"x{i}" for i in range(logic.MAX_VARIABLES + 1)))
+
+
+def test_deep_formulas():
+    formula = logic.parse("¬" * 3000 + "P")
+    assert formula.count_models() == 1
+    assert logic.to_text(formula.root) == "¬" * 3000 + "P"
+
+
+def test_csv():
+    assert truth_table_csv("P → Q").decode("utf-8") == "P,Q,P → Q\nT,T,T\nT,F,F\nF,T,T\nF,F,T\n"
+    big = logic.parse(" ∨ ".join(f"x{i}" for i in range(12)))
+    lines = truth_table_csv(big.text).decode("utf-8").splitlines()
+    assert len(lines) == big.row_count + 1
+    expected = np.where(big.rows(100, 101)[0], "T", "F")
+    assert lines[101].split(",") == expected.tolist()
@@ -0,0 +1,95 @@
+import itertools
+import random
+
+import pytest
+
+import logic
+import sat
+
+ATOMS = ["P", "Q", "R", "S"]
+CONNECTIVES = ["∧", "∨", "→", "↔"]
+
+
+def random_formula(rng, depth):
+    if depth == 0 or rng.random() < 0.25:
+        return rng.choice(["⊤", "⊥"]) if rng.random() < 0.05 else rng.choice(ATOMS)
+    if rng.random() < 0.2:
+        return f"¬{random_formula(rng, depth - 1)}"
+    return f"({random_formula(rng, depth - 1)} {rng.choice(CONNECTIVES)} {random_formula(rng, depth - 1)})"
+
+
+def evaluate(node, values):
+    if node.op == "var":
+        return values[node.name]
+    if node.op in ("true", "false"):
+        return node.op == "true"
+    args = [evaluate(child, values) for child in node.args]
+    if node.op == "not":
+        return not args[0]
+    a, b = args
+    return {"and": a and b, "or": a or b, "implies": not a or b, "iff": a == b}[node.op]
+
+
+def brute_force(premises, conclusion):
+    """(valid, consistent) by trying every assignment"""
+    trees = [logic.parse_tree(p) for p in premises]
+    goal = logic.parse_tree(conclusion)
+    valid, consistent = True, False
+    for bits in itertools.product([True, False], repeat=len(ATOMS)):
+        values = dict(zip(ATOMS, bits))
+        if all(evaluate(tree, values) for tree in trees):
+            consistent = True
+            if not evaluate(goal, values):
+                valid = False
+    return valid, consistent
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    premises = [random_formula(rng, 3) for _ in range(rng.randint(0, 3))]
+    conclusion = random_formula(rng, 3)
+    verdict = sat.check_argument(premises, conclusion)
+    assert (verdict.valid, verdict.consistent) == brute_force(premises, conclusion)
+    if not verdict.valid:
+        values = dict.fromkeys(ATOMS, False)
+        values.update(verdict.counter_model)
+        assert all(evaluate(logic.parse_tree(p), values) for p in premises)
+        assert not evaluate(logic.parse_tree(conclusion), values)
+
+
+def test_classic_forms():
+    assert sat.check_argument(["P → Q", "P"], "Q").valid
+    assert sat.check_argument(["P → Q", "¬Q"], "¬P").valid
+    affirming = sat.check_argument(["P → Q", "Q"], "P")
+    assert not affirming.valid
+    assert affirming.counter_model == {"P": False, "Q": True}
+    assert not sat.check_argument(["P", "¬P"], "Q").consistent
+
+
+def test_split_argument():
+    assert sat.split_argument("1. P → Q\n2. P\n∴ Q") == (["P → Q", "P"], "Q")
+    assert sat.split_argument("P ∨ Q\n¬P\nQ") == (["P ∨ Q", "¬P"], "Q")
+    with pytest.raises(logic.LogicSyntaxError):
+        sat.split_argument("  \n")
+
+
+def test_hundreds_of_atoms():
+    atoms = [f"p{i}" for i in range(500)]
+    chain = " ∧ ".join(atoms)
+    assert logic.to_text(logic.parse_tree(chain)) == chain
+    assert sat.check_argument([chain], "p499").valid
+    assert sat.check_argument([chain], chain).valid
+    assert not sat.check_argument([" ∨ ".join(atoms)], "p0").valid
+    implications = [f"{a} → {b}" for a, b in zip(atoms, atoms[1:])]
+    assert sat.check_argument(implications + ["p0"], "p499").valid
+
+
+def test_deep_negation():
+    assert sat.check_argument(["¬" * 2000 + "P"], "P").valid
+    assert sat.check_argument(["¬" * 2001 + "P"], "¬P").valid
+
+
+def test_deep_nesting_is_a_syntax_error():
+    with pytest.raises(logic.LogicSyntaxError):
+        sat.check_argument(["(" * 5000 + "P" + ")" * 5000], "P")